@@ -0,0 +1,73 @@
+"""
+Startup-time benchmark for the CLI.
+
+Measures, in fresh interpreters, the cumulative import time of `ytfetcher._cli` (from
+`python -X importtime`) and the wall time of `ytfetcher --help`, and checks that neither
+loads the fetch dependencies (yt-dlp, youtube_transcript_api, requests, rich, tqdm, tenacity,
+fake_useragent). The script exits with status 1 when the median import time exceeds
+`--budget-ms` or a fetch dependency is loaded, so it can guard CI.
+
+Usage:
+    python benchmarks/bench_import.py --runs 10 --budget-ms 300
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("yt_dlp", "youtube_transcript_api", "requests", "rich", "tqdm", "tenacity", "fake_useragent")
+
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of `module` in a fresh interpreter, in milliseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True
+    )
+    for line in reversed(result.stderr.splitlines()):
+        fields = [field.strip() for field in line.removeprefix("import time:").split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"No import time reported for {module}.")
+
+def wall_time_ms(args: list[str]) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+def loaded_heavy_modules(code: str) -> list[str]:
+    script = f"{code}\nimport sys\nprint(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    loaded = {name.split(".")[0] for name in output.split()}
+    return [module for module in HEAVY_MODULES if module in loaded]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=300.0, help="Maximum median import time of ytfetcher._cli.")
+    args = parser.parse_args()
+
+    imports = [import_time_ms("ytfetcher._cli") for _ in range(args.runs)]
+    baseline = [wall_time_ms(["-c", "pass"]) for _ in range(args.runs)]
+    helps = [wall_time_ms(["-m", "ytfetcher._cli", "--help"]) for _ in range(args.runs)]
+
+    median_import = statistics.median(imports)
+    print(f"import ytfetcher._cli     median {median_import:7.1f} ms   min {min(imports):7.1f} ms   budget {args.budget_ms:.0f} ms")
+    print(f"python -c pass            median {statistics.median(baseline):7.1f} ms")
+    print(f"ytfetcher --help          median {statistics.median(helps):7.1f} ms")
+
+    failed = median_import > args.budget_ms
+    for code in ("import ytfetcher._cli", "from ytfetcher._cli import create_parser; create_parser()"):
+        heavy = loaded_heavy_modules(code)
+        if heavy:
+            print(f"FAIL: `{code}` imports {', '.join(heavy)}")
+            failed = True
+
+    if median_import > args.budget_ms:
+        print(f"FAIL: import time {median_import:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Compares the memory footprint of `list[Transcript]` against `CompactTranscript`.
+
+Usage:
+    python benchmarks/bench_memory.py --segments 100000
+"""
+import argparse
+import gc
+import tracemalloc
+
+from ytfetcher.models.channel import Transcript
+from ytfetcher.models.compact import CompactTranscript
+
+def build_raw(segments: int) -> list[dict]:
+    return [
+        {"text": f"segment {i} of a fairly typical caption line", "start": i * 1.25, "duration": 1.25 + i % 3}
+        for i in range(segments)
+    ]
+
+def measure(factory) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    obj = factory()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=100_000)
+    args = parser.parse_args()
+
+    raw = build_raw(args.segments)
+    text_bytes = sum(len(r["text"]) for r in raw)
+
+    _, models = measure(lambda: [Transcript.model_validate(r) for r in raw])
+    _, compact = measure(lambda: CompactTranscript.from_raw(raw))
+
+    print(f"{args.segments} segments ({text_bytes / args.segments:.0f} text chars each)")
+    for name, size in (("list[Transcript]", models), ("CompactTranscript", compact)):
+        overhead = (size - text_bytes) / args.segments
+        print(f"  {name:<18} {size / 2**20:8.2f} MiB  {size / args.segments:7.1f} B/segment  {overhead:7.1f} B/segment excluding text")
+
+if __name__ == "__main__":
+    main()
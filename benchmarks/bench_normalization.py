@@ -0,0 +1,69 @@
+"""
+Benchmarks transcript text normalization on long transcripts.
+
+Compares the legacy per-segment cleaning (two uncompiled `re.sub` calls and a
+split/join per segment) against the batched `TranscriptNormalizer` pass.
+
+Usage:
+    python benchmarks/bench_normalization.py --segments 10000 --repeat 20
+"""
+import argparse
+import gc
+import random
+import re
+import time
+
+from ytfetcher.normalizers import TranscriptNormalizer
+
+WORDS = ["the", "video", "python", "and", "we", "will", "see", "transcript", "data", "channel"]
+NOISE = ["[Music]", "[Applause]", ">>", "", "", ""]
+
+def build_texts(segments: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(segments):
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+        texts.append(f"{rng.choice(NOISE)} {words}  {rng.choice(NOISE)}")
+    return texts
+
+def legacy_clean(texts: list[str]) -> list[str]:
+    cleaned = []
+    for text in texts:
+        text = re.sub(r'\[.*?\]', '', text)
+        text = re.sub(r'^\s*>>\s*', '', text)
+        cleaned.append(' '.join(text.split()))
+    return cleaned
+
+def timed(fn, texts: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn(texts)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = build_texts(args.segments)
+    default = TranscriptNormalizer.default()
+    noop = TranscriptNormalizer.noop()
+
+    assert legacy_clean(texts) == default.normalize(texts)
+
+    results = {
+        "legacy per-segment": timed(legacy_clean, texts, args.repeat),
+        "batched default": timed(default.normalize, texts, args.repeat),
+        "noop": timed(noop.normalize, texts, args.repeat),
+    }
+
+    print(f"{args.segments} segments, best of {args.repeat}")
+    for name, seconds in results.items():
+        print(f"  {name:<20} {seconds * 1000:8.2f} ms  {args.segments / seconds:12,.0f} segments/sec")
+
+if __name__ == "__main__":
+    main()
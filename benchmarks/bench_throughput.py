@@ -0,0 +1,246 @@
+"""
+End-to-end throughput benchmark against a local YouTube stub (see `stub_youtube.py`).
+
+Drives `TranscriptFetcher`, `VideoListFetcher`, `CommentFetcher`, `SQLiteCache` and each
+exporter, and reports videos/sec, p50/p99 per-video latency and peak RSS. No request leaves
+the machine.
+
+Save a run with `--save baseline.json` and compare later runs with `--baseline baseline.json`;
+the script exits with status 1 when a scenario's videos/sec drops by more than `--tolerance`.
+
+Usage:
+    python benchmarks/bench_throughput.py --videos 200 --latency 0.05
+    python benchmarks/bench_throughput.py --scenario transcripts --error-rate 0.05 --block-rate 0.01
+"""
+import argparse
+import json
+import logging
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from stub_youtube import StubConfig, StubYouTube, patch_yt_dlp, stub_session  # noqa: E402
+
+from ytfetcher._transcript_fetcher import TranscriptFetcher  # noqa: E402
+from ytfetcher._youtube_dl import CommentFetcher, VideoListFetcher  # noqa: E402
+from ytfetcher.cache import SQLiteCache  # noqa: E402
+from ytfetcher.models.channel import ChannelData, DLSnippet, VideoTranscript  # noqa: E402
+from ytfetcher.services.exports import CSVExporter, JSONExporter, TXTExporter  # noqa: E402
+
+SCENARIOS = ("transcripts", "video_list", "comments", "cache", "export")
+
+class Recorder:
+    """Collects per-item latencies from worker threads."""
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self._lock = threading.Lock()
+
+    def wrap(self, fn: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.latencies.append(elapsed)
+        return timed
+
+    @contextmanager
+    def patch(self, owner: type, name: str) -> Iterator[None]:
+        with mock.patch.object(owner, name, self.wrap(getattr(owner, name))):
+            yield
+
+def peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / 1024 if sys.platform != "darwin" else peak / 2**20
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(q) - 1]
+
+def report(name: str, items: int, seconds: float, recorder: Recorder, extra: str = "") -> dict:
+    result = {
+        "scenario": name,
+        "items": items,
+        "seconds": seconds,
+        "videos_per_sec": items / seconds if seconds else 0.0,
+        "p50_ms": percentile(recorder.latencies, 50) * 1000,
+        "p99_ms": percentile(recorder.latencies, 99) * 1000,
+        "peak_rss_mib": peak_rss_mib(),
+    }
+    print(
+        f"  {name:<12} {result['videos_per_sec']:9.1f} videos/sec  p50 {result['p50_ms']:8.1f} ms  "
+        f"p99 {result['p99_ms']:8.1f} ms  peak RSS {result['peak_rss_mib']:7.1f} MiB  {extra}"
+    )
+    return result
+
+def video_ids(count: int, prefix: str) -> list[str]:
+    return [f"{prefix}{i:06d}" for i in range(count)]
+
+def bench_transcripts(stub: StubYouTube, args: argparse.Namespace) -> dict:
+    ids = video_ids(args.videos, "tr")
+    recorder = Recorder()
+    session = stub_session(stub, pool_size=args.workers)
+
+    with recorder.patch(TranscriptFetcher, "_fetch_transcript"):
+        start = time.perf_counter()
+        result = TranscriptFetcher(ids, max_concurrent_requests=args.workers, session=session).fetch()
+        seconds = time.perf_counter() - start
+
+    session.close()
+    reasons: dict[str, int] = {}
+    for failure in result.failed:
+        reasons[failure.reason] = reasons.get(failure.reason, 0) + 1
+    return report("transcripts", len(ids), seconds, recorder, f"ok={len(result.success)} failed={reasons or 0}")
+
+def bench_video_list(stub: StubYouTube, args: argparse.Namespace) -> dict:
+    ids = video_ids(args.videos, "vl")
+    recorder = Recorder()
+
+    with patch_yt_dlp(stub, pool_size=args.workers), recorder.patch(VideoListFetcher, "_fetch_single"):
+        start = time.perf_counter()
+        snippets = VideoListFetcher(ids).fetch()
+        seconds = time.perf_counter() - start
+
+    return report("video_list", len(ids), seconds, recorder, f"ok={len(snippets)}")
+
+def bench_comments(stub: StubYouTube, args: argparse.Namespace) -> dict:
+    ids = video_ids(args.videos, "cm")
+    recorder = Recorder()
+
+    with patch_yt_dlp(stub, pool_size=args.workers), recorder.patch(CommentFetcher, "_fetch_single"):
+        start = time.perf_counter()
+        comments = CommentFetcher(ids, max_comments=args.comments).fetch()
+        seconds = time.perf_counter() - start
+
+    return report("comments", len(ids), seconds, recorder, f"comments={sum(len(c.comments) for c in comments)}")
+
+def build_transcripts(args: argparse.Namespace, prefix: str) -> list[VideoTranscript]:
+    raw = [{"text": f"segment {i} with some words", "start": i * 2.5, "duration": 2.5} for i in range(args.segments)]
+    return [
+        VideoTranscript.model_construct(video_id=vid, transcripts=TranscriptFetcher._convert_to_transcript_object(raw))
+        for vid in video_ids(args.videos, prefix)
+    ]
+
+def bench_cache(args: argparse.Namespace, workdir: Path) -> dict:
+    transcripts = build_transcripts(args, "ca")
+    ids = [t.video_id for t in transcripts]
+    cache = SQLiteCache(str(workdir / "cache"))
+    recorder = Recorder()
+    batch = 50
+
+    start = time.perf_counter()
+    for i in range(0, len(transcripts), batch):
+        recorder.wrap(cache.upsert_transcripts)(transcripts[i:i + batch], cache_key="bench")
+    for i in range(0, len(ids), batch):
+        recorder.wrap(cache.get_cached_states)(ids[i:i + batch], "bench")
+    seconds = time.perf_counter() - start
+
+    # Latencies are per batch; scale to per video for comparability.
+    recorder.latencies = [latency / batch for latency in recorder.latencies]
+    return report("cache", len(ids), seconds, recorder, "write + read, batches of 50")
+
+def bench_export(args: argparse.Namespace, workdir: Path) -> dict:
+    data = [
+        ChannelData.model_construct(
+            video_id=t.video_id,
+            transcripts=t.transcripts,
+            metadata=DLSnippet(id=t.video_id, title=f"Video {t.video_id}", description="description"),
+            comments=[]
+        )
+        for t in build_transcripts(args, "ex")
+    ]
+    recorder = Recorder()
+
+    start = time.perf_counter()
+    for exporter in (JSONExporter, CSVExporter, TXTExporter):
+        recorder.wrap(exporter(data, output_dir=str(workdir / "exports"), filename=exporter.__name__, timing=False).write)()
+    seconds = time.perf_counter() - start
+
+    recorder.latencies = [latency / len(data) for latency in recorder.latencies]
+    return report("export", len(data) * 3, seconds, recorder, "JSON + CSV + TXT")
+
+def compare(results: list[dict], baseline_path: str, tolerance: float) -> bool:
+    baseline = {entry["scenario"]: entry for entry in json.loads(Path(baseline_path).read_text())}
+    ok = True
+    for result in results:
+        reference = baseline.get(result["scenario"])
+        if reference is None or not reference["videos_per_sec"]:
+            continue
+        change = result["videos_per_sec"] / reference["videos_per_sec"] - 1
+        status = "REGRESSION" if change < -tolerance else "ok"
+        ok &= status == "ok"
+        print(f"  {result['scenario']:<12} {change:+7.1%} vs baseline  {status}")
+    return ok
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=SCENARIOS, action="append", help="Scenario to run. Repeat to run several. Defaults to all.")
+    parser.add_argument("--videos", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds added to every stub response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay per response, in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with HTTP 500.")
+    parser.add_argument("--block-rate", type=float, default=0.0, help="Share of watch page requests answered with HTTP 429.")
+    parser.add_argument("--segments", type=int, default=300, help="Transcript segments per video.")
+    parser.add_argument("--comments", type=int, default=20, help="Comments per video.")
+    parser.add_argument("--save", help="Write results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against results saved with --save.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed videos/sec drop before failing. Defaults to 0.2 (20%%).")
+    args = parser.parse_args()
+
+    # Injected failures are expected; keep per-video error logs out of the report.
+    logging.disable(logging.CRITICAL)
+    scenarios = args.scenario or list(SCENARIOS)
+    config = StubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        block_rate=args.block_rate,
+        segments=args.segments,
+        comments=args.comments,
+    )
+
+    print(
+        f"{args.videos} videos, {args.workers} workers, latency {args.latency * 1000:.0f} ms "
+        f"(+{args.jitter * 1000:.0f} ms jitter), error rate {args.error_rate:.0%}, block rate {args.block_rate:.0%}"
+    )
+
+    results = []
+    with StubYouTube(config) as stub, tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for scenario in scenarios:
+            match scenario:
+                case "transcripts":
+                    results.append(bench_transcripts(stub, args))
+                case "video_list":
+                    results.append(bench_video_list(stub, args))
+                case "comments":
+                    results.append(bench_comments(stub, args))
+                case "cache":
+                    results.append(bench_cache(args, workdir))
+                case "export":
+                    results.append(bench_export(args, workdir))
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2))
+
+    if args.baseline and not compare(results, args.baseline, args.tolerance):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
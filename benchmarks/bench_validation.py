@@ -0,0 +1,57 @@
+"""
+Micro-benchmark for building transcript models on the hot paths.
+
+Measures segments/sec for converting raw `youtube_transcript_api` data
+(per-segment `model_validate` vs. the batched path used by `TranscriptFetcher`)
+and for decoding cached payloads.
+
+Usage:
+    python benchmarks/bench_validation.py --segments 10000 --repeat 10
+"""
+import argparse
+import gc
+import time
+
+from ytfetcher.models.channel import Transcript, VideoTranscript
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+
+def build_raw(segments: int) -> list[dict]:
+    return [
+        {"text": f"segment number {i} of the transcript", "start": i * 1.25, "duration": 1.25}
+        for i in range(segments)
+    ]
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    raw = build_raw(args.segments)
+    payload = VideoTranscript(video_id="bench", transcripts=build_raw(args.segments)).model_dump_json()
+
+    cases = {
+        "per-segment model_validate": lambda: [Transcript.model_validate(r) for r in raw],
+        "per-segment model_construct": lambda: [Transcript.model_construct(**r) for r in raw],
+        "batched (default)": lambda: TranscriptFetcher._convert_to_transcript_object(raw),
+        "batched (strict)": lambda: TranscriptFetcher._convert_to_transcript_object(raw, strict=True),
+        "cache payload (default)": lambda: VideoTranscript.model_validate_json(payload),
+        "cache payload (strict)": lambda: VideoTranscript.model_validate_json(payload, strict=True),
+    }
+
+    print(f"{args.segments} segments, best of {args.repeat}")
+    for name, fn in cases.items():
+        seconds = best_of(fn, args.repeat)
+        print(f"  {name:<30} {seconds * 1000:8.2f} ms  {args.segments / seconds:12,.0f} segments/sec")
+
+if __name__ == "__main__":
+    main()
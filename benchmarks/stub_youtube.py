@@ -0,0 +1,225 @@
+"""
+Local stand-in for the YouTube endpoints ytfetcher talks to, for offline benchmarks.
+
+Serves what `youtube_transcript_api` requests (watch page with the innertube key, the
+innertube `player` call and the timedtext XML), plus a JSON metadata/comments endpoint used
+in place of yt-dlp's extractor. Latency, errors and IP blocks can be injected.
+
+`youtube_transcript_api` requests fixed `https://www.youtube.com` URLs, so `stub_session()`
+returns a session whose adapter rewrites those requests to the stub. yt-dlp's YouTube
+extractor needs the real player JavaScript and page structure, which is out of scope, so
+`patch_yt_dlp()` replaces `YoutubeDL.extract_info` with a call to the stub's `/stub/info`
+endpoint. Network latency, errors and JSON decoding are still exercised; yt-dlp's own page
+parsing is not.
+
+Video ids select the response shape:
+    disabled-*     no caption tracks (TranscriptsDisabled)
+    unavailable-*  playability error (VideoUnavailable)
+    anything else  one auto-generated English track
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+from xml.sax.saxutils import escape
+import json
+import random
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from yt_dlp import YoutubeDL
+from yt_dlp.utils import DownloadError
+
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+from ytfetcher.config.http_config import HTTPConfig
+
+API_KEY = "stub-innertube-key"
+
+@dataclass
+class StubConfig:
+    latency: float = 0.05
+    """Seconds added to every response."""
+
+    jitter: float = 0.0
+    """Extra uniformly distributed delay, in seconds."""
+
+    error_rate: float = 0.0
+    """Share of innertube and info requests answered with HTTP 500."""
+
+    block_rate: float = 0.0
+    """Share of watch page requests answered with HTTP 429 (reported as IpBlocked)."""
+
+    segments: int = 300
+    """Transcript segments per video."""
+
+    comments: int = 20
+    """Comments returned per video."""
+
+    seed: int = 0
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "StubYouTube"
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        self._handle(json.loads(self.rfile.read(length) or b"{}"))
+
+    def _handle(self, body: dict | None = None) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        config = self.server.config
+
+        delay = config.latency + self.server.random() * config.jitter
+        if delay:
+            time.sleep(delay)
+
+        match url.path:
+            case "/watch":
+                if self.server.random() < config.block_rate:
+                    return self._send(429, "text/html", "<html>Too Many Requests</html>")
+                self._send(200, "text/html", f'<html><script>var cfg = {{"INNERTUBE_API_KEY": "{API_KEY}"}};</script></html>')
+            case "/youtubei/v1/player":
+                if self.server.random() < config.error_rate:
+                    return self._send(500, "text/plain", "Internal Server Error")
+                self._send_json(self._player(body.get("videoId", "") if body else ""))
+            case "/api/timedtext":
+                self._send(200, "text/xml", self._timedtext(params.get("v", "")))
+            case "/stub/info":
+                if self.server.random() < config.error_rate:
+                    return self._send(500, "text/plain", "Internal Server Error")
+                self._send_json(self._info(params.get("v", "")))
+            case _:
+                self._send(404, "text/plain", "Not Found")
+
+    def _player(self, video_id: str) -> dict[str, Any]:
+        if video_id.startswith("unavailable-"):
+            return {"playabilityStatus": {"status": "ERROR", "reason": "This video is unavailable"}}
+        if video_id.startswith("disabled-"):
+            return {"playabilityStatus": {"status": "OK"}}
+
+        return {
+            "playabilityStatus": {"status": "OK"},
+            "captions": {
+                "playerCaptionsTracklistRenderer": {
+                    "captionTracks": [{
+                        "baseUrl": f"https://www.youtube.com/api/timedtext?v={video_id}&lang=en",
+                        "name": {"runs": [{"text": "English (auto-generated)"}]},
+                        "languageCode": "en",
+                        "kind": "asr",
+                        "isTranslatable": False,
+                    }],
+                    "translationLanguages": [],
+                }
+            },
+        }
+
+    def _timedtext(self, video_id: str) -> str:
+        lines = (
+            f'<text start="{i * 2.5:.2f}" dur="2.5">{escape(f"[Music] segment {i} of {video_id} with some words")}</text>'
+            for i in range(self.server.config.segments)
+        )
+        return '<?xml version="1.0" encoding="utf-8" ?><transcript>' + "".join(lines) + "</transcript>"
+
+    def _info(self, video_id: str) -> dict[str, Any]:
+        return {
+            "id": video_id,
+            "title": f"Stub video {video_id}",
+            "description": "A video served by the benchmark stub. " * 10,
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+            "duration": 600,
+            "view_count": 12345,
+            "upload_date": "20260101",
+            "comments": [
+                {"id": f"{video_id}-c{i}", "text": f"Comment {i}", "like_count": i, "author": f"user{i}", "_time_text": "1 day ago"}
+                for i in range(self.server.config.comments)
+            ],
+        }
+
+    def _send_json(self, data: dict[str, Any]) -> None:
+        self._send(200, "application/json", json.dumps(data))
+
+    def _send(self, status: int, content_type: str, text: str) -> None:
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+class StubYouTube(ThreadingHTTPServer):
+    """
+    Threaded stub server. Use as a context manager to serve on an ephemeral localhost port.
+    """
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, config: StubConfig | None = None):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.config = config or StubConfig()
+        self._random = random.Random(self.config.seed)
+        self._random_lock = threading.Lock()
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-youtube", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def random(self) -> float:
+        with self._random_lock:
+            return self._random.random()
+
+    def __enter__(self) -> "StubYouTube":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+class _RedirectAdapter(HTTPAdapter):
+    """Sends requests for any host to the stub server instead."""
+    def __init__(self, base_url: str, pool_size: int):
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._target = urlsplit(base_url)
+
+    def send(self, request, *args, **kwargs):  # type: ignore[override]
+        url = urlsplit(request.url)
+        request.url = urlunsplit((self._target.scheme, self._target.netloc, url.path, url.query, url.fragment))
+        return super().send(request, *args, **kwargs)
+
+def stub_session(stub: StubYouTube, pool_size: int = 20) -> requests.Session:
+    """Returns a ytfetcher transcript session whose YouTube requests go to `stub`."""
+    session = TranscriptFetcher.create_session(HTTPConfig(), pool_size=pool_size)
+    session.mount("https://", _RedirectAdapter(stub.base_url, pool_size))
+    return session
+
+@contextmanager
+def patch_yt_dlp(stub: StubYouTube, pool_size: int = 20) -> Iterator[None]:
+    """Routes `YoutubeDL.extract_info` for single videos to the stub's `/stub/info` endpoint."""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+
+    def extract_info(self, url: str, download: bool = True, **kwargs) -> dict[str, Any]:
+        video_id = parse_qs(urlsplit(url).query)["v"][0]
+        response = session.get(f"{stub.base_url}/stub/info", params={"v": video_id}, timeout=30)
+        if response.status_code != 200:
+            raise DownloadError(f"Stub returned HTTP {response.status_code} for {video_id}")
+        return response.json()
+
+    with mock.patch.object(YoutubeDL, "extract_info", extract_info):
+        try:
+            yield
+        finally:
+            session.close()
@@ -123,3 +123,38 @@ def test_cache_clean_argument():
 
     assert args.command == "cache"
     assert args.clean is True
+
+def test_cache_maintenance_subcommands():
+    parser = create_parser()
+
+    purge = parser.parse_args(["cache", "purge", "--cache-ttl", "3"])
+    vacuum = parser.parse_args(["cache", "--cache-path", "/tmp/c", "vacuum"])
+
+    assert (purge.cache_command, purge.cache_ttl, purge.clean) == ("purge", 3, False)
+    assert (vacuum.cache_command, vacuum.cache_path) == ("vacuum", "/tmp/c")
+
+def test_cache_stats_export_import_subcommands():
+    parser = create_parser()
+
+    assert parser.parse_args(["cache", "stats", "--json"]).json is True
+    assert parser.parse_args(["cache", "purge", "--older-than", "30"]).cache_ttl == 30
+    assert parser.parse_args(["cache", "export", "out.jsonl.gz"]).archive == "out.jsonl.gz"
+    assert parser.parse_args(["cache", "import", "in.jsonl", "--cache-backend", "filesystem"]).cache_backend == "filesystem"
+
+def test_http_session_arguments():
+    from ytfetcher._cli import ConfigBuilder
+
+    parser = create_parser()
+    args = parser.parse_args([
+        "channel",
+        "TestChannel",
+        "--sessions", "4",
+        "--pool-maxsize", "8",
+        "--connect-timeout", "3",
+        "--read-timeout", "15"
+    ])
+
+    config = ConfigBuilder.build_http_config(args)
+
+    assert (config.sessions, config.pool_maxsize) == (4, 8)
+    assert config.timeout == (3.0, 15.0)
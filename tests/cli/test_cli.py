@@ -459,4 +459,102 @@ def test_export_method_from_playlist_id(mock_ytfetcher, mock_exporter_class, moc
         timing=True
     )
 
-    mock_exporter_instance.write.assert_called_once()
\ No newline at end of file
+    mock_exporter_instance.write.assert_called_once()
+
+def test_upload_date_is_exported_only_when_requested():
+    parser = create_parser()
+
+    assert "upload_date" not in parser.parse_args(["channel", "TheOffice"]).metadata
+    assert parser.parse_args(["channel", "TheOffice", "--metadata", "title", "upload_date"]).metadata == ["title", "upload_date"]
+
+def test_where_flag_adds_filter_expression():
+    from ytfetcher.filters import min_views, where
+
+    parser = create_parser()
+    args = parser.parse_args([
+        "channel",
+        "TheOffice",
+        "--min-views", "100",
+        "--where", 'duration < 600 and title ~ "python"',
+    ])
+
+    cli = YTFetcherCLI(args=args)
+
+    assert cli._get_active_filters() == [min_views(100), where('duration<600 and title~"python"')]
+
+@patch('ytfetcher._cli.JSONExporter')
+@patch('ytfetcher._cli.YTFetcher')
+def test_batch_exports_one_file_per_source(mock_ytfetcher, mock_exporter_class, tmp_path):
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text('{"channel": "@one", "name": "one"}\n{"search": "python"}\n', encoding="utf-8")
+
+    mock_fetcher = Mock()
+    mock_ytfetcher.from_sources.return_value = mock_fetcher
+    mock_fetcher.fetch_youtube_data.return_value = ['a', 'b']
+    mock_fetcher.group_by_source.return_value = {'one': ['a'], 'search-python': ['b']}
+    mock_fetcher.failed_sources = {}
+
+    parser = create_parser()
+    args = parser.parse_args(["batch", str(manifest), "-f", "json", "--source-concurrency", "8"])
+
+    YTFetcherCLI(args=args).run()
+
+    assert [source.name for source in mock_ytfetcher.from_sources.call_args.kwargs['sources']] == ['one', 'search-python']
+    assert mock_ytfetcher.from_sources.call_args.kwargs['max_workers'] == 8
+    assert [c.kwargs['filename'] for c in mock_exporter_class.call_args_list] == ['one', 'search-python']
+    assert [c.kwargs['channel_data'] for c in mock_exporter_class.call_args_list] == [['a'], ['b']]
+
+@patch('ytfetcher._cli.JSONExporter')
+@patch('ytfetcher._cli.YTFetcher')
+def test_stats_json_writes_run_stats_with_export_phase(mock_ytfetcher, mock_exporter_class, tmp_path):
+    from ytfetcher.stats import RunStats
+    import json
+
+    mock_fetcher = Mock()
+    mock_ytfetcher.from_video_ids.return_value = mock_fetcher
+    mock_fetcher.fetch_youtube_data.return_value = ['a']
+    mock_fetcher.last_run_stats = RunStats(videos=1)
+
+    stats_path = tmp_path / "stats.json"
+    parser = create_parser()
+    args = parser.parse_args(["video", "id1", "-f", "json", "-o", str(tmp_path), "--stats-json", str(stats_path)])
+
+    YTFetcherCLI(args=args).run()
+
+    stats = json.loads(stats_path.read_text())
+    assert stats['videos'] == 1
+    assert 'export' in stats['phases']
+
+@patch('ytfetcher._cli.YTFetcher')
+def test_metrics_file_passes_registry_and_writes_textfile(mock_ytfetcher, tmp_path):
+    mock_fetcher = Mock()
+    mock_ytfetcher.from_video_ids.return_value = mock_fetcher
+    mock_fetcher.fetch_youtube_data.return_value = []
+
+    metrics_path = tmp_path / "ytfetcher.prom"
+    parser = create_parser()
+    args = parser.parse_args(["video", "id1", "--metrics-file", str(metrics_path)])
+
+    cli = YTFetcherCLI(args=args)
+    cli.run()
+
+    options = mock_ytfetcher.from_video_ids.call_args.kwargs['options']
+    assert options.metrics is cli.metrics
+    assert metrics_path.read_text().endswith("# EOF\n")
+
+@patch('ytfetcher._cli.YTFetcher')
+def test_profile_writes_report_next_to_export(mock_ytfetcher, tmp_path):
+    mock_fetcher = Mock()
+    mock_ytfetcher.from_video_ids.return_value = mock_fetcher
+    mock_fetcher.fetch_youtube_data.return_value = []
+
+    parser = create_parser()
+    args = parser.parse_args(["video", "id1", "-o", str(tmp_path), "--filename", "run", "--profile"])
+
+    cli = YTFetcherCLI(args=args)
+    cli.run()
+
+    assert mock_ytfetcher.from_video_ids.call_args.kwargs['options'].profile is cli.profiler
+    assert 'export' in cli.profiler.phases
+    assert (tmp_path / "run.profile" / "summary.txt").exists()
+    assert (tmp_path / "run.profile" / "stacks.collapsed").exists()
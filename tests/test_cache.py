@@ -258,3 +258,136 @@ def test_ttl_purges_on_initialize(tmp_path):
         ).fetchone()[0]
 
     assert count == 0
+
+def test_ytfetcher_uses_custom_cache_backend(sample_transcripts):
+    from ytfetcher.cache import MemoryCache
+
+    class DummyFetcher(BaseYoutubeDLFetcher):
+        def fetch(self) -> list[DLSnippet]:
+            return [DLSnippet(video_id='id1', title='title1')]
+
+    backend = MemoryCache()
+    fetcher = YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=FetchOptions(cache_backend=backend))
+
+    mocked_fetch = MagicMock(return_value=TranscriptFetchResult(
+        success=[VideoTranscript(video_id='id1', transcripts=sample_transcripts)],
+        failed=[],
+    ))
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(TranscriptFetcher, "fetch", mocked_fetch)
+        fetcher.fetch_transcripts()
+        fetcher.fetch_transcripts()
+
+    assert mocked_fetch.call_count == 1
+    assert backend.stats().successes == 1
+
+def test_results_are_written_behind_as_they_complete(mocker):
+    from ytfetcher.cache import MemoryCache
+
+    class DummyFetcher(BaseYoutubeDLFetcher):
+        def fetch(self) -> list[DLSnippet]:
+            return [DLSnippet(video_id='id1', title='title1'), DLSnippet(video_id='id2', title='title2')]
+
+    backend = MemoryCache()
+    put = mocker.spy(backend, "upsert_results")
+    mocker.patch.object(
+        TranscriptFetcher,
+        "_fetch_single",
+        side_effect=lambda video_id: VideoTranscript(video_id=video_id, transcripts=[])
+    )
+
+    fetcher = YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=FetchOptions(cache_backend=backend))
+    fetcher.fetch_transcripts()
+
+    assert backend.stats().successes == 2
+    assert put.call_count >= 1
+
+def _insert_old_rows(db_file, count):
+    with sqlite3.connect(db_file) as conn:
+        conn.executemany(
+            "INSERT INTO transcript_cache (video_id, cache_key, payload, updated_at) VALUES (?, ?, ?, ?)",
+            [(f"old{i}", "k", "{}", "2000-01-01 00:00:00") for i in range(count)]
+        )
+
+def test_expired_rows_are_not_served_when_no_purge_is_due(tmp_path):
+    SQLiteCache(tmp_path, ttl=1)
+    _insert_old_rows(tmp_path / "cache.sqlite3", 1)
+
+    cache = SQLiteCache(tmp_path, ttl=1)
+
+    assert cache.stats().entries == 1
+    assert cache.get_cached_states(["old0"], "k") == ([], [])
+
+def test_purge_deletes_in_batches_using_updated_at_index(tmp_path):
+    cache = SQLiteCache(tmp_path, ttl=1)
+    _insert_old_rows(cache.db_file, 5)
+
+    with sqlite3.connect(cache.db_file) as conn:
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(transcript_cache)")}
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT rowid FROM transcript_cache WHERE updated_at <= datetime('now', '-1 days')"
+        ))
+
+    assert "idx_transcript_cache_updated_at" in indexes
+    assert "idx_transcript_cache_updated_at" in plan
+    assert cache.purge_expired(batch_size=2) == 5
+    assert cache.stats().entries == 0
+
+def test_automatic_purge_runs_at_most_once_per_interval(tmp_path):
+    cache = SQLiteCache(tmp_path, ttl=1)
+    _insert_old_rows(cache.db_file, 1)
+
+    SQLiteCache(tmp_path, ttl=1)
+    assert cache.stats().entries == 1
+
+    SQLiteCache(tmp_path, ttl=1, purge_interval=0)
+    assert cache.stats().entries == 0
+
+def test_purge_older_than_overrides_ttl(tmp_path):
+    cache = SQLiteCache(tmp_path, ttl=0)
+    _insert_old_rows(cache.db_file, 2)
+
+    assert cache.purge_expired() == 0
+    assert cache.purge_expired(older_than_days=30) == 2
+
+def test_vacuum_keeps_entries(tmp_path, sample_transcripts):
+    cache = SQLiteCache(tmp_path)
+    cache.upsert_transcripts([VideoTranscript(video_id='a', transcripts=sample_transcripts)], cache_key='k')
+
+    cache.vacuum()
+
+    assert len(cache.get_cached_states(['a'], 'k')[0]) == 1
+
+def test_cache_hit_rate_is_logged(caplog, sample_transcripts):
+    from ytfetcher.cache import MemoryCache
+
+    class DummyFetcher(BaseYoutubeDLFetcher):
+        def fetch(self) -> list[DLSnippet]:
+            return [DLSnippet(video_id='id1', title='title1'), DLSnippet(video_id='id2', title='title2')]
+
+    backend = MemoryCache()
+    backend.upsert_transcripts([VideoTranscript(video_id='id1', transcripts=sample_transcripts)], cache_key=SQLiteCache.build_transcript_cache_key(["__auto__"], False))
+    fetcher = YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=FetchOptions(cache_backend=backend))
+
+    with pytest.MonkeyPatch.context() as mp, caplog.at_level("INFO", logger="ytfetcher._core"):
+        mp.setattr(TranscriptFetcher, "fetch", MagicMock(return_value=TranscriptFetchResult(success=[], failed=[])))
+        fetcher.fetch_transcripts()
+
+    assert "Cache hit rate: 1/2 videos (50%)" in caplog.text
+
+def test_cache_key_depends_on_normalizer():
+    from ytfetcher.cache import build_transcript_cache_key
+    from ytfetcher.normalizers import NormalizationRule, TranscriptNormalizer
+
+    default_key = build_transcript_cache_key(["en"], False)
+    custom = TranscriptNormalizer(rules=[NormalizationRule(r"\d+")])
+
+    assert build_transcript_cache_key(["en"], False, normalizer=TranscriptNormalizer.default()) == default_key
+    assert build_transcript_cache_key(["en"], False, normalizer=TranscriptNormalizer.noop()) != default_key
+    assert build_transcript_cache_key(["en"], False, normalizer=custom) == build_transcript_cache_key(
+        ["en"], False, normalizer=TranscriptNormalizer(rules=[NormalizationRule(r"\d+")])
+    )
+    assert build_transcript_cache_key(["en"], False, normalizer=custom) != build_transcript_cache_key(
+        ["en"], False, normalizer=TranscriptNormalizer.noop()
+    )
@@ -0,0 +1,162 @@
+from ytfetcher.cache import CacheBackend, FileSystemCache, MemoryCache, ShardedSQLiteCache, SQLiteCache, create_cache
+from ytfetcher.config import FetchOptions
+from ytfetcher.models.channel import FailedTranscript, Transcript, VideoTranscript
+import pytest
+import time
+
+@pytest.fixture(params=["sqlite", "sharded-sqlite", "filesystem", "memory"])
+def backend(request, tmp_path) -> CacheBackend:
+    match request.param:
+        case "sqlite":
+            return SQLiteCache(str(tmp_path))
+        case "sharded-sqlite":
+            return ShardedSQLiteCache(str(tmp_path), shards=4)
+        case "filesystem":
+            return FileSystemCache(str(tmp_path))
+        case _:
+            return MemoryCache()
+
+def _transcript(video_id: str) -> VideoTranscript:
+    return VideoTranscript(video_id=video_id, transcripts=[Transcript(text=video_id, start=0, duration=1)])
+
+def test_backend_satisfies_protocol(backend):
+    assert isinstance(backend, CacheBackend)
+
+def test_backend_round_trips_transcripts_and_failures(backend):
+    backend.upsert_transcripts([_transcript("a"), _transcript("b")], cache_key="k")
+    backend.upsert_failures([FailedTranscript(video_id="c", reason="TranscriptsDisabled", message=None)], cache_key="k")
+
+    successes, failures = backend.get_cached_states(["a", "b", "c", "missing"], cache_key="k")
+
+    assert sorted(t.video_id for t in successes) == ["a", "b"]
+    assert successes[0].transcripts[0].text == successes[0].video_id
+    assert [(f.video_id, f.reason) for f in failures] == [("c", "TranscriptsDisabled")]
+    assert backend.get_cached_states(["a"], cache_key="other") == ([], [])
+
+def test_backend_upserts_results_together(backend):
+    backend.upsert_results(
+        transcripts=[_transcript("a"), _transcript("b")],
+        failures=[FailedTranscript(video_id="c", reason="TranscriptsDisabled", message=None)],
+        cache_key="k"
+    )
+
+    successes, failures = backend.get_cached_states(["a", "b", "c"], cache_key="k")
+
+    assert sorted(t.video_id for t in successes) == ["a", "b"]
+    assert [f.video_id for f in failures] == ["c"]
+
+def test_backend_upsert_replaces_existing_entry(backend):
+    backend.upsert_failures([FailedTranscript(video_id="a", reason="VideoUnavailable", message=None)], cache_key="k")
+    backend.upsert_transcripts([_transcript("a")], cache_key="k")
+
+    successes, failures = backend.get_cached_states(["a"], cache_key="k")
+
+    assert [t.video_id for t in successes] == ["a"]
+    assert failures == []
+
+def test_backend_stats_and_clear(backend):
+    backend.upsert_transcripts([_transcript("a")], cache_key="k")
+    backend.upsert_failures([FailedTranscript(video_id="b", reason="VideoUnavailable", message=None)], cache_key="k")
+
+    stats = backend.stats()
+    assert (stats.entries, stats.successes, stats.failures) == (2, 1, 1)
+    assert stats.size_bytes > 0
+
+    backend.clear()
+    assert backend.stats().entries == 0
+    assert backend.get_cached_states(["a", "b"], cache_key="k") == ([], [])
+
+@pytest.mark.parametrize("cache_cls", [FileSystemCache, MemoryCache])
+def test_expired_entries_are_ignored_and_purged(tmp_path, mocker, cache_cls):
+    cache = cache_cls(str(tmp_path), ttl=1) if cache_cls is FileSystemCache else cache_cls(ttl=1)
+    cache.upsert_transcripts([_transcript("a")], cache_key="k")
+
+    mocker.patch("time.time", return_value=time.time() + 2 * 86400)
+
+    assert cache.get_cached_states(["a"], cache_key="k") == ([], [])
+    assert cache.purge_expired() == 1
+    assert cache.stats().entries == 0
+
+def test_filesystem_cache_is_shared_between_instances(tmp_path):
+    FileSystemCache(str(tmp_path)).upsert_transcripts([_transcript("a")], cache_key="k")
+
+    successes, _ = FileSystemCache(str(tmp_path)).get_cached_states(["a"], cache_key="k")
+
+    assert [t.video_id for t in successes] == ["a"]
+    assert not list((tmp_path / "transcripts").rglob(".tmp-*"))
+
+def test_create_cache_selects_backend(tmp_path):
+    custom = MemoryCache()
+
+    assert isinstance(create_cache(FetchOptions(cache_path=str(tmp_path))), SQLiteCache)
+    assert isinstance(create_cache(FetchOptions(cache_path=str(tmp_path), cache_backend="filesystem")), FileSystemCache)
+    assert isinstance(create_cache(FetchOptions(cache_path=str(tmp_path), cache_backend="sharded-sqlite")), ShardedSQLiteCache)
+    assert create_cache(FetchOptions(cache_backend=custom)) is custom
+    assert create_cache(FetchOptions(cache_enabled=False)) is None
+
+    with pytest.raises(ValueError):
+        create_cache(FetchOptions(cache_backend="redis"))  # type: ignore[arg-type]
+
+def test_sharded_cache_spreads_entries_and_handles_concurrent_writers(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = ShardedSQLiteCache(str(tmp_path), shards=4)
+    video_ids = [f"video{i}" for i in range(200)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda vid: cache.upsert_transcripts([_transcript(vid)], cache_key="k"), video_ids))
+
+    successes, _ = cache.get_cached_states(video_ids, cache_key="k")
+
+    assert sorted(t.video_id for t in successes) == sorted(video_ids)
+    assert sorted(path.name for path in (tmp_path / "shards-4").glob("*.sqlite3")) == [f"shard-0{i}.sqlite3" for i in range(4)]
+    assert all(shard.stats().entries > 0 for shard in cache.shards)
+
+def test_backend_stats_break_down_keys_ages_and_payloads(backend):
+    backend.upsert_transcripts([_transcript("a"), _transcript("b")], cache_key="en")
+    backend.upsert_failures([FailedTranscript(video_id="c", reason="VideoUnavailable", message=None)], cache_key="de")
+
+    stats = backend.stats()
+
+    assert stats.by_cache_key == {"en": 2, "de": 1}
+    assert stats.age_histogram == {"<1d": 3}
+    assert stats.payload_bytes == 2 * len(_transcript("a").model_dump_json())
+    assert stats.avg_payload_bytes == len(_transcript("a").model_dump_json())
+
+def test_export_and_import_move_entries_between_backends(backend, tmp_path):
+    from ytfetcher.cache import export_cache, import_cache
+
+    backend.upsert_transcripts([_transcript("a")], cache_key="k")
+    backend.upsert_failures([FailedTranscript(video_id="b", reason="VideoUnavailable", message=None)], cache_key="k")
+    archive = tmp_path / "archive" / "cache.jsonl.gz"
+
+    assert export_cache(backend, str(archive)) == 2
+
+    target = FileSystemCache(str(tmp_path / "target"))
+    assert import_cache(target, str(archive)) == 2
+    assert import_cache(target, str(archive)) == 0  # Nothing newer the second time.
+
+    successes, failures = target.get_cached_states(["a", "b"], cache_key="k")
+    assert [t.video_id for t in successes] == ["a"]
+    assert [(f.video_id, f.reason) for f in failures] == [("b", "VideoUnavailable")]
+
+def test_import_keeps_newer_local_entries(backend):
+    from ytfetcher.cache import CacheEntry
+
+    backend.upsert_transcripts([_transcript("a")], cache_key="k")
+    stale = CacheEntry("a", "k", "FAILED", "VideoUnavailable", None, updated_at=946684800.0)
+
+    assert backend.import_entries([stale]) == 0
+    assert [t.video_id for t in backend.get_cached_states(["a"], cache_key="k")[0]] == ["a"]
+
+def test_import_rejects_files_that_are_not_archives(tmp_path):
+    from ytfetcher.cache import import_cache
+    from ytfetcher.exceptions import InvalidCacheArchive
+
+    not_archive = tmp_path / "notes.jsonl"
+    not_archive.write_text('{"hello": "world"}\n')
+
+    with pytest.raises(InvalidCacheArchive):
+        import_cache(MemoryCache(), str(not_archive))
+    with pytest.raises(InvalidCacheArchive):
+        import_cache(MemoryCache(), str(tmp_path / "missing.jsonl"))
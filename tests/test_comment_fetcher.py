@@ -81,3 +81,6 @@ def test_fetch_single_empty_comments(mocker, mock_comment_data):
     results = fetcher.fetch_single('')
     
     assert results == VideoComments(video_id='', comments=[])
+
+def test_comment_flight_key_includes_options():
+    assert CommentFetcher(['a'], max_comments=10)._flight_key('a') != CommentFetcher(['a'], max_comments=20)._flight_key('a')
@@ -0,0 +1,94 @@
+import json
+import pytest
+from ytfetcher.models.channel import ChannelData, DLSnippet, Transcript, VideoTranscript
+from ytfetcher.models.compact import CompactTranscript, TranscriptSegment
+from ytfetcher.cache.sqlite_cache import SQLiteCache
+from ytfetcher.services.exports import JSONExporter
+from ytfetcher.utils import channel_data_to_rows
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+
+@pytest.fixture
+def raw_segments():
+    return [
+        {"text": "Hello", "start": 0.0, "duration": 1.5},
+        {"text": "wörld", "start": 1.5, "duration": 2.0},
+        {"text": "again", "start": 3.5, "duration": 0.5},
+    ]
+
+def test_compact_transcript_exposes_lazy_segment_views(raw_segments):
+    compact = CompactTranscript.from_raw(raw_segments)
+
+    assert len(compact) == 3
+    assert isinstance(compact[1], TranscriptSegment)
+    assert compact[1].text == "wörld"
+    assert compact[-1].start == 3.5
+    assert [segment.duration for segment in compact] == [1.5, 2.0, 0.5]
+    assert compact == [Transcript(**raw) for raw in raw_segments]
+
+    with pytest.raises(IndexError):
+        compact[3]
+
+def test_compact_transcript_slices_stay_compact(raw_segments):
+    compact = CompactTranscript.from_raw(raw_segments)
+
+    head = compact[1:]
+
+    assert isinstance(head, CompactTranscript)
+    assert head.texts() == ["wörld", "again"]
+    assert compact[::-1].texts() == ["again", "wörld", "Hello"]
+    assert len(compact[5:]) == 0
+
+def test_compact_transcript_serializes_like_transcript_list(raw_segments):
+    compact = VideoTranscript(video_id="abc", transcripts=CompactTranscript.from_raw(raw_segments))
+    models = VideoTranscript(video_id="abc", transcripts=[Transcript(**raw) for raw in raw_segments])
+
+    assert isinstance(compact.transcripts, CompactTranscript)
+    assert compact.model_dump_json() == models.model_dump_json()
+    assert compact.to_dict() == models.to_dict()
+
+def test_compact_transcript_with_texts_keeps_timings(raw_segments):
+    compact = CompactTranscript.from_raw(raw_segments).with_texts(["a", "b", "c"])
+
+    assert compact.joined_text() == "a b c"
+    assert compact[2].start == 3.5
+
+    with pytest.raises(ValueError):
+        compact.with_texts(["too few"])
+
+def test_channel_data_to_rows_and_exporter_accept_compact(tmp_path, raw_segments):
+    data = [
+        ChannelData(
+            video_id="abc",
+            transcripts=CompactTranscript.from_raw(raw_segments),
+            metadata=DLSnippet(id="abc", title="Sample"),
+            comments=[],
+        )
+    ]
+
+    rows = channel_data_to_rows(data)
+    JSONExporter(channel_data=data, output_dir=str(tmp_path)).write()
+    exported = json.loads((tmp_path / "data.json").read_text(encoding="utf-8"))
+
+    assert rows[0]["text"] == "Hello wörld again"
+    assert exported[0]["transcript"] == raw_segments
+
+def test_cache_decodes_compact_transcripts(tmp_path, raw_segments):
+    cache = SQLiteCache(str(tmp_path), compact_transcripts=True)
+    cache.upsert_transcripts(
+        [VideoTranscript(video_id="abc", transcripts=[Transcript(**raw) for raw in raw_segments])],
+        cache_key="k"
+    )
+
+    successes, _ = cache.get_cached_states(["abc"], "k")
+
+    assert isinstance(successes[0].transcripts, CompactTranscript)
+    assert successes[0].transcripts.texts() == ["Hello", "wörld", "again"]
+
+def test_transcript_fetcher_builds_and_cleans_compact_transcripts():
+    fetcher = TranscriptFetcher(["abc"], compact_transcripts=True)
+
+    segments = fetcher._to_segments([{"text": "[Music] >> hi  there", "start": 0, "duration": 1}])
+    cleaned = TranscriptFetcher._clean_transcripts(segments)
+
+    assert isinstance(cleaned, CompactTranscript)
+    assert cleaned.texts() == ["hi there"]
@@ -0,0 +1,84 @@
+from ytfetcher import YTFetcher, DLSnippet, VideoTranscript
+from ytfetcher.models.channel import Transcript, FailedTranscript
+from ytfetcher.config import FetchOptions
+from ytfetcher.cache import MemoryCache, build_transcript_cache_key
+from ytfetcher.events import FetchEvents
+from ytfetcher.filters import min_views
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+from ytfetcher._youtube_dl import BaseYoutubeDLFetcher
+
+TRANSCRIPTS = [Transcript(text='text', start=0, duration=1)]
+
+class DummyFetcher(BaseYoutubeDLFetcher):
+    def fetch(self) -> list[DLSnippet]:
+        return [DLSnippet(video_id=vid, title=vid, view_count=100) for vid in ['id1', 'id2', 'id3', 'id4']]
+
+def _fake_fetch_transcript(self, video_id):
+    if video_id == 'id4':
+        return FailedTranscript(video_id=video_id, reason='TranscriptsDisabled', is_permanent_exception=True)
+    return VideoTranscript(video_id=video_id, transcripts=TRANSCRIPTS)
+
+def _recording_events(calls: list) -> FetchEvents:
+    return FetchEvents(
+        on_snippets_listed=lambda snippets: calls.append(('listed', [s.video_id for s in snippets])),
+        on_transcript_done=lambda transcript: calls.append(('done', transcript.video_id)),
+        on_failure=lambda failure: calls.append(('failure', failure.video_id)),
+        on_ip_blocked=lambda failure: calls.append(('ip_blocked', failure.video_id)),
+        on_cache_hit=lambda result: calls.append(('cache_hit', result.video_id)),
+        on_phase_end=lambda name, seconds: calls.append(('phase', name)),
+    )
+
+def test_events_follow_a_cached_run(mocker):
+    mocker.patch.object(TranscriptFetcher, '_fetch_transcript', _fake_fetch_transcript)
+    cache = MemoryCache()
+    cache_key = build_transcript_cache_key(languages=['__auto__'], manually_created=False)
+    cache.upsert_transcripts([VideoTranscript(video_id='id1', transcripts=TRANSCRIPTS)], cache_key)
+
+    calls: list = []
+    options = FetchOptions(cache_backend=cache, events=_recording_events(calls))
+    YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=options).fetch_youtube_data()
+
+    assert calls[:4] == [
+        ('phase', 'listing'),
+        ('listed', ['id1', 'id2', 'id3', 'id4']),
+        ('phase', 'cache_lookup'),
+        ('cache_hit', 'id1'),
+    ]
+    assert sorted(calls[4:-1]) == [('done', 'id2'), ('done', 'id3'), ('failure', 'id4')]
+    assert calls[-1] == ('phase', 'fetch')
+
+def test_snippets_listed_after_filters_and_only_once(mocker):
+    mocker.patch.object(TranscriptFetcher, '_fetch_transcript', _fake_fetch_transcript)
+    calls: list = []
+    options = FetchOptions(cache_enabled=False, filters=[min_views(1000)], events=_recording_events(calls))
+    fetcher = YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=options)
+
+    fetcher.fetch_snippets()
+    fetcher.fetch_transcripts()
+
+    assert [call for call in calls if call[0] == 'listed'] == [('listed', [])]
+
+def test_ip_blocked_is_emitted_once(mocker):
+    def blocked(self, video_id):
+        return FailedTranscript(video_id=video_id, reason='IpBlocked', message='Cancelled due to IP block')
+
+    mocker.patch.object(TranscriptFetcher, '_fetch_transcript', blocked)
+    calls: list = []
+    options = FetchOptions(cache_enabled=False, events=_recording_events(calls), max_concurrent_requests=1)
+
+    YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=options).fetch_transcripts()
+
+    assert [call[0] for call in calls].count('ip_blocked') == 1
+    assert [call[0] for call in calls].count('failure') == 4
+
+def test_failing_callback_does_not_stop_the_run(mocker, caplog):
+    mocker.patch.object(TranscriptFetcher, '_fetch_transcript', _fake_fetch_transcript)
+
+    def broken(transcript):
+        raise RuntimeError('boom')
+
+    options = FetchOptions(cache_enabled=False, events=FetchEvents(on_transcript_done=broken))
+    transcripts = YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=options).fetch_transcripts()
+
+    assert sorted(t.video_id for t in transcripts) == ['id1', 'id2', 'id3']
+    assert 'on_transcript_done callback failed' in caplog.text
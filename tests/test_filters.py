@@ -17,7 +17,7 @@ def sample_snippets():
         view_count=20
         ),
         DLSnippet(
-        video_id='id1',
+        video_id='id2',
         title="Namechannel1",
         description="description1",
         url='https://youtube.com/videoid',
@@ -38,7 +38,7 @@ def sample_missing_snippets():
         view_count=None
         ),
         DLSnippet(
-        video_id='id1',
+        video_id='id2',
         title="channelname1",
         description="description1",
         url='https://youtube.com/videoid',
@@ -131,4 +131,114 @@ def test_filter_snippets_with_boundary_values(mock_channel_fetcher_class, sample
     channel_data = fetcher.fetch_snippets()
 
     assert len(channel_data) == 2
-    assert len(fetcher.options.filters) == 2
\ No newline at end of file
+    assert len(fetcher.options.filters) == 2
+
+def test_filters_are_pushed_down_to_youtube_dl_fetcher(mock_channel_fetcher_class):
+    filters = [min_views(1000)]
+
+    YTFetcher.from_channel(channel_handle='channel', options=FetchOptions(filters=filters))
+
+    mock_channel_fetcher_class.push_down_filters.assert_called_once_with(filters)
+
+def test_where_expression_matches_builtin_helpers(sample_snippets):
+    from ytfetcher.filters import where
+
+    expression = where('views>=1000 and duration<1000 and title~"NAME"')
+
+    assert [expression(s) for s in sample_snippets] == [False, True]
+    assert min_views(1000) & filter_by_title("name") == where('views >= 1000 and title ~ "name"')
+
+def test_where_expression_missing_fields_never_match(sample_missing_snippets):
+    from ytfetcher.filters import where
+
+    assert not any(where("duration < 5000 or views != 0")(s) for s in sample_missing_snippets[:1])
+    assert where("not duration > 5000")(sample_missing_snippets[1])
+    assert not any(where("not (views >= 10)")(s) for s in sample_missing_snippets)
+    assert not where("not (duration > 5000 or views > 1)")(sample_missing_snippets[1])
+
+def test_where_expression_is_picklable_and_hashable(sample_snippets):
+    import pickle
+    from ytfetcher.filters import where
+
+    expression = where('(views > 10 or title !~ "x") and not duration == 900')
+    restored = pickle.loads(pickle.dumps(expression))
+
+    assert restored == expression
+    assert hash(restored) == hash(expression)
+    assert [restored(s) for s in sample_snippets] == [expression(s) for s in sample_snippets]
+
+def test_composed_expression_round_trips_through_pickle(sample_snippets):
+    import pickle
+    from ytfetcher.filters import max_views, where
+
+    expression = (min_views(1) | max_views(5)) | filter_by_title('x')
+    restored = pickle.loads(pickle.dumps(expression))
+
+    assert restored == expression
+    assert hash(restored) == hash(expression)
+    assert where('views > 1 or (duration > 2 or title ~ "x")') == where('views > 1 or duration > 2 or title ~ "x"')
+    assert where('(views > 1 and duration > 2) and title ~ "x"') == where('views > 1 and duration > 2 and title ~ "x"')
+
+def test_where_expression_round_trips_exponent_literals():
+    import pickle
+    from ytfetcher.filters import where
+
+    expression = where("views < 1e20 and duration > 2.5E-1")
+
+    assert str(expression) == "view_count < 1e+20 and duration > 0.25"
+    assert pickle.loads(pickle.dumps(expression)) == expression
+
+@pytest.mark.parametrize("source", [
+    "views >= 'many'",
+    "title > 10",
+    "duration ~ 'a'",
+    "unknown == 1",
+    "views >=",
+    "(views > 1",
+    "views > 1 views < 2",
+    "__class__ == 1",
+    "views > 1e999",
+])
+def test_where_rejects_invalid_expressions(source):
+    from ytfetcher.exceptions import InvalidFilterExpression
+    from ytfetcher.filters import where
+
+    with pytest.raises(InvalidFilterExpression):
+        where(source)
+
+@pytest.mark.parametrize("value", [float("inf"), float("-inf"), float("nan")])
+def test_where_rejects_non_finite_numbers(value):
+    from ytfetcher.exceptions import InvalidFilterExpression
+    from ytfetcher.filters import min_views
+
+    with pytest.raises(InvalidFilterExpression):
+        min_views(value)
+
+def test_combine_merges_expressions_and_custom_callables(sample_snippets):
+    from ytfetcher.filters import combine, FilterExpression
+
+    assert isinstance(combine([min_views(10), min_duration(100)]), FilterExpression)
+
+    predicate = combine([min_views(10), lambda v: v.title.startswith("Name")])
+    assert [predicate(s) for s in sample_snippets] == [False, True]
+
+def test_published_filters_compare_upload_dates():
+    from datetime import date, timedelta
+    from ytfetcher.filters import published_after, published_before, where
+
+    snippet = DLSnippet(video_id='id1', title='t', timestamp=1_780_000_000)
+
+    assert snippet.upload_date == '20260528'
+    assert published_after(date(2026, 5, 28))(snippet)
+    assert not published_after('20260529')(snippet)
+    assert published_before('2026-05-29')(snippet)
+    assert published_after(date(2026, 5, 1)) == where('upload_date >= "20260501"')
+    assert not published_after(timedelta(days=1))(DLSnippet(video_id='id2', title='t'))
+
+def test_filter_expression_lower_bound():
+    from ytfetcher.filters import where
+
+    assert where('upload_date >= "2026-01-01" and (upload_date > "20260201" or views > 1)').lower_bound('upload_date') == '20260101'
+    assert where('upload_date >= "20260101" or upload_date >= "20250101"').lower_bound('upload_date') == '20250101'
+    assert where('upload_date >= "20260101" or views > 1').lower_bound('upload_date') is None
+    assert where('not upload_date < "20260101"').lower_bound('upload_date') is None
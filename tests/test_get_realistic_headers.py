@@ -7,4 +7,36 @@ def test_get_realistic_headers_return_type():
 
     assert isinstance(headers, dict)
     assert headers.get("User-Agent") is not None
-    assert headers.get("Referer") is not None
\ No newline at end of file
+    assert headers.get("Referer") is not None
+
+def test_get_realistic_headers_returns_copies_from_cached_pool(mocker):
+    from ytfetcher.config.http_config import HTTPConfig
+    from ytfetcher.utils import headers as headers_module
+
+    headers_module.default_header_pool.cache_clear()
+    headers_module._load_browsers.cache_clear()
+    load = mocker.spy(headers_module, '_load_browsers')
+
+    first = get_realistic_headers()
+    first['User-Agent'] = 'changed'
+
+    assert get_realistic_headers()['User-Agent'] != 'changed'
+    assert all(HTTPConfig().headers.get('User-Agent') for _ in range(3))
+    assert headers_module.default_header_pool() is headers_module.default_header_pool()
+    assert load.call_count == 1
+
+def test_header_profile_pool_is_coherent_and_rotates():
+    from ytfetcher.utils.headers import HeaderProfilePool
+
+    pool = HeaderProfilePool(size=4, seed=7)
+
+    assert len(pool) == 4
+    assert [pool.next() for _ in range(5)] == [*pool.profiles, pool.profiles[0]]
+    assert pool.profiles == HeaderProfilePool(size=4, seed=7).profiles
+    for profile in pool.profiles:
+        is_firefox = 'Firefox/' in profile['User-Agent']
+        assert ('Sec-CH-UA' in profile) != is_firefox
+        if not is_firefox:
+            version = profile['User-Agent'].split('Chrome/')[1].split('.')[0]
+            assert f'v="{version}"' in profile['Sec-CH-UA']
+        assert profile['Sec-Fetch-Site'] == ('same-origin' if 'youtube.com' in profile['Referer'] else 'cross-site')
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+import pytest
+
+HEAVY_MODULES = ('yt_dlp', 'youtube_transcript_api', 'requests', 'rich', 'tqdm', 'tenacity', 'fake_useragent')
+
+def _loaded_modules(code: str) -> set[str]:
+    script = f"{code}\nimport sys\nprint(' '.join(sys.modules))"
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+    return {name.split('.')[0] for name in output.split()}
+
+@pytest.mark.parametrize('code', [
+    'import ytfetcher',
+    'import ytfetcher._cli',
+    'from ytfetcher._cli import create_parser; create_parser()',
+    'from ytfetcher.config import FetchOptions',
+    'import ytfetcher.cache',
+])
+def test_startup_paths_do_not_import_fetch_dependencies(code):
+    assert _loaded_modules(code).isdisjoint(HEAVY_MODULES)
+
+def test_lazy_attributes_resolve():
+    import ytfetcher
+    import ytfetcher.config
+    import ytfetcher.services
+    import ytfetcher.utils
+    from ytfetcher._core import YTFetcher
+    from ytfetcher.utils.helpers import channel_data_to_rows
+    from youtube_transcript_api.proxies import GenericProxyConfig
+
+    assert ytfetcher.YTFetcher is YTFetcher
+    assert ytfetcher.config.GenericProxyConfig is GenericProxyConfig
+    assert ytfetcher.utils.channel_data_to_rows is channel_data_to_rows
+    assert ytfetcher.services.PreviewRenderer.__name__ == 'PreviewRenderer'
+    assert set(ytfetcher.__all__) <= set(dir(ytfetcher))
+
+    with pytest.raises(AttributeError):
+        ytfetcher.missing
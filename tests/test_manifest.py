@@ -0,0 +1,63 @@
+import pytest
+from ytfetcher.exceptions import InvalidManifest
+from ytfetcher.models.source import Source
+from ytfetcher.services.manifest import load_sources
+
+def test_load_sources_from_jsonl(tmp_path):
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(
+        '{"channel": "@TheOffice", "max_results": 50, "name": "office"}\n'
+        '\n'
+        '# nightly searches\n'
+        '{"search": "python tutorial", "max_results": 5}\n'
+        '{"video_ids": ["dQw4w9WgXcQ"]}\n'
+        '{"kind": "playlist", "target": "PL123", "max_results": null}\n',
+        encoding="utf-8",
+    )
+
+    sources = load_sources(manifest)
+
+    assert sources == [
+        Source(kind="channel", target="@TheOffice", max_results=50, name="office"),
+        Source(kind="search", target="python tutorial", max_results=5, name="search-python_tutorial"),
+        Source(kind="video", target=["dQw4w9WgXcQ"], name="video-dQw4w9WgXcQ"),
+        Source(kind="playlist", target="PL123", max_results=None, name="playlist-PL123"),
+    ]
+
+def test_load_sources_from_yaml(tmp_path):
+    pytest.importorskip("yaml")
+    manifest = tmp_path / "jobs.yaml"
+    manifest.write_text(
+        "sources:\n"
+        "  - channel: '@TheOffice'\n"
+        "    tab: shorts\n"
+        "  - playlist: PL123\n",
+        encoding="utf-8",
+    )
+
+    sources = load_sources(manifest)
+
+    assert [(s.kind, s.target, s.tab) for s in sources] == [("channel", "@TheOffice", "shorts"), ("playlist", "PL123", "videos")]
+
+@pytest.mark.parametrize("content", [
+    '{"channel": "@a", "search": "b"}\n',
+    '{"channel": "@a", "unknown": 1}\n',
+    '{"search": "b", "max_results": null}\n',
+    '{"channel": \n',
+    '{"channel": "@a", "name": "../escape"}\n',
+    '{"channel": "@a", "name": "a/b"}\n',
+    '{"channel": "@a", "name": ".."}\n',
+])
+def test_load_sources_rejects_invalid_entries(tmp_path, content):
+    manifest = tmp_path / "jobs.jsonl"
+    manifest.write_text(content, encoding="utf-8")
+
+    with pytest.raises(InvalidManifest):
+        load_sources(manifest)
+
+def test_load_sources_rejects_unknown_format(tmp_path):
+    manifest = tmp_path / "jobs.toml"
+    manifest.write_text("", encoding="utf-8")
+
+    with pytest.raises(InvalidManifest):
+        load_sources(manifest)
@@ -0,0 +1,104 @@
+import pytest
+from unittest.mock import patch
+from yt_dlp.utils import DownloadError
+from ytfetcher.metrics import FetchMetrics, MetricsRegistry
+from ytfetcher.models.channel import FailedTranscript, Transcript, VideoTranscript
+from ytfetcher.cache import MemoryCache, WriteBehindCache
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+from ytfetcher._youtube_dl import ChannelFetcher, VideoListFetcher
+
+def test_render_uses_openmetrics_text_format():
+    registry = MetricsRegistry()
+    registry.counter("jobs", "Jobs done.", ("kind",)).inc(2, kind='a"b')
+    registry.gauge("in_flight", "Running jobs.").set(3)
+    latency = registry.histogram("latency_seconds", "Job latency.", buckets=(0.1, 1.0))
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5)
+
+    assert registry.render().splitlines() == [
+        '# TYPE jobs counter',
+        '# HELP jobs Jobs done.',
+        'jobs_total{kind="a\\"b"} 2',
+        '# TYPE in_flight gauge',
+        '# HELP in_flight Running jobs.',
+        'in_flight 3',
+        '# TYPE latency_seconds histogram',
+        '# HELP latency_seconds Job latency.',
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 2',
+        'latency_seconds_bucket{le="+Inf"} 3',
+        'latency_seconds_count 3',
+        'latency_seconds_sum 5.55',
+        '# EOF',
+    ]
+
+def test_registry_returns_existing_metric_and_rejects_conflicts():
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs", "Jobs done.")
+
+    assert registry.counter("jobs", "Jobs done.") is counter
+    with pytest.raises(ValueError):
+        registry.gauge("jobs", "Jobs done.")
+    with pytest.raises(ValueError):
+        counter.inc(kind="a")
+
+def test_write_textfile(tmp_path):
+    metrics = FetchMetrics()
+    metrics.retries.inc()
+    path = tmp_path / "textfile" / "ytfetcher.prom"
+
+    metrics.write_textfile(path)
+
+    assert "ytfetcher_retries_total 1" in path.read_text()
+    assert list(path.parent.iterdir()) == [path]
+
+def test_transcript_fetcher_updates_metrics(mocker):
+    metrics = FetchMetrics()
+    fetcher = TranscriptFetcher(['a', 'b', 'c'], metrics=metrics)
+
+    def fake_fetch_transcript(video_id):
+        assert metrics.transcripts_in_flight.value() >= 1
+        if video_id == 'c':
+            return FailedTranscript(video_id=video_id, reason='TranscriptsDisabled', is_permanent_exception=True)
+        return VideoTranscript(video_id=video_id, transcripts=[Transcript(text='t', start=0, duration=1)])
+
+    mocker.patch.object(fetcher, '_fetch_transcript', side_effect=fake_fetch_transcript)
+    fetcher.fetch()
+
+    assert metrics.transcripts.value(result='success') == 2
+    assert metrics.transcripts.value(result='TranscriptsDisabled') == 1
+    assert metrics.transcript_duration.count() == 3
+    assert metrics.transcripts_in_flight.value() == 0
+    assert metrics.transcript_queue_depth.value() == 0
+
+@patch("yt_dlp.YoutubeDL")
+def test_youtube_dl_fetchers_record_extractions_and_failures(MockYDL):
+    metrics = FetchMetrics()
+    mock_instance = MockYDL.return_value.__enter__.return_value
+    mock_instance.extract_info.side_effect = [{"entries": []}, DownloadError("Video unavailable")]
+
+    listing = ChannelFetcher(channel_handle="someone")
+    listing.attach_metrics(metrics)
+    listing.fetch()
+
+    videos = VideoListFetcher(video_ids=["gone"])
+    videos.attach_metrics(metrics)
+    assert videos.fetch() == []
+
+    assert metrics.ytdlp_extractions.value(fetcher="ChannelFetcher") == 1
+    assert metrics.ytdlp_extractions.value(fetcher="VideoListFetcher") == 1
+    assert metrics.ytdlp_duration.count(fetcher="ChannelFetcher") == 1
+    assert metrics.ytdlp_failures.value(reason="VideoUnavailable") == 1
+    assert metrics.ytdlp_in_flight.value() == 0
+
+def test_cache_metrics():
+    metrics = FetchMetrics()
+    metrics.record_cache_lookup(hits=3, misses=1)
+
+    with WriteBehindCache(MemoryCache(), metrics=metrics) as writer:
+        writer.put(VideoTranscript(video_id='a', transcripts=[]), 'key')
+
+    assert metrics.cache_hit_ratio.value() == 0.75
+    assert metrics.cache_writes.value() == 1
+    assert metrics.cache_write_queue_depth.value() == 0
@@ -0,0 +1,60 @@
+from ytfetcher.models.channel import Transcript
+from ytfetcher.normalizers import TranscriptNormalizer, NormalizationRule
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+from ytfetcher.config import FetchOptions
+
+def test_default_normalizer_matches_legacy_cleaning():
+    texts = [
+        "[Music] >> This is some text",
+        "  >>   speaker   two\nline  ",
+        "keep >> inner markers [Applause] here",
+        "[Laughter]",
+    ]
+
+    cleaned = TranscriptNormalizer.default().normalize(texts)
+
+    assert cleaned == [
+        "This is some text",
+        "speaker two line",
+        "keep >> inner markers here",
+        "",
+    ]
+
+def test_brackets_do_not_span_segments():
+    cleaned = TranscriptNormalizer.default().normalize(["open [bracket", "closed] here"])
+
+    assert cleaned == ["open [bracket", "closed] here"]
+
+def test_noop_normalizer_returns_text_untouched():
+    texts = ["[Music]  raw   text"]
+
+    assert TranscriptNormalizer.noop().is_noop
+    assert TranscriptNormalizer.noop().normalize(texts) == ["[Music]  raw   text"]
+
+def test_custom_rules_are_applied_in_order():
+    normalizer = TranscriptNormalizer(
+        rules=[
+            NormalizationRule(r"(?i)\buh\b"),
+            NormalizationRule(r"colour", "color"),
+        ]
+    )
+
+    assert normalizer.normalize(["uh the colour", "Uh blue"]) == ["the color", "blue"]
+
+def test_rule_consuming_separator_falls_back_to_per_segment():
+    normalizer = TranscriptNormalizer(rules=[NormalizationRule(r"[\s\S]*", "x")], collapse_whitespace=False)
+
+    assert normalizer.normalize(["a", "b"]) == ["xx", "xx"]
+
+def test_transcript_fetcher_uses_configured_normalizer():
+    segments = [Transcript(text="[Music] hi", start=0, duration=1)]
+
+    TranscriptFetcher._clean_transcripts(segments, normalizer=TranscriptNormalizer.noop())
+
+    assert segments[0].text == "[Music] hi"
+
+def test_fetch_options_default_normalizer():
+    options = FetchOptions()
+
+    assert isinstance(options.normalizer, TranscriptNormalizer)
+    assert not options.normalizer.is_noop
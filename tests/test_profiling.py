@@ -0,0 +1,67 @@
+from ytfetcher import YTFetcher, DLSnippet, VideoTranscript
+from ytfetcher.models.channel import Transcript
+from ytfetcher.config import FetchOptions
+from ytfetcher.profiling import RunProfiler
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+from ytfetcher._youtube_dl import BaseYoutubeDLFetcher
+from concurrent.futures import ThreadPoolExecutor
+import pstats
+import pytest
+import time
+
+class DummyFetcher(BaseYoutubeDLFetcher):
+    def fetch(self) -> list[DLSnippet]:
+        return [DLSnippet(video_id=f'id{i}', title='title') for i in range(6)]
+
+def _slow_fetch_transcript(self, video_id):
+    time.sleep(0.02)
+    return VideoTranscript(video_id=video_id, transcripts=[Transcript(text='text', start=0, duration=1)])
+
+def busy():
+    return sum(i * i for i in range(20000))
+
+def test_phase_and_tasks_record_wall_and_cpu_time():
+    profiler = RunProfiler(sample_interval=0.001)
+
+    with profiler.phase('fetch'):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(profiler.task(lambda _: time.sleep(0.02)), range(4)))
+        busy()
+
+    profile = profiler.phases['fetch']
+    assert profile.tasks == 4
+    assert profile.worker_wall_time >= 0.08
+    assert profile.worker_cpu_ratio < 0.5
+    assert sum(tasks for tasks, _, _ in profile.threads.values()) == 4
+    assert profile.wall_time >= profile.cpu_time > 0
+    assert any(stack.startswith('fetch;worker;') for stack in profiler.stacks)
+
+    stats = profiler.stats('fetch')
+    assert stats is not None
+    assert any(func[2] == 'busy' for func in stats.stats)
+
+def test_task_outside_phase_is_unchanged():
+    profiler = RunProfiler()
+
+    assert profiler.task(busy) is busy
+    with pytest.raises(ValueError):
+        RunProfiler(sample_interval=0)
+
+def test_fetch_options_profile_covers_phases_and_writes_report(mocker, tmp_path):
+    mocker.patch.object(TranscriptFetcher, '_fetch_transcript', _slow_fetch_transcript)
+    profiler = RunProfiler()
+
+    fetcher = YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=FetchOptions(cache_enabled=False, profile=profiler))
+    fetcher.fetch_youtube_data()
+    written = profiler.write(tmp_path)
+
+    assert list(profiler.phases) == ['listing', 'fetch']
+    assert profiler.phases['fetch'].tasks == 6
+    assert {path.name for path in written} >= {'listing.pstats', 'fetch.pstats', 'stacks.collapsed', 'summary.txt'}
+    pstats.Stats(str(tmp_path / 'fetch.pstats'))
+
+    for line in (tmp_path / 'stacks.collapsed').read_text().splitlines():
+        stack, count = line.rsplit(' ', 1)
+        assert stack.split(';')[0] in profiler.phases
+        assert int(count) > 0
+    assert 'fetch' in (tmp_path / 'summary.txt').read_text()
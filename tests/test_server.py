@@ -0,0 +1,134 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+from unittest.mock import MagicMock
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+from ytfetcher.config.fetch_config import FetchOptions
+from ytfetcher.config.http_config import HTTPConfig
+from ytfetcher.exceptions import ChannelNotFound
+from ytfetcher.models.channel import DLSnippet, FailedTranscript, Transcript, VideoTranscript
+from ytfetcher.services.server import TranscriptHTTPServer, TranscriptService
+
+@pytest.fixture
+def fetch_calls(mocker):
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def fake_fetch_single(self, video_id):
+        with lock:
+            calls.append(video_id)
+        time.sleep(0.1)
+        if video_id == "missing":
+            return FailedTranscript(video_id=video_id, reason="NoTranscriptFound", is_permanent_exception=True)
+        return VideoTranscript(video_id=video_id, transcripts=[Transcript(text=f"text {video_id}", start=0, duration=1)])
+
+    mocker.patch.object(TranscriptFetcher, "_fetch_single", fake_fetch_single)
+    return calls
+
+@pytest.fixture
+def server(tmp_path):
+    service = TranscriptService(options=FetchOptions(http_config=HTTPConfig(headers={}), cache_path=str(tmp_path)), max_workers=4)
+    httpd = TranscriptHTTPServer(("127.0.0.1", 0), service)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+def _get_jsonl(url):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        return [json.loads(line) for line in response.read().decode().splitlines()]
+
+def test_transcripts_endpoint_streams_jsonl_and_caches(server, fetch_calls):
+    lines = _get_jsonl(f"{server}/transcripts?ids=a,b,a&ids=missing")
+
+    assert sorted(line["video_id"] for line in lines) == ["a", "b", "missing"]
+    assert next(line for line in lines if line["video_id"] == "a")["transcripts"][0]["text"] == "text a"
+    assert next(line for line in lines if line["video_id"] == "missing")["reason"] == "NoTranscriptFound"
+
+    _get_jsonl(f"{server}/transcripts?ids=a,missing")
+    assert sorted(fetch_calls) == ["a", "b", "missing"]
+
+def test_concurrent_requests_for_same_video_are_coalesced(server, fetch_calls):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(_get_jsonl(f"{server}/transcripts?ids=hot&languages=de")))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fetch_calls == ["hot"]
+    assert all(lines[0]["video_id"] == "hot" for lines in results)
+
+def test_channel_endpoint_streams_channel_data(server, fetch_calls, mocker):
+    listing = MagicMock()
+    listing.fetch.return_value = [DLSnippet(video_id="v1", title="One"), DLSnippet(video_id="v2", title="Two")]
+    channel_cls = mocker.patch("ytfetcher.services.server.ChannelFetcher", return_value=listing)
+
+    lines = _get_jsonl(f"{server}/channel/@someone?max_results=2&where=" + urllib.request.quote('title ~ "o"'))
+
+    assert channel_cls.call_args.kwargs == {"channel_handle": "@someone", "max_results": 2, "tab": "videos"}
+    listing.push_down_filters.assert_called_once()
+    assert sorted((line["video_id"], line["metadata"]["title"]) for line in lines) == [("v1", "One"), ("v2", "Two")]
+
+def test_search_endpoint_applies_where_filters_to_listing(server, fetch_calls, mocker):
+    listing = MagicMock()
+    listing.fetch.return_value = [DLSnippet(video_id="v1", title="One", view_count=5), DLSnippet(video_id="v2", title="Two", view_count=50)]
+    mocker.patch("ytfetcher.services.server.SearchFetcher", return_value=listing)
+
+    lines = _get_jsonl(f"{server}/search?q=x&where=" + urllib.request.quote("views >= 10"))
+
+    assert [line["video_id"] for line in lines] == ["v2"]
+    assert fetch_calls == ["v2"]
+
+def test_error_after_stream_started_ends_with_error_record(server, mocker):
+    def transcripts(*args, **kwargs):
+        yield VideoTranscript(video_id="a", transcripts=[])
+        raise RuntimeError("boom")
+
+    mocker.patch.object(TranscriptService, "transcripts", side_effect=transcripts)
+
+    lines = _get_jsonl(f"{server}/transcripts?ids=a,b")
+
+    assert lines == [{"video_id": "a", "transcripts": []}, {"error": "Internal server error.", "status": 500}]
+
+@pytest.mark.parametrize("path, status", [
+    ("/transcripts", 400),
+    ("/search?q=x&max_results=-1", 400),
+    ("/search?q=x&where=views%20%3E", 400),
+    ("/unknown", 404),
+    ("/channel/@gone", 404),
+])
+def test_error_responses(server, mocker, path, status):
+    listing = MagicMock()
+    listing.fetch.side_effect = ChannelNotFound("@gone")
+    mocker.patch("ytfetcher.services.server.ChannelFetcher", return_value=listing)
+
+    with pytest.raises(urllib.error.HTTPError) as e:
+        urllib.request.urlopen(f"{server}{path}", timeout=5)
+
+    assert e.value.code == status
+    assert "error" in json.loads(e.value.read())
+
+def test_metrics_endpoint_exposes_openmetrics(server, fetch_calls):
+    _get_jsonl(f"{server}/transcripts?ids=a,missing")
+    _get_jsonl(f"{server}/transcripts?ids=a")
+
+    with urllib.request.urlopen(f"{server}/metrics", timeout=5) as response:
+        assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+        body = response.read().decode()
+
+    assert 'ytfetcher_transcripts_total{result="success"} 1' in body
+    assert 'ytfetcher_transcripts_total{result="NoTranscriptFound"} 1' in body
+    assert 'ytfetcher_cache_lookups_total{result="hit"} 1' in body
+    assert body.endswith("# EOF\n")
@@ -0,0 +1,34 @@
+import threading
+import time
+import pytest
+from ytfetcher.utils.singleflight import SingleFlight
+
+def test_concurrent_calls_share_one_execution():
+    flights: SingleFlight[str, int] = SingleFlight()
+    calls = []
+    results = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.1)
+        return 42
+
+    threads = [threading.Thread(target=lambda: results.append(flights.do("key", work))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [42] * 8
+    assert flights.coalesced == 7
+    assert flights.in_flight() == 0
+
+def test_errors_are_shared_and_not_cached():
+    flights: SingleFlight[str, int] = SingleFlight()
+
+    with pytest.raises(RuntimeError):
+        flights.do("key", lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+
+    assert flights.do("key", lambda: 1) == 1
+    assert flights.do("other", lambda: 2) == 2
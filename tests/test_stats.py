@@ -0,0 +1,128 @@
+from ytfetcher import YTFetcher, DLSnippet, VideoTranscript
+from ytfetcher.models.channel import Transcript, FailedTranscript, TranscriptFetchResult
+from ytfetcher.config import FetchOptions
+from ytfetcher.cache import MemoryCache, build_transcript_cache_key
+from ytfetcher.stats import RunStats
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+from ytfetcher._youtube_dl import BaseYoutubeDLFetcher
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectionError
+from requests.models import Response
+import json
+
+class DummyFetcher(BaseYoutubeDLFetcher):
+    def fetch(self) -> list[DLSnippet]:
+        return [DLSnippet(video_id=vid, title=vid) for vid in ['id1', 'id2', 'id3', 'id4']]
+
+class CannedAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        response = Response()
+        response.status_code = 404 if request.url.endswith('/missing') else 200
+        response._content = b'hello'
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+def test_phases_accumulate_and_serialize():
+    stats = RunStats()
+
+    with stats.phase('fetch'):
+        pass
+    with stats.phase('fetch'):
+        pass
+    stats.increment('cache_hits', 3)
+    stats.increment('cache_misses')
+    stats.record_failure('IpBlocked')
+    stats.record_failure('VideoUnavailable', source='ytdlp')
+    stats.finish()
+
+    data = json.loads(stats.to_json())
+
+    assert list(data['phases']) == ['fetch']
+    assert data['cache_hits'] == 3
+    assert data['cache_hit_ratio'] == 0.75
+    assert data['transcript_failures'] == {'IpBlocked': 1}
+    assert data['ytdlp_failures'] == {'VideoUnavailable': 1}
+    assert data['wall_time'] >= data['phases']['fetch']
+    assert not any(key.startswith('_') for key in data)
+
+def test_last_run_stats_counts_cache_hits_phases_and_failures(mocker):
+    transcripts = [Transcript(text='text', start=0, duration=1)]
+    cache = MemoryCache()
+    cache_key = build_transcript_cache_key(languages=['__auto__'], manually_created=False)
+    cache.upsert_transcripts([VideoTranscript(video_id='id1', transcripts=transcripts)], cache_key)
+    cache.upsert_failures([FailedTranscript(video_id='id2', reason='VideoUnavailable', is_permanent_exception=True)], cache_key)
+
+    mocker.patch.object(TranscriptFetcher, 'fetch', return_value=TranscriptFetchResult(
+        success=[VideoTranscript(video_id='id3', transcripts=transcripts)],
+        failed=[FailedTranscript(video_id='id4', reason='TranscriptsDisabled', is_permanent_exception=True)],
+    ))
+
+    fetcher = YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=FetchOptions(cache_backend=cache))
+    assert fetcher.last_run_stats is None
+
+    fetcher.fetch_youtube_data()
+    stats = fetcher.last_run_stats
+
+    assert stats is not None
+    assert {'listing', 'cache_lookup', 'fetch'} <= set(stats.phases)
+    assert stats.videos == 4
+    assert stats.transcripts == 2
+    assert (stats.cache_hits, stats.cache_misses, stats.cache_writes) == (2, 2, 2)
+    assert stats.transcript_failures == {'VideoUnavailable': 1, 'TranscriptsDisabled': 1}
+    assert stats.wall_time > 0
+
+def test_each_fetch_call_gets_fresh_stats(mocker):
+    mocker.patch.object(TranscriptFetcher, 'fetch', return_value=TranscriptFetchResult(success=[], failed=[]))
+    fetcher = YTFetcher(youtube_dl_fetcher=DummyFetcher(), options=FetchOptions(cache_enabled=False))
+
+    fetcher.fetch_transcripts()
+    first = fetcher.last_run_stats
+    fetcher.fetch_snippets()
+
+    assert fetcher.last_run_stats is not first
+    assert 'listing' in first.phases
+    assert 'listing' not in fetcher.last_run_stats.phases
+
+def test_transcript_fetcher_counts_requests_and_bytes(mocker):
+    stats = RunStats()
+    fetcher = TranscriptFetcher(['a', 'b'], stats=stats)
+    fetcher._session.mount('https://', CannedAdapter())
+
+    def fake_fetch(video_id):
+        fetcher._session.get(f'https://example.com/{"missing" if video_id == "b" else video_id}')
+        return VideoTranscript(video_id=video_id, transcripts=[])
+
+    mocker.patch.object(fetcher, '_fetch_single', side_effect=fake_fetch)
+    fetcher.fetch()
+
+    assert (stats.requests, stats.http_errors, stats.bytes_received) == (2, 1, 10)
+    assert stats.record_response not in fetcher._session.hooks['response']
+
+def test_transcript_fetcher_hook_follows_current_stats(mocker):
+    with TranscriptFetcher(['a'], stats=RunStats()) as fetcher:
+        fetcher._session.mount('https://', CannedAdapter())
+        mocker.patch.object(fetcher, '_fetch_single', side_effect=lambda video_id: (
+            fetcher._session.get(f'https://example.com/{video_id}'),
+            VideoTranscript(video_id=video_id, transcripts=[])
+        )[1])
+
+        first = fetcher.stats
+        fetcher.fetch()
+        fetcher.stats = second = RunStats()
+        fetcher.fetch()
+
+    assert (first.requests, second.requests) == (1, 1)
+    assert fetcher._session.hooks['response'] == [fetcher._record_response]
+
+def test_transcript_fetcher_counts_retries(mocker):
+    stats = RunStats()
+    fetcher = TranscriptFetcher(['a'], stats=stats, retry_attempts=1, retry_delay=0)
+    mocker.patch.object(fetcher, '_decide_fetch_method', side_effect=[ConnectionError(), ConnectionError(), [Transcript(text='t', start=0, duration=1)]])
+
+    result = fetcher.fetch()
+
+    assert len(result.success) == 1
+    assert stats.retries == 2
@@ -93,7 +93,7 @@ def test_custom_ytt_api_client_initialized_correctly(mocker):
     mock_api = mocker.patch("ytfetcher._transcript_fetcher.YouTubeTranscriptApi")
 
     fetcher = TranscriptFetcher(
-        mock_video_ids,
+        ["video123"],
         http_config=HTTPConfig(),
         proxy_config=GenericProxyConfig(http_url="http://test:800"),
     )
@@ -278,8 +278,8 @@ def test_collect_results_returns_partial_success_and_cancels_pending_tasks(mocke
     }
 
     mocker.patch(
-        "ytfetcher._transcript_fetcher.futures.as_completed",
-        return_value=[success_future, blocked_future],
+        "ytfetcher._transcript_fetcher.futures.wait",
+        return_value=({success_future, blocked_future}, {pending_future}),
     )
 
     result = fetcher._collect_results(tasks=tasks)
@@ -288,3 +288,243 @@ def test_collect_results_returns_partial_success_and_cancels_pending_tasks(mocke
     assert [entry.video_id for entry in result.failed] == ["blocked_video"]
     assert result.failed[0].reason == "IpBlocked"
     pending_future.cancel.assert_called_once_with()
+
+def test_convert_to_transcript_object_batches_validation():
+    raw = [
+        {"text": "a", "start": 0, "duration": "1.5"},
+        {"text": "b", "start": 1.5, "duration": 2},
+    ]
+
+    result = TranscriptFetcher._convert_to_transcript_object(raw)
+
+    assert all(isinstance(segment, Transcript) for segment in result)
+    assert result[0].duration == 1.5
+
+def test_convert_to_transcript_object_strict_rejects_coercion():
+    from pydantic import ValidationError
+
+    with pytest.raises(ValidationError):
+        TranscriptFetcher._convert_to_transcript_object(
+            [{"text": "a", "start": 0, "duration": "1.5"}],
+            strict=True
+        )
+
+def test_fetch_single_builds_transcript_without_revalidation(mocker):
+    fetcher = TranscriptFetcher(["abc"])
+    mocker.patch.object(
+        fetcher,
+        "_decide_fetch_method",
+        return_value=[Transcript(text="[Music] hi", start=0, duration=1)]
+    )
+    construct = mocker.spy(VideoTranscript, "model_construct")
+
+    result = fetcher._fetch_single("abc")
+
+    assert isinstance(result, VideoTranscript)
+    assert result.transcripts[0].text == "hi"
+    construct.assert_called_once()
+
+def test_transcript_fetcher_fetches_duplicate_ids_once(mocker):
+    fetcher = TranscriptFetcher(video_ids=["a", "b", "a", "b", "c"])
+    mock_fetch_single = mocker.patch.object(
+        fetcher,
+        "_fetch_single",
+        side_effect=lambda video_id: VideoTranscript(video_id=video_id, transcripts=[])
+    )
+
+    results = fetcher.fetch()
+
+    assert fetcher.video_ids == ["a", "b", "c"]
+    assert mock_fetch_single.call_count == 3
+    assert sorted(t.video_id for t in results.success) == ["a", "b", "c"]
+
+def test_concurrent_identical_fetches_share_one_call(mocker):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch(self, video_id):
+        calls.append(video_id)
+        release.wait(timeout=5)
+        return VideoTranscript(video_id=video_id, transcripts=[])
+
+    mocker.patch.object(TranscriptFetcher, "_fetch_transcript", slow_fetch)
+    fetchers = [TranscriptFetcher(["abc"], languages=["en"]) for _ in range(4)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        tasks = [pool.submit(fetcher._fetch_single, "abc") for fetcher in fetchers]
+        while not calls:
+            pass
+        release.set()
+        results = [task.result() for task in tasks]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+def test_fetches_with_different_options_are_not_coalesced():
+    assert (
+        TranscriptFetcher(["abc"], languages=["en"])._flight_key("abc")
+        != TranscriptFetcher(["abc"], languages=["de"])._flight_key("abc")
+    )
+
+def test_fetches_through_different_proxies_are_not_coalesced():
+    from youtube_transcript_api.proxies import GenericProxyConfig
+
+    def key(proxy_url):
+        return TranscriptFetcher(["abc"], proxy_config=GenericProxyConfig(http_url=proxy_url))._flight_key("abc")
+
+    assert key("http://proxy-a:8080") != key("http://proxy-b:8080")
+    assert key("http://proxy-a:8080") == key("http://proxy-a:8080")
+    assert key("http://proxy-a:8080") != TranscriptFetcher(["abc"])._flight_key("abc")
+
+def test_on_result_receives_each_result_as_it_completes(mocker):
+    seen = []
+    fetcher = TranscriptFetcher(["ok", "boom"], on_result=seen.append)
+
+    def fetch_single(video_id):
+        if video_id == "boom":
+            raise RuntimeError("unexpected")
+        return VideoTranscript(video_id=video_id, transcripts=[])
+
+    mocker.patch.object(fetcher, "_fetch_single", side_effect=fetch_single)
+
+    result = fetcher.fetch()
+
+    assert sorted(r.video_id for r in seen) == ["boom", "ok"]
+    assert seen[[r.video_id for r in seen].index("ok")] is result.success[0]
+
+def test_sessions_are_sharded_across_workers(mocker):
+    import threading
+
+    config = HTTPConfig(sessions=3, connect_timeout=2, read_timeout=7)
+    fetcher = TranscriptFetcher(["a", "b", "c", "d", "e", "f"], http_config=config, max_concurrent_requests=6)
+    used = {}
+    release = threading.Barrier(6, timeout=5)
+
+    def fetch_single(video_id):
+        used[threading.current_thread().name] = fetcher._worker_session()
+        release.wait()
+        assert fetcher._worker_session() is used[threading.current_thread().name]
+        return VideoTranscript(video_id=video_id, transcripts=[])
+
+    mocker.patch.object(fetcher, "_fetch_single", side_effect=fetch_single)
+    sessions = list(fetcher._sessions)
+    close = [mocker.spy(session, "close") for session in sessions]
+
+    fetcher.fetch()
+
+    assert len(sessions) == 3
+    assert len({id(s.cookies) for s in sessions}) == 3
+    assert sorted(list(used.values()).count(s) for s in sessions) == [2, 2, 2]
+    assert all(s.timeout == (2, 7) for s in sessions)
+    assert all(s.get_adapter("https://www.youtube.com")._pool_maxsize == 2 for s in sessions)
+    assert all(spy.call_count == 1 for spy in close)
+
+def test_custom_headers_are_shared_by_all_sessions():
+    config = HTTPConfig(headers={"User-Agent": "custom"}, sessions=4, pool_maxsize=5)
+    sessions = TranscriptFetcher.create_sessions(config, max_concurrent_requests=2)
+
+    assert len(sessions) == 2
+    assert all(s.headers["User-Agent"] == "custom" for s in sessions)
+    assert all(s.get_adapter("https://www.youtube.com")._pool_maxsize == 5 for s in sessions)
+    with pytest.raises(ValueError):
+        HTTPConfig(sessions=0)
+
+def test_fetcher_reuses_sessions_and_clients_across_fetches(mocker):
+    api = mocker.patch("ytfetcher._transcript_fetcher.YouTubeTranscriptApi")
+    mocker.patch.object(TranscriptFetcher, "_decide_fetch_method", return_value=[Transcript(text="t", start=0, duration=1)])
+
+    with TranscriptFetcher([], http_config=HTTPConfig(sessions=2), max_concurrent_requests=4) as fetcher:
+        close = [mocker.spy(session, "close") for session in fetcher._sessions]
+        first = fetcher.fetch(["a", "b", "c"])
+        second = fetcher.fetch(["d", "e"], on_result=lambda result: None)
+        assert all(spy.call_count == 0 for spy in close)
+
+    assert len(first.success) == 3 and len(second.success) == 2
+    assert api.call_count <= 2
+    assert all(spy.call_count == 1 for spy in close)
+
+def test_client_keeps_pool_size_of_proxy_retry_adapters():
+    from youtube_transcript_api.proxies import WebshareProxyConfig
+
+    proxy = WebshareProxyConfig(proxy_username="user", proxy_password="pass", retries_when_blocked=3)
+    fetcher = TranscriptFetcher(["a"], proxy_config=proxy, max_concurrent_requests=7)
+
+    fetcher._worker_client()
+    adapter = fetcher._session.get_adapter("https://www.youtube.com")
+
+    assert adapter._pool_maxsize == 7
+    assert adapter.max_retries.total == 3
+
+def test_transient_failures_are_retried_with_their_own_backoff(mocker):
+    from requests.exceptions import ConnectionError
+    from ytfetcher.stats import RunStats
+
+    stats = RunStats()
+    seen = []
+    calls = {"flaky": 0, "down": 0}
+
+    def fetch_single(video_id):
+        if video_id in calls:
+            calls[video_id] += 1
+            if video_id == "down" or calls[video_id] == 1:
+                raise ConnectionError("reset")
+        return VideoTranscript(video_id=video_id, transcripts=[])
+
+    fetcher = TranscriptFetcher(["flaky", "down", "ok"], stats=stats, on_result=seen.append, retry_attempts=2, retry_delay=0.01)
+    mocker.patch.object(fetcher, "_fetch_single", side_effect=fetch_single)
+
+    result = fetcher.fetch()
+
+    assert sorted(t.video_id for t in result.success) == ["flaky", "ok"]
+    assert [(f.video_id, f.reason) for f in result.failed] == [("down", "TransientNetworkError")]
+    assert calls == {"flaky": 2, "down": 3}
+    assert sorted(r.video_id for r in seen) == ["down", "flaky", "ok"]
+    assert (stats.retries, stats.recovered) == (3, 1)
+
+def test_due_retries_are_submitted_ahead_of_queued_videos(mocker):
+    from requests.exceptions import ConnectionError
+
+    calls = []
+
+    def fetch_single(video_id):
+        calls.append(video_id)
+        if calls.count(video_id) == 1 and video_id == "flaky":
+            raise ConnectionError("reset")
+        return VideoTranscript(video_id=video_id, transcripts=[])
+
+    video_ids = ["flaky", "f1", "f2", "f3", "f4", "f5"]
+    fetcher = TranscriptFetcher(video_ids, max_concurrent_requests=1, retry_attempts=1, retry_delay=0)
+    mocker.patch.object(fetcher, "_fetch_single", side_effect=fetch_single)
+
+    result = fetcher.fetch()
+
+    assert sorted(t.video_id for t in result.success) == sorted(video_ids)
+    assert calls == ["flaky", "f1", "flaky", "f2", "f3", "f4", "f5"]
+
+def test_ip_block_reports_videos_not_submitted_yet(mocker):
+    fetcher = TranscriptFetcher(["a", "b", "c", "d", "e"], max_concurrent_requests=1)
+    fetch_single = mocker.patch.object(fetcher, "_fetch_single", side_effect=IpBlocked("a"))
+
+    result = fetcher.fetch()
+
+    assert fetch_single.call_count <= 2
+    assert {"a", "c", "d", "e"} <= {f.video_id for f in result.failed}
+    assert all(f.reason == "IpBlocked" for f in result.failed)
+
+def test_retry_delay_doubles_with_jitter_and_cap():
+    fetcher = TranscriptFetcher(["a"], retry_delay=2, retry_max_delay=10)
+
+    assert 1 <= fetcher._retry_delay(1) <= 3
+    assert 4 <= fetcher._retry_delay(3) <= 10
+    assert fetcher._retry_delay(8) <= 10
+
+def test_ip_block_in_fetch_one_does_not_cancel_later_calls(mocker):
+    fetcher = TranscriptFetcher(["a"])
+    decide = mocker.patch.object(fetcher, "_decide_fetch_method", side_effect=[IpBlocked("a"), [Transcript(text="t", start=0, duration=1)]])
+
+    assert fetcher.fetch_one("a").reason == "IpBlocked"
+    assert isinstance(fetcher.fetch_one("a"), VideoTranscript)
+    assert decide.call_count == 2
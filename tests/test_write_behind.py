@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+from ytfetcher.cache import MemoryCache, WriteBehindCache
+from ytfetcher.models.channel import FailedTranscript, VideoTranscript
+import threading
+import pytest
+
+def _transcript(video_id: str) -> VideoTranscript:
+    return VideoTranscript(video_id=video_id, transcripts=[])
+
+def test_results_are_written_in_size_bounded_batches():
+    backend = MagicMock()
+
+    with WriteBehindCache(backend, max_batch_size=2, flush_interval=60) as writer:
+        for vid in ("a", "b", "c", "d"):
+            writer.put(_transcript(vid), cache_key="k")
+
+    batches = [call.kwargs["transcripts"] for call in backend.upsert_results.call_args_list]
+    assert [[t.video_id for t in batch] for batch in batches] == [["a", "b"], ["c", "d"]]
+    assert writer.written == 4
+
+def test_results_are_written_after_flush_interval_without_close():
+    written = threading.Event()
+    backend = MagicMock()
+    backend.upsert_results.side_effect = lambda **_: written.set()
+
+    writer = WriteBehindCache(backend, max_batch_size=100, flush_interval=0.05)
+    writer.put(_transcript("a"), cache_key="k")
+
+    assert written.wait(timeout=5)
+    writer.close()
+
+def test_flush_writes_everything_queued_and_transient_failures_are_dropped():
+    backend = MemoryCache()
+    writer = WriteBehindCache(backend, flush_interval=60)
+
+    writer.put(_transcript("a"), cache_key="k")
+    writer.put(FailedTranscript(video_id="b", reason="TranscriptsDisabled", message=None, is_permanent_exception=True), cache_key="k")
+    writer.put(FailedTranscript(video_id="c", reason="TransientNetworkError", message=None), cache_key="k")
+    writer.flush()
+
+    successes, failures = backend.get_cached_states(["a", "b", "c"], cache_key="k")
+    assert [t.video_id for t in successes] == ["a"]
+    assert [f.video_id for f in failures] == ["b"]
+
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.put(_transcript("d"), cache_key="k")
+
+def test_write_errors_are_logged_and_writer_keeps_running():
+    backend = MagicMock()
+    backend.upsert_results.side_effect = [OSError("disk full"), None]
+
+    with WriteBehindCache(backend, max_batch_size=1) as writer:
+        writer.put(_transcript("a"), cache_key="k")
+        writer.put(_transcript("b"), cache_key="k")
+
+    assert writer.failed_writes == 1
+    assert writer.written == 1
+
+def test_transcripts_and_failures_of_a_batch_are_written_together():
+    backend = MagicMock()
+
+    with WriteBehindCache(backend, flush_interval=60) as writer:
+        writer.put(_transcript("a"), cache_key="k")
+        writer.put(FailedTranscript(video_id="b", reason="TranscriptsDisabled", message=None, is_permanent_exception=True), cache_key="k")
+
+    backend.upsert_results.assert_called_once()
+    call = backend.upsert_results.call_args
+    assert ([t.video_id for t in call.kwargs["transcripts"]], [f.video_id for f in call.kwargs["failures"]]) == (["a"], ["b"])
+    backend.upsert_transcripts.assert_not_called()
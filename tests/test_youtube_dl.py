@@ -281,4 +281,138 @@ def test_channel_fetcher_raises_channel_fetch_error_for_invalid_channel_url():
 
 def test_playlist_fetcher_raises_playlist_fetch_error_for_invalid_playlist_url():
     with pytest.raises(PlaylistFetchError, match="Could not extract playlist ID"):
-        PlaylistFetcher._find_playlist_id_from_url("https://www.youtube.com/playlist?si=abc")
\ No newline at end of file
+        PlaylistFetcher._find_playlist_id_from_url("https://www.youtube.com/playlist?si=abc")
+
+def _paginate_through_match_filter(MockYDL, entries, consumed):
+    def extract_info(url, download=False):
+        ydl_opts = MockYDL.call_args[0][0]
+        match_filter = ydl_opts["match_filter"]
+        match_filter({"playlist_id": "listing"}, incomplete=True)
+        for entry in entries:
+            consumed.append(entry["id"])
+            match_filter(entry, incomplete=True)
+        return {"entries": []}
+
+    return extract_info
+
+@patch("yt_dlp.YoutubeDL")
+def test_channel_fetcher_pushes_filters_into_listing(MockYDL):
+    from ytfetcher.filters import min_views
+
+    entries = [
+        {"id": f"v{i}", "title": f"T{i}", "view_count": i * 100}
+        for i in range(20)
+    ]
+    consumed: list[str] = []
+    mock_instance = MockYDL.return_value.__enter__.return_value
+    mock_instance.extract_info.side_effect = _paginate_through_match_filter(MockYDL, entries, consumed)
+
+    fetcher = ChannelFetcher("fakechannel", max_results=3)
+    fetcher.push_down_filters([min_views(1000)])
+    result = fetcher.fetch()
+
+    ydl_opts = MockYDL.call_args[0][0]
+    assert "playlistend" not in ydl_opts
+    assert ydl_opts["lazy_playlist"] is True
+    assert [snippet.video_id for snippet in result] == ["v10", "v11", "v12"]
+    assert consumed[-1] == "v12"
+
+@patch("yt_dlp.YoutubeDL")
+def test_playlist_fetcher_pushdown_returns_all_matches_without_limit(MockYDL):
+    from ytfetcher.filters import filter_by_title
+
+    entries = [{"id": "a", "title": "python"}, {"id": "b", "title": "rust"}, {"id": "c", "title": "Python 3"}]
+    consumed: list[str] = []
+    mock_instance = MockYDL.return_value.__enter__.return_value
+    mock_instance.extract_info.side_effect = _paginate_through_match_filter(MockYDL, entries, consumed)
+
+    fetcher = PlaylistFetcher("playlistid", max_results=None)
+    fetcher.push_down_filters([filter_by_title("python")])
+    result = fetcher.fetch()
+
+    assert [snippet.video_id for snippet in result] == ["a", "c"]
+    assert consumed == ["a", "b", "c"]
+
+@patch("yt_dlp.YoutubeDL")
+def test_channel_fetcher_stops_listing_at_recency_cutoff(MockYDL):
+    from ytfetcher.filters import published_after, min_views
+
+    day = 86400
+    newest = 1_780_000_000  # 2026-05-28
+    entries = [
+        {"id": f"v{i}", "title": f"T{i}", "timestamp": newest - i * day, "view_count": 100 * i}
+        for i in range(30)
+    ]
+    consumed: list[str] = []
+    mock_instance = MockYDL.return_value.__enter__.return_value
+    mock_instance.extract_info.side_effect = _paginate_through_match_filter(MockYDL, entries, consumed)
+
+    fetcher = ChannelFetcher("fakechannel", max_results=None)
+    fetcher.push_down_filters([published_after("2026-05-25"), min_views(100)])
+    result = fetcher.fetch()
+
+    ydl_opts = MockYDL.call_args[0][0]
+    assert ydl_opts["extractor_args"]["youtubetab"]["approximate_date"] == [""]
+    assert [snippet.video_id for snippet in result] == ["v1", "v2", "v3"]
+    assert consumed == ["v0", "v1", "v2", "v3", "v4"]
+
+@patch("yt_dlp.YoutubeDL")
+def test_playlist_fetcher_does_not_stop_at_recency_cutoff(MockYDL):
+    from ytfetcher.filters import where
+
+    entries = [
+        {"id": "a", "title": "A", "upload_date": "20260101"},
+        {"id": "b", "title": "B", "upload_date": "20250101"},
+        {"id": "c", "title": "C", "upload_date": "20260301"},
+    ]
+    consumed: list[str] = []
+    mock_instance = MockYDL.return_value.__enter__.return_value
+    mock_instance.extract_info.side_effect = _paginate_through_match_filter(MockYDL, entries, consumed)
+
+    fetcher = PlaylistFetcher("playlistid", max_results=None)
+    fetcher.push_down_filters([where('upload_date >= "2026-01-01"')])
+    result = fetcher.fetch()
+
+    assert [snippet.video_id for snippet in result] == ["a", "c"]
+    assert consumed == ["a", "b", "c"]
+
+def test_video_list_fetcher_fetches_duplicates_once_in_input_order(mocker):
+    import time
+
+    def fetch_single(video_id):
+        time.sleep(0.02 if video_id == "a" else 0)
+        return DLSnippet(video_id=video_id, title=video_id)
+
+    fetcher = VideoListFetcher(video_ids=["a", "b", "a", "c", "b"])
+    spy = mocker.patch.object(fetcher, "fetch_single", side_effect=fetch_single)
+
+    result = fetcher.fetch()
+
+    assert fetcher.video_ids == ["a", "b", "c"]
+    assert spy.call_count == 3
+    assert [snippet.video_id for snippet in result] == ["a", "b", "c"]
+
+def test_concurrent_identical_video_fetches_share_one_extraction(mocker):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch(self, video_id):
+        calls.append(video_id)
+        release.wait(timeout=5)
+        return DLSnippet(video_id=video_id, title=video_id)
+
+    mocker.patch.object(VideoListFetcher, "_fetch_single", slow_fetch)
+    fetchers = [VideoListFetcher(video_ids=["abc"]) for _ in range(3)]
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        tasks = [pool.submit(fetcher.fetch_single, "abc") for fetcher in fetchers]
+        while not calls:
+            pass
+        release.set()
+        results = [task.result() for task in tasks]
+
+    assert calls == ["abc"]
+    assert all(result is results[0] for result in results)
@@ -211,3 +211,89 @@ def test_proxy_config(mock_transcript_fetcher, mock_channel_fetcher_class):
     )
 
     assert fetcher.options.proxy_config is proxy_config_mock
+
+def test_from_sources_deduplicates_videos_and_groups_by_source(mocker: MockerFixture):
+    def snippet(video_id):
+        return DLSnippet(video_id=video_id, title=f"title {video_id}")
+
+    channel = MagicMock()
+    channel.fetch.return_value = [snippet('a'), snippet('b'), snippet('a')]
+    search = MagicMock()
+    search.fetch.return_value = [snippet('b'), snippet('c')]
+    broken = MagicMock()
+    broken.fetch.side_effect = ChannelNotFound('missing')
+
+    mocker.patch('ytfetcher._core.ChannelFetcher', side_effect=[channel, broken])
+    mocker.patch('ytfetcher._core.SearchFetcher', return_value=search)
+    fetch = mocker.patch.object(
+        TranscriptFetcher,
+        'fetch',
+        return_value=TranscriptFetchResult(
+            success=[VideoTranscript(video_id=vid, transcripts=[]) for vid in ('a', 'b', 'c')],
+            failed=[],
+        ),
+    )
+
+    fetcher = YTFetcher.from_sources(
+        [
+            {"channel": "@one", "name": "one"},
+            {"search": "python", "max_results": 5},
+            {"channel": "@missing"},
+        ],
+        options=FetchOptions(cache_enabled=False),
+    )
+    results = fetcher.fetch_youtube_data()
+    grouped = fetcher.group_by_source(results)
+
+    assert [r.video_id for r in results] == ['a', 'b', 'c']
+    assert fetch.call_args.kwargs['video_ids'] == ['a', 'b', 'c']
+    assert fetch.call_count == 1
+    assert {name: [r.video_id for r in data] for name, data in grouped.items()} == {
+        'one': ['a', 'b'],
+        'search-python': ['b', 'c'],
+        'channel-missing': [],
+    }
+    assert list(fetcher.failed_sources) == ['channel-missing']
+
+def test_from_sources_rejects_duplicate_names():
+    with pytest.raises(YTFetcherError):
+        YTFetcher.from_sources([{"channel": "@one"}, {"channel": "@one"}])
+
+def test_duplicate_snippets_are_fetched_once(mocker: MockerFixture, sample_snippet, mock_transcript_fetcher):
+    mock_instance = MagicMock()
+    mock_instance.fetch.return_value = [sample_snippet, sample_snippet.model_copy()]
+    mocker.patch('ytfetcher._core.VideoListFetcher', return_value=mock_instance)
+
+    fetcher = YTFetcher.from_video_ids(video_ids=['id1', 'id1'], options=FetchOptions(cache_enabled=False))
+    results = fetcher.fetch_youtube_data()
+
+    assert [r.video_id for r in results] == ['id1']
+    assert mock_transcript_fetcher.call_args.kwargs['video_ids'] == ['id1']
+
+def test_later_calls_reuse_one_transcript_fetcher(mocker: MockerFixture, sample_snippet):
+    mock_instance = MagicMock()
+    mock_instance.fetch.return_value = [sample_snippet]
+    mocker.patch('ytfetcher._core.VideoListFetcher', return_value=mock_instance)
+    instances = []
+    mocker.patch.object(TranscriptFetcher, '__enter__', autospec=True, side_effect=lambda self: instances.append(self) or self)
+    close = mocker.patch.object(TranscriptFetcher, 'close')
+    fetch = mocker.patch.object(TranscriptFetcher, 'fetch', return_value=TranscriptFetchResult(
+        success=[VideoTranscript(video_id='id1', transcripts=[])], failed=[]
+    ))
+
+    with YTFetcher.from_video_ids(video_ids=['id1'], options=FetchOptions(cache_enabled=False, recovery_attempts=3)) as fetcher:
+        assert len(fetcher.fetch_transcripts()) == 1
+        assert len(fetcher.fetch_transcripts()) == 1
+
+    assert fetch.call_count == 2
+    assert len(instances) == 1
+    assert instances[0].retry_attempts == 3
+    close.assert_called_once()
+
+def test_network_errors_keep_a_delayed_retry_without_recovery():
+    fetcher = YTFetcher.from_video_ids(video_ids=['id1'], options=FetchOptions(cache_enabled=False, with_recovery=False))
+
+    with fetcher:
+        transcript_fetcher = fetcher._get_transcript_fetcher()
+
+    assert (transcript_fetcher.retry_attempts, transcript_fetcher.retry_delay, transcript_fetcher.retry_max_delay) == (1, 3.0, 8.0)
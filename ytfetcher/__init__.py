@@ -1,9 +1,33 @@
-from ._core import YTFetcher
-from .models.channel import VideoTranscript, ChannelData, DLSnippet
+from typing import TYPE_CHECKING, Any
+import importlib
+
+if TYPE_CHECKING:
+    from ._core import YTFetcher
+    from .models.channel import VideoTranscript, ChannelData, DLSnippet
 
 __all__ = [
     "YTFetcher",
     "VideoTranscript",
     "ChannelData",
     "DLSnippet"
-]
\ No newline at end of file
+]
+
+# Loaded on first access: `_core` pulls in yt-dlp and youtube_transcript_api, which would
+# otherwise dominate the startup time of every `import ytfetcher.<submodule>`.
+_LAZY_IMPORTS = {
+    "YTFetcher": "ytfetcher._core",
+    "VideoTranscript": "ytfetcher.models.channel",
+    "ChannelData": "ytfetcher.models.channel",
+    "DLSnippet": "ytfetcher.models.channel",
+}
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
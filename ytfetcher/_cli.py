@@ -1,43 +1,74 @@
 import argparse
 import ast
+import importlib
+import json
 import sys
 import logging
-from typing import Union, Callable
+from contextlib import AbstractContextManager, ExitStack
+from typing import TYPE_CHECKING, Any, Union, Callable
 from pathlib import Path
-from ytfetcher._core import YTFetcher
-from ytfetcher.config import (
-    setup_logging,
-    default_cache_path,
-    GenericProxyConfig,
-    WebshareProxyConfig,
-    HTTPConfig,
-    FetchOptions
-)
+from dataclasses import asdict
+from ytfetcher.config import setup_logging
+from ytfetcher.config.fetch_config import FetchOptions, default_cache_path
+from ytfetcher.config.http_config import HTTPConfig
+from ytfetcher.cache.base import AGE_BUCKETS, OLDEST_AGE_BUCKET
 from ytfetcher.exceptions import YTFetcherError
 from ytfetcher.models.types import FetchResult
-from ytfetcher.services.exports import TXTExporter, CSVExporter, JSONExporter, BaseExporter, DEFAULT_METADATA
-from ytfetcher.services._preview import PreviewRenderer
+from ytfetcher.services.exports import TXTExporter, CSVExporter, JSONExporter, BaseExporter, DEFAULT_METADATA, METADATA_FIELDS
+from ytfetcher.services.manifest import load_sources
 from ytfetcher import filters
+from ytfetcher.normalizers import TranscriptNormalizer
+from ytfetcher.stats import RunStats
+from ytfetcher.metrics import FetchMetrics
+from ytfetcher.profiling import RunProfiler
 from ytfetcher.utils.state import RuntimeConfig
 
 from argparse import ArgumentParser, Namespace
 
+if TYPE_CHECKING:
+    from ytfetcher._core import YTFetcher
+    from ytfetcher.services._preview import PreviewRenderer
+    from ytfetcher.services.server import serve
+    from youtube_transcript_api.proxies import GenericProxyConfig, WebshareProxyConfig
+
+# Fetch dependencies (yt-dlp, youtube_transcript_api, requests, rich, tqdm, tenacity) take most
+# of the startup time, so they are imported on first use and `--help` and `cache` stay fast.
+_LAZY_IMPORTS = {
+    "YTFetcher": "ytfetcher._core",
+    "PreviewRenderer": "ytfetcher.services._preview",
+    "serve": "ytfetcher.services.server",
+    "GenericProxyConfig": "youtube_transcript_api.proxies",
+    "WebshareProxyConfig": "youtube_transcript_api.proxies",
+}
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+def _lazy(name: str) -> Any:
+    """Returns a name from `_LAZY_IMPORTS`, importing it on first use. Honours patched module attributes."""
+    return globals()[name] if name in globals() else __getattr__(name)
+
 logger = logging.getLogger(__name__)
 
 class ConfigBuilder:
     """Helper class to build configuration objects from CLI arguments."""
 
     @staticmethod
-    def build_proxy_config(args: Namespace) -> Union[WebshareProxyConfig, GenericProxyConfig, None]:
+    def build_proxy_config(args: Namespace) -> Union["WebshareProxyConfig", "GenericProxyConfig", None]:
         if args.http_proxy or args.https_proxy:
-            return GenericProxyConfig(
+            return _lazy("GenericProxyConfig")(
                 http_url=args.http_proxy,
                 https_url=args.https_proxy,
             )
 
         if (
             args.webshare_proxy_username or args.webshare_proxy_password):
-            return WebshareProxyConfig(
+            return _lazy("WebshareProxyConfig")(
                 proxy_username=args.webshare_proxy_username,
                 proxy_password=args.webshare_proxy_password,
         )
@@ -46,11 +77,13 @@ class ConfigBuilder:
     
     @staticmethod
     def build_http_config(args: Namespace) -> HTTPConfig:
-        if args.http_headers:
-            http_config = HTTPConfig(headers=args.http_headers)
-            return http_config
-
-        return HTTPConfig()
+        return HTTPConfig(
+            headers=args.http_headers or None,
+            connect_timeout=args.connect_timeout,
+            read_timeout=args.read_timeout,
+            sessions=args.sessions,
+            pool_maxsize=args.pool_maxsize
+        )
 class YTFetcherCLI:
     """
     YTFetcherCLI
@@ -60,9 +93,11 @@ class YTFetcherCLI:
     """
     def __init__(self, args: argparse.Namespace):
         self.args = args
+        self.metrics = FetchMetrics() if getattr(args, "metrics_file", None) else None
+        self.profiler = RunProfiler() if getattr(args, "profile", False) else None
     
     def _fetch_data(
-        self, fetcher: YTFetcher
+        self, fetcher: "YTFetcher"
     ) -> FetchResult:
         """
         Dispatches to the correct fetch method based on CLI flags.
@@ -78,25 +113,142 @@ class YTFetcherCLI:
             return fetcher.fetch_snippets()
         return fetcher.fetch_youtube_data()
 
-    def _run_fetcher(self, factory_method: type[YTFetcher], **kwargs) -> None:
+    def _build_options(self) -> FetchOptions:
+        return FetchOptions(
+            http_config=ConfigBuilder.build_http_config(self.args),
+            proxy_config=ConfigBuilder.build_proxy_config(self.args),
+            languages=self.args.languages,
+            manually_created=self.args.manually_created,
+            normalizer=TranscriptNormalizer.noop() if self.args.raw_text else TranscriptNormalizer.default(),
+            filters=self._get_active_filters(),
+            cache_enabled=not self.args.no_cache,
+            cache_path=self.args.cache_path,
+            cache_backend=self.args.cache_backend,
+            cache_shards=self.args.cache_shards,
+            cache_ttl=self.args.cache_ttl,
+            max_concurrent_requests=self.args.max_concurrency,
+            metrics=self.metrics,
+            profile=self.profiler
+        )
+
+    def _run_fetcher(self, factory_method: Callable[..., "YTFetcher"], **kwargs) -> None:
         fetcher = factory_method(
+            options=self._build_options(),
+            **kwargs
+        )
+        try:
+            data = self._fetch_data(fetcher=fetcher)
+        finally:
+            fetcher.close()
+        logging.info('Fetched all channel data.')
+
+        with self._export_phase(fetcher):
+            self._handle_output(data=data)
+
+        self._write_run_stats(fetcher)
+        self._write_metrics()
+        self._write_profile()
+
+    def _run_server(self) -> None:
+        _lazy("serve")(
+            host=self.args.host,
+            port=self.args.port,
             options=FetchOptions(
                 http_config=ConfigBuilder.build_http_config(self.args),
                 proxy_config=ConfigBuilder.build_proxy_config(self.args),
                 languages=self.args.languages,
                 manually_created=self.args.manually_created,
-                filters=self._get_active_filters(),
+                normalizer=TranscriptNormalizer.noop() if self.args.raw_text else TranscriptNormalizer.default(),
                 cache_enabled=not self.args.no_cache,
                 cache_path=self.args.cache_path,
+                cache_backend=self.args.cache_backend,
+                cache_shards=self.args.cache_shards,
                 cache_ttl=self.args.cache_ttl,
                 max_concurrent_requests=self.args.max_concurrency
-            ),
-            **kwargs
+            )
         )
-        data = self._fetch_data(fetcher=fetcher)
-        logging.info('Fetched all channel data.')
 
-        self._handle_output(data=data)
+    def _run_batch(self) -> None:
+        sources = load_sources(self.args.manifest)
+        fetcher = _lazy("YTFetcher").from_sources(
+            sources=sources,
+            options=self._build_options(),
+            max_workers=self.args.source_concurrency
+        )
+        try:
+            data = self._fetch_data(fetcher=fetcher)
+        finally:
+            fetcher.close()
+        grouped = fetcher.group_by_source(data)
+        logging.info('Fetched data for %d sources.', len(grouped) - len(fetcher.failed_sources))
+
+        with self._export_phase(fetcher):
+            for name, source_data in grouped.items():
+                if not source_data:
+                    if name not in fetcher.failed_sources:
+                        logging.warning('No data for source %s, skipping output.', name)
+                    continue
+                if self.args.stdout:
+                    print(source_data)
+                if self.args.format:
+                    self._export(source_data, filename=name)
+
+        if self.args.format:
+            logging.info('Per-source data exported as %s to %s', self.args.format, self.args.output_dir)
+
+        if fetcher.failed_sources:
+            logging.warning('%d sources failed: %s', len(fetcher.failed_sources), ', '.join(fetcher.failed_sources))
+
+        self._write_run_stats(fetcher)
+        self._write_metrics()
+        self._write_profile()
+
+    def _export_phase(self, fetcher: "YTFetcher") -> AbstractContextManager:
+        phase = ExitStack()
+        stats = fetcher.last_run_stats
+        if isinstance(stats, RunStats):
+            phase.enter_context(stats.phase("export"))
+        if self.profiler is not None:
+            phase.enter_context(self.profiler.phase("export"))
+        return phase
+
+    def _write_run_stats(self, fetcher: "YTFetcher") -> None:
+        """
+        Writes the run stats to the `--stats-json` path, or to stdout for '-'.
+        """
+        stats = fetcher.last_run_stats
+        if not self.args.stats_json or not isinstance(stats, RunStats):
+            return
+
+        stats.finish()
+        if self.args.stats_json == '-':
+            print(stats.to_json())
+            return
+
+        Path(self.args.stats_json).write_text(stats.to_json(), encoding='utf-8')
+        logging.info('Run stats written to %s', self.args.stats_json)
+
+    def _write_metrics(self) -> None:
+        """
+        Writes OpenMetrics text to the `--metrics-file` path, e.g. for the node_exporter textfile collector.
+        """
+        if self.metrics is None:
+            return
+
+        self.metrics.write_textfile(self.args.metrics_file)
+        logging.info('Metrics written to %s', self.args.metrics_file)
+
+    def _write_profile(self) -> None:
+        """
+        Writes the `--profile` report to `<output-dir>/<filename>.profile/`, next to the export.
+        """
+        if self.profiler is None:
+            return
+
+        directory = Path(self.args.output_dir) / f"{self.args.filename}.profile"
+        self.profiler.write(directory)
+        logging.info('Profile written to %s', directory)
+        print(self.profiler.summary(top=0), file=sys.stderr)
     
     def _handle_output(self, data: FetchResult) -> None:
         should_show_preview = (
@@ -106,7 +258,7 @@ class YTFetcherCLI:
         )
 
         if should_show_preview:
-            PreviewRenderer().render(data=data)
+            _lazy("PreviewRenderer")().render(data=data)
             logging.info('Showing preview (5 lines)')
             if not self.args.format:
                 logging.warning('Use --stdout or --format to see full structured output')
@@ -120,7 +272,7 @@ class YTFetcherCLI:
         """
         Get all active filters based on CLI arguments.
         """
-        active_filters = []
+        active_filters: list[Callable] = []
 
         if self.args.min_views:
             active_filters.append(filters.min_views(self.args.min_views))
@@ -137,6 +289,15 @@ class YTFetcherCLI:
         if self.args.includes_title:
             active_filters.append(filters.filter_by_title(self.args.includes_title))
 
+        if self.args.published_after:
+            active_filters.append(filters.published_after(self.args.published_after))
+
+        if self.args.published_before:
+            active_filters.append(filters.published_before(self.args.published_before))
+
+        if self.args.where:
+            active_filters.append(filters.where(self.args.where))
+
         return active_filters
 
     @staticmethod
@@ -156,12 +317,12 @@ class YTFetcherCLI:
         
         return exporter_class
 
-    def _export(self, channel_data: FetchResult) -> None:
+    def _export(self, channel_data: FetchResult, filename: str | None = None) -> None:
         exporter_class = self._get_exporter(self.args.format)
         exporter = exporter_class(
             channel_data=channel_data,
             output_dir=self.args.output_dir,
-            filename=self.args.filename,
+            filename=filename or self.args.filename,
             allowed_metadata_list=self.args.metadata,
             timing=not self.args.no_timing
         )
@@ -169,6 +330,7 @@ class YTFetcherCLI:
         exporter.write()
     
     def run(self):
+        YTFetcher = _lazy("YTFetcher")
         match self.args.command:
             case 'channel':
                 logging.info('Starting to fetch from channel: %s', self.args.channel)
@@ -202,6 +364,13 @@ class YTFetcherCLI:
                     max_results=self.args.max_results,
                 )
 
+            case 'serve':
+                self._run_server()
+
+            case 'batch':
+                logging.info('Starting batch run from manifest: %s', self.args.manifest)
+                self._run_batch()
+
             case _:
                 raise ValueError(f"Unknown method: {self.args.command}")
 
@@ -236,10 +405,41 @@ def create_parser() -> argparse.ArgumentParser:
     parser_search.add_argument("-m", "--max-results", type=int, default=20, help="Maximum videos to fetch.")
     _create_common_arguments(parser_search)
 
+    # Batch parsers
+    parser_batch = subparsers.add_parser("batch", help="Fetch data for many sources listed in a manifest file.")
+    parser_batch.add_argument("manifest", type=str, help="Path to a .jsonl, .json or .yaml manifest. One output file is written per source.")
+    parser_batch.add_argument("--source-concurrency", type=int, default=4, help="Number of sources listed concurrently.")
+    _create_common_arguments(parser_batch)
+
+    # Server parsers
+    parser_serve = subparsers.add_parser("serve", help="Run a long-lived HTTP service with warm connection pools and cache.")
+    _create_serve_arguments(parser_serve)
+
     # Cache parsers
-    parser_cache = subparsers.add_parser("cache", help="Cache Options")
+    parser_cache = subparsers.add_parser("cache", help="Inspect and maintain the transcript cache.")
     parser_cache.add_argument("--clean", action="store_true", help="Clean cache file.")
-    parser_cache.add_argument("--cache-path", default=default_cache_path(), help="Custom cache file path.")
+    _create_cache_location_arguments(parser_cache)
+
+    cache_commands = parser_cache.add_subparsers(dest="cache_command")
+
+    parser_purge = cache_commands.add_parser("purge", help="Remove cached entries older than the TTL in small batches.")
+    parser_purge.add_argument("--older-than", "--cache-ttl", dest="cache_ttl", type=int, default=7, help="Remove entries older than this many days.")
+    _create_cache_location_arguments(parser_purge, inherited=True)
+
+    parser_vacuum = cache_commands.add_parser("vacuum", help="Reclaim disk space left by deleted cache entries.")
+    _create_cache_location_arguments(parser_vacuum, inherited=True)
+
+    parser_stats = cache_commands.add_parser("stats", help="Show entry counts per cache key, failures, size on disk and entry ages.")
+    parser_stats.add_argument("--json", action="store_true", help="Print stats as JSON.")
+    _create_cache_location_arguments(parser_stats, inherited=True)
+
+    parser_export = cache_commands.add_parser("export", help="Write all cache entries to a portable archive.")
+    parser_export.add_argument("archive", type=str, help="Archive path. Use a .gz suffix to compress.")
+    _create_cache_location_arguments(parser_export, inherited=True)
+
+    parser_import = cache_commands.add_parser("import", help="Load a cache archive. Existing entries are only replaced by newer ones.")
+    parser_import.add_argument("archive", type=str, help="Archive written by `ytfetcher cache export`.")
+    _create_cache_location_arguments(parser_import, inherited=True)
 
     return parser
 
@@ -255,6 +455,7 @@ def _create_common_arguments(parser: ArgumentParser) -> None:
     transcript_group.add_argument("--no-timing", action="store_true", help="Do not write transcript timings like 'start', 'duration'")
     transcript_group.add_argument("--languages", nargs="+", default=None, help="List of language codes in priority order (e.g. en de fr). Defaults to None.")
     transcript_group.add_argument("--manually-created", action="store_true", help="Fetch only videos that has manually created transcripts.")
+    transcript_group.add_argument("--raw-text", action="store_true", help="Keep transcript text as-is, without removing [Music], '>>' markers or extra whitespace.")
 
     fetch_mode_group = parser.add_mutually_exclusive_group()
     fetch_mode_group.add_argument("-c", "--comments", action="store_true", help="Add top comments to the metadata alongside with transcripts.")
@@ -272,51 +473,159 @@ def _create_common_arguments(parser: ArgumentParser) -> None:
     filter_group.add_argument("--min-duration", type=int, help="Minimum video duration to process.")
     filter_group.add_argument("--max-duration", type=int, help="Maximum video duration to process.")
     filter_group.add_argument("--includes-title", type=str, help="Filter by video title.")
+    filter_group.add_argument("--published-after", type=str, metavar="DATE", help="Only videos uploaded on or after DATE (YYYY-MM-DD).")
+    filter_group.add_argument("--published-before", type=str, metavar="DATE", help="Only videos uploaded before DATE (YYYY-MM-DD).")
+    filter_group.add_argument("--where", type=str, help='Filter expression, e.g. \'views>=1000 and duration<600 and title~"python"\'.')
 
     export_group = parser.add_argument_group("Exporter Options")
     export_group.add_argument("-f", "--format", choices=["txt", "json", "csv"], default=None, help="Export format")
-    export_group.add_argument("--metadata", nargs="+", default=DEFAULT_METADATA, choices=DEFAULT_METADATA, help="Allowed metadata")
+    export_group.add_argument("--metadata", nargs="+", default=DEFAULT_METADATA, choices=METADATA_FIELDS, help="Allowed metadata. upload_date is approximate for channel and playlist listings and is only exported when listed.")
     export_group.add_argument("-o", "--output-dir", default=".", help="Output directory for data")
     export_group.add_argument("--filename", default="data", help="Decide filename to be exported.")
 
+    _create_network_arguments(parser)
+    _create_cache_arguments(parser)
+
+    output_group = parser.add_argument_group("Output Options")
+    output_group.add_argument("--stdout", action="store_true", help="Dump data to console.")
+    output_group.add_argument("--verbose", action="store_true", help="Show logs.")
+    output_group.add_argument("--metrics-file", type=str, metavar="PATH", default=None, help="Write OpenMetrics counters and histograms to PATH after the run, e.g. for the node_exporter textfile collector.")
+    output_group.add_argument("--profile", action="store_true", help="Profile every phase and worker thread and write pstats, collapsed stacks and a summary to <output-dir>/<filename>.profile/.")
+    output_group.add_argument("--stats-json", type=str, metavar="PATH", default=None, help="Write per-phase timings, request counts, cache hits and failure reasons as JSON to PATH ('-' for stdout).")
+
+def _create_network_arguments(parser: ArgumentParser) -> None:
     net_group = parser.add_argument_group("Network Options")
     net_group.add_argument("--max-concurrency", type=int, default=20, help="Maximum number of concurrent network requests to make when fetching transcripts.")
     net_group.add_argument("--http-headers", type=ast.literal_eval, help="Custom http headers.")
+    net_group.add_argument("--sessions", type=int, default=1, help="Number of HTTP sessions, each with its own cookies, connections and browser headers, to spread transcript requests over.")
+    net_group.add_argument("--pool-maxsize", type=int, default=None, help="Connections kept open per session. Defaults to the number of workers sharing a session.")
+    net_group.add_argument("--connect-timeout", type=float, default=10.0, help="Seconds to wait for a connection to YouTube.")
+    net_group.add_argument("--read-timeout", type=float, default=10.0, help="Seconds to wait for YouTube between bytes of a response.")
     net_group.add_argument("--webshare-proxy-username", default=None, type=str, help='Specify your Webshare "Proxy Username" found at https://dashboard.webshare.io/proxy/settings')
     net_group.add_argument("--webshare-proxy-password", default=None, type=str, help='Specify your Webshare "Proxy Password" found at https://dashboard.webshare.io/proxy/settings')
     net_group.add_argument("--http-proxy", default="", metavar="URL", help="Use the specified HTTP proxy.")
     net_group.add_argument("--https-proxy", default="", metavar="URL", help="Use the specified HTTPS proxy.")
 
+def _create_cache_location_arguments(parser: ArgumentParser, inherited: bool = False) -> None:
+    """
+    Creates the arguments that locate an existing cache for `ytfetcher cache` commands.
+
+    With `inherited`, defaults are suppressed so values given before a `cache` subcommand are kept.
+    """
+    def default(value):
+        return argparse.SUPPRESS if inherited else value
+
+    parser.add_argument("--cache-path", default=default(default_cache_path()), help="Custom cache file path.")
+    parser.add_argument("--cache-backend", choices=["sqlite", "sharded-sqlite", "filesystem"], default=default("sqlite"), help="Cache storage to operate on.")
+    parser.add_argument("--cache-shards", type=int, default=default(8), help="Number of SQLite files for the sharded-sqlite cache backend.")
+
+def _create_cache_arguments(parser: ArgumentParser) -> None:
     cache_group = parser.add_argument_group("Cache Options")
     cache_group.add_argument("--no-cache", action="store_true", help="Disable SQLite cache for transcripts.")
     cache_group.add_argument("--cache-path", default=default_cache_path(), help="Path to ytfetcher cache file.")
+    cache_group.add_argument("--cache-backend", choices=["sqlite", "sharded-sqlite", "filesystem"], default="sqlite", help="Cache storage. 'sharded-sqlite' spreads entries over several SQLite files for parallel runs; 'filesystem' stores one JSON file per entry and can be shared by several machines.")
+    cache_group.add_argument("--cache-shards", type=int, default=8, help="Number of SQLite files for the sharded-sqlite cache backend.")
     cache_group.add_argument("--cache-ttl", type=int, default=7, help="Cache TTL in days. Use 0 to disable expiration.")
 
+def _create_serve_arguments(parser: ArgumentParser) -> None:
+    """
+    Creates arguments for the HTTP service. Filters and export options are passed per request instead.
+    """
+    server_group = parser.add_argument_group("Server Options")
+    server_group.add_argument("--host", default="127.0.0.1", help="Interface to bind. Defaults to 127.0.0.1.")
+    server_group.add_argument("--port", type=int, default=8765, help="Port to bind. Defaults to 8765.")
+
+    transcript_group = parser.add_argument_group("Transcript Options")
+    transcript_group.add_argument("--languages", nargs="+", default=None, help="Default language codes in priority order, overridable per request.")
+    transcript_group.add_argument("--manually-created", action="store_true", help="Only fetch manually created transcripts unless a request overrides it.")
+    transcript_group.add_argument("--raw-text", action="store_true", help="Keep transcript text as-is, without removing [Music], '>>' markers or extra whitespace.")
+
+    _create_network_arguments(parser)
+    _create_cache_arguments(parser)
+
     output_group = parser.add_argument_group("Output Options")
-    output_group.add_argument("--stdout", action="store_true", help="Dump data to console.")
     output_group.add_argument("--verbose", action="store_true", help="Show logs.")
 
-def _clear_cache(cache_path: str | None) -> None:
-    from ytfetcher.cache.sqlite_cache import SQLiteCache
-    setup_logging()
+def _open_cache(cache_path: str | None, cache_backend: str = "sqlite", cache_shards: int = 8, create: bool = False):
+    from ytfetcher.cache import create_cache
 
     resolved_path = Path(cache_path or default_cache_path()).expanduser()
-    db_file = resolved_path / "cache.sqlite3"
+    location = resolved_path / {
+        "filesystem": "transcripts",
+        "sharded-sqlite": f"shards-{cache_shards}",
+    }.get(cache_backend, "cache.sqlite3")
+
+    if not create and not location.exists():
+        logging.warning(f"No cache found at: {location}")
+        return None
 
-    if not db_file.exists():
-        logging.warning(f"No cache found at: {db_file}")
+    # ttl=0 skips the automatic purge on open; maintenance commands pass their own thresholds.
+    return create_cache(FetchOptions(
+        cache_path=str(resolved_path),
+        cache_backend=cache_backend,  # type: ignore[arg-type]
+        cache_shards=cache_shards,
+        cache_ttl=0
+    ))
+
+def _print_cache_stats(stats, as_json: bool = False) -> None:
+    if as_json:
+        print(json.dumps({**asdict(stats), "avg_payload_bytes": stats.avg_payload_bytes}, indent=2))
         return
 
-    cache = SQLiteCache(str(resolved_path))
-    cache.clear()
+    print(f"Backend:          {stats.backend} ({stats.location})")
+    print(f"Entries:          {stats.entries} ({stats.successes} transcripts, {stats.failures} failures)")
+    print(f"Size on disk:     {stats.size_bytes / 1_048_576:.1f} MiB")
+    print(f"Avg payload size: {stats.avg_payload_bytes / 1024:.1f} KiB")
+    print("Entries by age:")
+    for label in [label for _, label in AGE_BUCKETS] + [OLDEST_AGE_BUCKET]:
+        print(f"  {label:<8} {stats.age_histogram.get(label, 0)}")
+    print("Entries by cache key:")
+    for key, count in sorted(stats.by_cache_key.items(), key=lambda item: -item[1]):
+        print(f"  {count:>8}  {key}")
+
+def _run_cache_command(args: Namespace) -> None:
+    from ytfetcher.cache import export_cache, import_cache
+    setup_logging()
+
+    if args.cache_command is None and not args.clean:
+        return
+
+    cache = _open_cache(
+        cache_path=args.cache_path,
+        cache_backend=args.cache_backend,
+        cache_shards=args.cache_shards,
+        create=args.cache_command == "import"
+    )
+    if cache is None:
+        return
 
-    logging.info(f'Cache cleared at: {cache.db_file}')
+    try:
+        match args.cache_command:
+            case "purge":
+                removed = cache.purge_expired(older_than_days=args.cache_ttl)
+                logging.info(f'Removed {removed} cache entries older than {args.cache_ttl} days.')
+            case "vacuum":
+                cache.vacuum()
+                logging.info(f'Cache vacuumed: {cache.stats().size_bytes / 1_048_576:.1f} MiB on disk.')
+            case "stats":
+                _print_cache_stats(cache.stats(), as_json=args.json)
+            case "export":
+                exported = export_cache(cache, args.archive)
+                logging.info(f'Exported {exported} cache entries to {args.archive}')
+            case "import":
+                imported = import_cache(cache, args.archive)
+                logging.info(f'Imported {imported} cache entries from {args.archive}')
+            case _:
+                cache.clear()
+                logging.info(f'Cache cleared at: {args.cache_path}')
+    except YTFetcherError as e:
+        logging.error(str(e))
+        raise SystemExit(1)
 
 def main():
     args = parse_args(sys.argv[1:])
     if args.command == 'cache':
-        if args.clean:
-            _clear_cache(cache_path=args.cache_path)
+        _run_cache_command(args)
         return
     
     setup_logging(args.verbose)
@@ -1,5 +1,7 @@
 import logging
-from ytfetcher.models.channel import ChannelData, DLSnippet, VideoComments, VideoTranscript, FailedTranscript
+from ytfetcher.models.channel import ChannelData, DLSnippet, VideoComments, VideoTranscript, FailedTranscript, TranscriptFetchResult
+from ytfetcher.models.source import Source
+from ytfetcher.models.types import FetchResult
 from ytfetcher._transcript_fetcher import TranscriptFetcher
 from ytfetcher._youtube_dl import (
     ChannelFetcher,
@@ -7,16 +9,27 @@ from ytfetcher._youtube_dl import (
     PlaylistFetcher,
     SearchFetcher,
     CommentFetcher,
+    MultiSourceFetcher,
     BaseYoutubeDLFetcher
 )
 from ytfetcher.config.fetch_config import FetchOptions
-from ytfetcher.cache import SQLiteCache
-from ytfetcher.utils.constants import RETRYABLE_ERRORS
-from typing import Literal
+from ytfetcher import filters
+from ytfetcher.cache import CacheBackend, WriteBehindCache, build_transcript_cache_key, create_cache
+from ytfetcher.exceptions import YTFetcherError
+from ytfetcher.stats import RunStats
+from ytfetcher.events import FetchEvents
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Iterator, Literal, Sequence
 import time
 
 logger = logging.getLogger(__name__)
 
+# Without recovery, network errors still get one short delayed retry, close to the
+# 3 attempts with a 3-8 second backoff the in-worker retry used to make.
+_NETWORK_RETRY_ATTEMPTS = 1
+_NETWORK_RETRY_DELAY = 3.0
+_NETWORK_RETRY_MAX_DELAY = 8.0
+
 class YTFetcher:
     """
     YTFetcher is a high-level interface for fetching YouTube video metadata and transcripts.
@@ -26,10 +39,15 @@ class YTFetcher:
     - From a playlist ID (via `from_playlist_id`)
     - From a list of specific video IDs (via `from_video_ids`)
     - From a search query (via `from_search`)
+    - From many of the above at once (via `from_sources`)
 
     Internally, it uses the yt-dlp to retrieve video snippets and metadata,
     and the `youtube_transcript_api` (with optional proxy support) to fetch transcripts.
 
+    HTTP sessions, connection pools and transcript API clients are created on the first
+    transcript fetch and reused by retries and later fetch calls. Use the fetcher as
+    a context manager, or call `close()`, to release them when done.
+
     Args:
         youtube_dl_fetcher (BaseYoutubeDLFetcher) Relevant yt-dlp fetcher for example `ChannelFetcher`.
         options (FetchOptions | None) Optional fetcher options for controlling data and requests.
@@ -44,12 +62,21 @@ class YTFetcher:
         self.options = options or FetchOptions()
 
         self._snippets: list[DLSnippet] | None = None
-        self._cache: SQLiteCache | None = (
-            SQLiteCache(cache_dir=self.options.cache_path, ttl=self.options.cache_ttl)
-            if self.options.cache_enabled
-            else None
-        )
+        self._cache: CacheBackend | None = create_cache(self.options)
         self._failed_transcripts: list[FailedTranscript] = []
+
+        self.last_run_stats: RunStats | None = None
+        """Timings and counters of the latest fetch call, see `RunStats`."""
+        self._stats = RunStats()
+        self._events = self.options.events or FetchEvents()
+        self._transcript_fetcher: TranscriptFetcher | None = None
+        self._resources = ExitStack()
+
+        if self.options.filters:
+            self._youtube_dl.push_down_filters(self.options.filters)
+
+        self._youtube_dl.attach_metrics(self.options.metrics)
+        self._youtube_dl.attach_profiler(self.options.profile)
             
     @classmethod
     def from_channel(
@@ -65,6 +92,7 @@ class YTFetcher:
         Args:
             channel_handle (str): The handle or ID of the YouTube channel.
             max_results (int): The maximum number of videos to retrieve from the channel. 
+                When `options.filters` are set, this counts videos matching the filters.
             tab (Literal): The specific channel section to target. 
                 Choose from 'videos', 'shorts', or 'streams'. Defaults to 'videos'.
             options (FetchOptions): Advanced settings for the fetcher.
@@ -104,6 +132,7 @@ class YTFetcher:
         Args:
             playlist_id (str): Youtube playlist id.
             max_results (int): The maximum number of videos to retrieve from the playlist. 
+                When `options.filters` are set, this counts videos matching the filters.
             options (FetchOptions): Advanced settings for the fetcher.
         """
         return cls(
@@ -131,6 +160,85 @@ class YTFetcher:
             options=options
         )
 
+    @classmethod
+    def from_sources(
+        cls,
+        sources: Sequence[Source | dict[str, Any]],
+        options: FetchOptions | None = None,
+        max_workers: int = 4
+    ) -> "YTFetcher":
+        """
+        Initialize a fetcher that runs many channels, playlists, searches and video lists in one process.
+
+        Sources are listed concurrently and merged, so a video listed by several sources is
+        fetched only once while the cache, transcript pool and request limits are shared.
+        Use `group_by_source` to split results back into per-source lists.
+
+        Args:
+            sources (Sequence[Source | dict]): `Source` objects or their manifest shorthand,
+                e.g. `{"channel": "@TheOffice", "max_results": 50}`. Names must be unique.
+            options (FetchOptions): Advanced settings for the fetcher.
+            max_workers (int): Number of sources listed concurrently. Defaults to 4.
+        """
+        parsed = [source if isinstance(source, Source) else Source.model_validate(source) for source in sources]
+
+        fetchers: dict[str, BaseYoutubeDLFetcher] = {}
+        for source in parsed:
+            if source.name in fetchers:
+                raise YTFetcherError(f"Duplicate source name '{source.name}', set a unique 'name' for each source.")
+            fetchers[source.name] = cls._create_source_fetcher(source)
+
+        return cls(
+            youtube_dl_fetcher=MultiSourceFetcher(sources=fetchers, max_workers=max_workers),
+            options=options
+        )
+
+    @staticmethod
+    def _create_source_fetcher(source: Source) -> BaseYoutubeDLFetcher:
+        target = source.target
+        match source.kind:
+            case 'channel':
+                return ChannelFetcher(channel_handle=str(target), max_results=source.max_results, tab=source.tab)
+            case 'playlist':
+                return PlaylistFetcher(playlist_id=str(target), max_results=source.max_results)
+            case 'search':
+                return SearchFetcher(query=str(target), max_results=source.max_results or 20)
+            case 'video':
+                return VideoListFetcher(video_ids=list(target))
+
+    def group_by_source(self, results: FetchResult) -> dict[str, FetchResult]:
+        """
+        Splits results of a fetcher created with `from_sources` into per-source lists.
+
+        A video listed by several sources appears in each of their lists. Sources keep their
+        listing order, and sources that failed to list map to an empty list.
+
+        Args:
+            results: Output of any fetch method, e.g. `fetch_youtube_data()` or `fetch_transcripts()`.
+
+        Returns:
+            dict[str, list]: Results keyed by source name, in source order.
+        """
+        if not isinstance(self._youtube_dl, MultiSourceFetcher):
+            raise YTFetcherError("group_by_source is only available for fetchers created with from_sources.")
+
+        self._get_snippets()
+        result_map: dict[str, Any] = {result.video_id: result for result in results}
+
+        return {
+            name: [result_map[vid] for vid in self._youtube_dl.source_video_ids.get(name, []) if vid in result_map]
+            for name in self._youtube_dl.sources
+        }
+
+    @property
+    def failed_sources(self) -> dict[str, str]:
+        """
+        Sources of a `from_sources` fetcher that could not be listed, mapped to their error message.
+        """
+        if not isinstance(self._youtube_dl, MultiSourceFetcher):
+            return {}
+        return self._youtube_dl.failed_sources.copy()
+
     def fetch_youtube_data(self) -> list[ChannelData]:
         """
         Synchronously fetches transcript and metadata for all videos retrieved from the channel or video IDs.
@@ -138,13 +246,14 @@ class YTFetcher:
         Returns:
             list[ChannelData]: A list of objects containing transcript text and associated metadata.
         """
-        snippets = self._get_snippets()
-        transcripts = self._get_transcripts()
-        
-        return self._build_response(
-            snippets=snippets,
-            transcripts=transcripts
-        )
+        with self._track_run():
+            snippets = self._get_snippets()
+            transcripts = self._get_transcripts()
+
+            return self._build_response(
+                snippets=snippets,
+                transcripts=transcripts
+            )
     
     def fetch_with_comments(self, max_comments: int = 20, sort: Literal['top', 'new'] = ('top')) -> list[ChannelData]:
         """
@@ -165,17 +274,16 @@ class YTFetcher:
                 video metadata, and the requested comments.
         """
 
-        transcripts = self._get_transcripts()
-        snippets = self._get_snippets()
-        
-        comment_fetcher = CommentFetcher(max_comments=max_comments, video_ids=self._get_video_ids(), sort=sort)
-        full_comments: list[VideoComments] = comment_fetcher.fetch()
+        with self._track_run():
+            transcripts = self._get_transcripts()
+            snippets = self._get_snippets()
+            full_comments = self._get_comments(max_comments=max_comments, sort=sort)
 
-        return self._build_response(
-            transcripts=transcripts,
-            snippets=snippets,
-            comments=full_comments
-        )
+            return self._build_response(
+                transcripts=transcripts,
+                snippets=snippets,
+                comments=full_comments
+            )
     
     def fetch_comments(self, max_comments: int = 20, sort: Literal['top', 'new'] = ('top')) -> list[VideoComments]:
         """
@@ -195,8 +303,8 @@ class YTFetcher:
             list[VideoComments]: A list of objects containing the video identifiers 
                 and their associated comment data.
         """
-        comment_fetcher = CommentFetcher(max_comments=max_comments, video_ids=self._get_video_ids(), sort=sort)
-        return comment_fetcher.fetch()
+        with self._track_run():
+            return self._get_comments(max_comments=max_comments, sort=sort)
 
     def fetch_transcripts(self) -> list[VideoTranscript]:
         """
@@ -205,8 +313,8 @@ class YTFetcher:
         Returns:
             list[VideoTranscript]: A list of transcript objects.
         """
-        
-        return self._get_transcripts()
+        with self._track_run():
+            return self._get_transcripts()
     
     def fetch_snippets(self) -> list[DLSnippet]:
         """
@@ -215,27 +323,95 @@ class YTFetcher:
         Returns:
             list[DLSnippet]: A list of snippet objects containing video metadata and IDs.
         """
-
-        return self._get_snippets()
+        with self._track_run():
+            return self._get_snippets()
     
     def get_failed_transcripts(self) -> list[FailedTranscript]:
         return self._failed_transcripts.copy()
 
+    def close(self) -> None:
+        """
+        Closes the HTTP sessions used for transcripts. A later fetch call opens new ones.
+        """
+        self._resources.close()
+        self._transcript_fetcher = None
+
+    def __enter__(self) -> "YTFetcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @contextmanager
+    def _track_run(self) -> Iterator[RunStats]:
+        """
+        Collects the stats of one public fetch call and publishes them as `last_run_stats`.
+        """
+        stats = RunStats()
+        self._stats = self.last_run_stats = stats
+        self._youtube_dl.attach_stats(stats)
+        try:
+            yield stats
+        finally:
+            stats.finish()
+            self._youtube_dl.attach_stats(None)
+            self._stats = RunStats()
+
+    @contextmanager
+    def _phase(self, name: str) -> Iterator[None]:
+        """
+        Times phase `name` in the run stats, profiles it if `options.profile` is set and
+        emits `on_phase_end` when it ends.
+        """
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                stack.enter_context(self._stats.phase(name))
+                if self.options.profile is not None:
+                    stack.enter_context(self.options.profile.phase(name))
+                yield
+        finally:
+            self._events.emit("on_phase_end", name, time.perf_counter() - start)
+
     def _get_snippets(self) -> list[DLSnippet]:
         if self._snippets is None:
-            snippets = self._youtube_dl.fetch()
-            self._snippets = self._apply_filters(snippets)
+            with self._phase("listing"):
+                snippets = self._dedupe_snippets(self._youtube_dl.fetch())
+                self._snippets = self._apply_filters(snippets)
+            self._events.emit("on_snippets_listed", self._snippets.copy())
 
+        self._stats.videos = len(self._snippets)
         return self._snippets
+
+    def _get_comments(self, max_comments: int, sort: Literal['top', 'new']) -> list[VideoComments]:
+        comment_fetcher = CommentFetcher(max_comments=max_comments, video_ids=self._get_video_ids(), sort=sort)
+        comment_fetcher.attach_stats(self._stats)
+        comment_fetcher.attach_metrics(self.options.metrics)
+        comment_fetcher.attach_profiler(self.options.profile)
+
+        with self._phase("comments"):
+            return comment_fetcher.fetch()
     
+    @staticmethod
+    def _dedupe_snippets(snippets: list[DLSnippet]) -> list[DLSnippet]:
+        """
+        Keeps the first snippet of every video so each video is fetched at most once per run.
+        """
+        unique: dict[str, DLSnippet] = {}
+        for snippet in snippets:
+            unique.setdefault(snippet.video_id, snippet)
+
+        if len(unique) < len(snippets):
+            logger.info(f'Skipped {len(snippets) - len(unique)} duplicate videos.')
+
+        return list(unique.values())
+
     def _apply_filters(self, snippets: list[DLSnippet]) -> list[DLSnippet]:
         if not self.options.filters:
             return snippets
         
-        filtered_snippets = [
-            snippet for snippet in snippets
-            if all(filter(snippet) for filter in self.options.filters)
-        ]
+        predicate = filters.combine(self.options.filters)
+        filtered_snippets = [snippet for snippet in snippets if predicate(snippet)]
 
         if not filtered_snippets:
             logger.warning('Could not find any videos for the current filters.')
@@ -251,20 +427,65 @@ class YTFetcher:
     def _get_transcripts(self) -> list[VideoTranscript]:
         video_ids = self._get_video_ids()
         if self._cache:
-            return self._get_or_fetch_transcripts(video_ids=video_ids)
-
-        succeeded, failed = self._fetch_with_recovery_pass(video_ids=video_ids)
-        self._failed_transcripts.extend(failed)
-        return succeeded
-    def _create_transcript_fetcher(self, video_ids: list[str]) -> TranscriptFetcher:
-        return TranscriptFetcher(
-            video_ids=video_ids,
-            http_config=self.options.http_config,
-            proxy_config=self.options.proxy_config,
-            languages=self.options.languages,
-            manually_created=self.options.manually_created,
-            max_concurrent_requests=self.options.max_concurrent_requests
-        )
+            transcripts = self._get_or_fetch_transcripts(video_ids=video_ids)
+        else:
+            transcripts, failed = self._fetch_with_recovery(video_ids=video_ids)
+            self._add_failures(failed)
+
+        self._stats.transcripts = len(transcripts)
+        return transcripts
+
+    def _add_failures(self, failures: list[FailedTranscript]) -> None:
+        self._failed_transcripts.extend(failures)
+        for failure in failures:
+            self._stats.record_failure(failure.reason)
+
+    def _get_transcript_fetcher(self) -> TranscriptFetcher:
+        """
+        Returns the transcript fetcher shared by all fetch calls, creating it on first use.
+        """
+        if self._transcript_fetcher is None:
+            self._transcript_fetcher = self._resources.enter_context(TranscriptFetcher(
+                video_ids=[],
+                http_config=self.options.http_config,
+                proxy_config=self.options.proxy_config,
+                languages=self.options.languages,
+                manually_created=self.options.manually_created,
+                max_concurrent_requests=self.options.max_concurrent_requests,
+                normalizer=self.options.normalizer,
+                strict_validation=self.options.strict_validation,
+                compact_transcripts=self.options.compact_transcripts,
+                metrics=self.options.metrics,
+                profiler=self.options.profile,
+                retry_attempts=self.options.recovery_attempts if self.options.with_recovery else _NETWORK_RETRY_ATTEMPTS,
+                retry_delay=self.options.recovery_delay if self.options.with_recovery else _NETWORK_RETRY_DELAY,
+                retry_max_delay=self.options.recovery_max_delay if self.options.with_recovery else _NETWORK_RETRY_MAX_DELAY
+            ))
+
+        self._transcript_fetcher.stats = self._stats
+        return self._transcript_fetcher
+
+    def _fetch_transcript_batch(
+        self,
+        video_ids: list[str],
+        on_result: Callable[[VideoTranscript | FailedTranscript], None] | None = None
+    ) -> TranscriptFetchResult:
+        ip_blocked = False
+
+        def report(result: VideoTranscript | FailedTranscript) -> None:
+            nonlocal ip_blocked
+            if isinstance(result, VideoTranscript):
+                self._events.emit("on_transcript_done", result)
+            else:
+                if result.reason == "IpBlocked" and not ip_blocked:
+                    ip_blocked = True
+                    self._events.emit("on_ip_blocked", result)
+                self._events.emit("on_failure", result)
+
+            if on_result is not None:
+                on_result(result)
+
+        return self._get_transcript_fetcher().fetch(video_ids=video_ids, on_result=report)
     
     def _get_video_ids(self) -> list[str]:
         """
@@ -285,18 +506,32 @@ class YTFetcher:
 
         assert self._cache is not None
 
-        cache_key = SQLiteCache.build_transcript_cache_key(
+        cache_key = build_transcript_cache_key(
             languages= (
                 list(self.options.languages)
                 if self.options.languages
                 else ["__auto__"] # First available language if not defined by user.
             ),
             manually_created=self.options.manually_created,
+            normalizer=self.options.normalizer,
         )
 
-        cached_successes, cached_failures = self._cache.get_cached_states(video_ids=video_ids, cache_key=cache_key)
+        with self._phase("cache_lookup"):
+            cached_successes, cached_failures = self._cache.get_cached_states(video_ids=video_ids, cache_key=cache_key)
 
-        self._failed_transcripts.extend(cached_failures)
+        hits = len(cached_successes) + len(cached_failures)
+        self._stats.increment("cache_hits", hits)
+        self._stats.increment("cache_misses", len(video_ids) - hits)
+        if self.options.metrics is not None:
+            self.options.metrics.record_cache_lookup(hits=hits, misses=len(video_ids) - hits)
+        logger.info(
+            "Cache hit rate: %d/%d videos (%.0f%%), %d cached transcripts and %d known failures.",
+            hits, len(video_ids), 100 * hits / len(video_ids) if video_ids else 0, len(cached_successes), len(cached_failures)
+        )
+
+        self._add_failures(cached_failures)
+        for cached in [*cached_successes, *cached_failures]:
+            self._events.emit("on_cache_hit", cached)
 
         known_ids = {t.video_id for t in cached_successes} | {f.video_id for f in cached_failures}
         missing_ids = [vid for vid in video_ids if vid not in known_ids]
@@ -305,40 +540,43 @@ class YTFetcher:
         
         if missing_ids:
             logger.debug(f"Cache miss for {len(missing_ids)} videos. Fetching missing transcripts...")
-            new_successes, new_failures = self._fetch_with_recovery_pass(video_ids=missing_ids)
-            
-            # Any failures that are transient should not be marked as permanently failed in the cache, allowing for future retries.
-            permanent_failures = [f for f in new_failures if f.is_permanent_exception]
-
-            self._cache.upsert_transcripts(transcripts=new_successes, cache_key=cache_key)
-            self._cache.upsert_failures(failures=permanent_failures, cache_key=cache_key)
-            self._failed_transcripts.extend(new_failures)
 
-            transcript_map.update({t.video_id: t for t in new_successes})
-        
-        return [transcript_map[vid] for vid in video_ids if vid in transcript_map]
+            # Results are written in the background as they complete, so progress survives a crash.
+            # Transient failures are dropped by the writer, allowing for future retries.
+            queued: set[str] = set()
 
-    def _fetch_with_recovery_pass(self, video_ids: list[str]) -> tuple[list[VideoTranscript], list[FailedTranscript]]:
-        result = self._create_transcript_fetcher(video_ids=video_ids).fetch()
-        successes = result.success
-        failures = result.failed
+            def write_behind(result: VideoTranscript | FailedTranscript) -> None:
+                queued.add(result.video_id)
+                writer.put(result, cache_key)
 
-        if not self.options.with_recovery:
-            return successes, failures
+            with WriteBehindCache(self._cache, metrics=self.options.metrics) as writer:
+                new_successes, new_failures = self._fetch_with_recovery(video_ids=missing_ids, on_result=write_behind)
 
-        retry_ids = [f.video_id for f in failures if f.reason in RETRYABLE_ERRORS]
+                # Final results that were never streamed, e.g. from a fetcher without `on_result` support.
+                results: list[VideoTranscript | FailedTranscript] = [*new_successes, *new_failures]
+                for result in results:
+                    if result.video_id not in queued:
+                        writer.put(result, cache_key)
 
-        if retry_ids:
-            logger.info(f"Retrying %d transient failures in {self.options.recovery_delay} seconds...", len(retry_ids))
-            time.sleep(self.options.recovery_delay)
+            self._stats.increment("cache_writes", writer.written)
+            self._add_failures(new_failures)
 
-            retry_result = self._create_transcript_fetcher(video_ids=retry_ids).fetch()
-            successes.extend(retry_result.success)
-            final_failures = [f for f in failures if f.video_id not in retry_ids] + retry_result.failed
-        else:
-            final_failures = failures
+            transcript_map.update({t.video_id: t for t in new_successes})
+        
+        return [transcript_map[vid] for vid in video_ids if vid in transcript_map]
 
-        return successes, final_failures
+    def _fetch_with_recovery(
+        self,
+        video_ids: list[str],
+        on_result: Callable[[VideoTranscript | FailedTranscript], None] | None = None
+    ) -> tuple[list[VideoTranscript], list[FailedTranscript]]:
+        """
+        Fetches transcripts. Transient failures are retried within the same pass when
+        `options.with_recovery` is set, each video after its own backoff.
+        """
+        with self._phase("fetch"):
+            result = self._fetch_transcript_batch(video_ids=video_ids, on_result=on_result)
+        return result.success, result.failed
 
     def _build_response(
             self,
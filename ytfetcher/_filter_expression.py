@@ -0,0 +1,366 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, Literal, Union
+from ytfetcher.exceptions import InvalidFilterExpression
+import ast
+import math
+import re
+
+if TYPE_CHECKING:
+    from ytfetcher.models.channel import DLSnippet
+
+FieldKind = Literal["number", "text"]
+
+# Expression name -> (DLSnippet attribute, kind). Attribute names are also accepted as-is.
+FIELDS: dict[str, tuple[str, FieldKind]] = {
+    "views": ("view_count", "number"),
+    "view_count": ("view_count", "number"),
+    "duration": ("duration", "number"),
+    "title": ("title", "text"),
+    "description": ("description", "text"),
+    "id": ("video_id", "text"),
+    "video_id": ("video_id", "text"),
+    "url": ("url", "text"),
+    "uploader_url": ("uploader_url", "text"),
+    "upload_date": ("upload_date", "text"),
+    "timestamp": ("timestamp", "number"),
+}
+
+_UPLOAD_DATE = re.compile(r"^(\d{4})-?(\d{2})-?(\d{2})$")
+
+ORDERING_OPERATORS = frozenset({"<", "<=", ">", ">=", "==", "!="})
+MATCH_OPERATORS = frozenset({"~", "!~"})
+
+_TOKEN = re.compile(
+    r"""
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<op>>=|<=|==|!=|!~|>|<|~|=)
+      | (?P<lparen>\()
+      | (?P<rparen>\))
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    )
+    """,
+    re.VERBOSE,
+)
+
+@dataclass(frozen=True)
+class Comparison:
+    attribute: str
+    op: str
+    value: float | int | str
+
+    def __str__(self) -> str:
+        return f"{self.attribute} {self.op} {self.value!r}" if isinstance(self.value, str) else f"{self.attribute} {self.op} {self.value}"
+
+@dataclass(frozen=True)
+class And:
+    items: tuple["Node", ...]
+
+    def __str__(self) -> str:
+        return " and ".join(_wrap(item, Or) for item in self.items)
+
+@dataclass(frozen=True)
+class Or:
+    items: tuple["Node", ...]
+
+    def __str__(self) -> str:
+        return " or ".join(str(item) for item in self.items)
+
+@dataclass(frozen=True)
+class Not:
+    item: "Node"
+
+    def __str__(self) -> str:
+        return f"not {_wrap(self.item, (And, Or))}"
+
+Node = Union[Comparison, And, Or, Not]
+
+def _wrap(node: Node, types: type | tuple[type, ...]) -> str:
+    return f"({node})" if isinstance(node, types) else str(node)
+
+def _join(kind: type[And] | type[Or], nodes: Iterable[Node]) -> Node:
+    """
+    Joins `nodes` with `kind`, splicing in the items of nested nodes of the same kind so
+    equivalent groupings, e.g. `a or (b or c)` and `a or b or c`, build equal trees.
+    """
+    items: list[Node] = []
+    for node in nodes:
+        items.extend(node.items if isinstance(node, kind) else (node,))
+    return items[0] if len(items) == 1 else kind(tuple(items))
+
+def comparison(field: str, op: str, value: float | int | str) -> Comparison:
+    """
+    Builds a type-checked comparison node for `field`, resolving expression aliases like `views`.
+    """
+    if field not in FIELDS:
+        raise InvalidFilterExpression(f"Unknown field '{field}'. Available fields: {', '.join(sorted(FIELDS))}.")
+
+    attribute, kind = FIELDS[field]
+    op = "==" if op == "=" else op
+
+    if op not in ORDERING_OPERATORS | MATCH_OPERATORS:
+        raise InvalidFilterExpression(f"Unknown operator '{op}'.")
+
+    if kind == "number":
+        if op in MATCH_OPERATORS:
+            raise InvalidFilterExpression(f"Operator '{op}' is only supported for text fields, not '{field}'.")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise InvalidFilterExpression(f"Field '{field}' expects a number, got {value!r}.")
+        if not math.isfinite(value):
+            raise InvalidFilterExpression(f"Field '{field}' expects a finite number, got {value!r}.")
+    elif not isinstance(value, str):
+        raise InvalidFilterExpression(f"Field '{field}' expects a quoted string, got {value!r}.")
+    elif attribute == "upload_date" and op in ORDERING_OPERATORS:
+        value = normalize_upload_date(value)
+
+    return Comparison(attribute=attribute, op=op, value=value)
+
+def normalize_upload_date(value: str) -> str:
+    """
+    Converts `YYYY-MM-DD` or `YYYYMMDD` into the `YYYYMMDD` form yt-dlp uses for `upload_date`.
+    """
+    match = _UPLOAD_DATE.match(value.strip())
+    if not match:
+        raise InvalidFilterExpression(f"Invalid upload date {value!r}, expected YYYY-MM-DD or YYYYMMDD.")
+    return "".join(match.groups())
+
+def lower_bound(node: Node, attribute: str) -> float | int | str | None:
+    """
+    Returns the smallest value `attribute` can have in a snippet matching `node`, if the
+    expression implies one (e.g. `upload_date >= "20260101" and views > 10`).
+    """
+    if isinstance(node, Comparison):
+        if node.attribute == attribute and node.op in (">=", ">", "=="):
+            return node.value
+        return None
+
+    if isinstance(node, And):
+        known = [bound for bound in (lower_bound(item, attribute) for item in node.items) if bound is not None]
+        return max(known) if known else None  # type: ignore[type-var]
+
+    if isinstance(node, Or):
+        bounds = [lower_bound(item, attribute) for item in node.items]
+        if any(bound is None for bound in bounds):
+            return None
+        return min(bounds)  # type: ignore[type-var]
+
+    return None
+
+class _Parser:
+    """
+    Recursive descent parser for the filter expression grammar:
+
+        expr       := and_expr ("or" and_expr)*
+        and_expr   := not_expr ("and" not_expr)*
+        not_expr   := "not" not_expr | "(" expr ")" | comparison
+        comparison := FIELD OP (NUMBER | STRING)
+    """
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens = self._tokenize(source)
+        self.position = 0
+
+    def _tokenize(self, source: str) -> list[tuple[str, str, int]]:
+        tokens = []
+        index = 0
+        stripped_end = len(source.rstrip())
+
+        while index < stripped_end:
+            match = _TOKEN.match(source, index)
+            if not match or match.end() == index:
+                raise InvalidFilterExpression(f"Unexpected character at position {index} in filter expression: {source!r}")
+
+            kind = match.lastgroup or ""
+            tokens.append((kind, match.group(kind), match.start(kind)))
+            index = match.end()
+
+        return tokens
+
+    def _peek(self) -> tuple[str, str, int] | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self, expected: str) -> tuple[str, str, int]:
+        token = self._peek()
+        if token is None:
+            raise InvalidFilterExpression(f"Unexpected end of filter expression, expected {expected}: {self.source!r}")
+        self.position += 1
+        return token
+
+    def _keyword(self, word: str) -> bool:
+        token = self._peek()
+        if token and token[0] == "name" and token[1].lower() == word:
+            self.position += 1
+            return True
+        return False
+
+    def parse(self) -> Node:
+        node = self._or()
+        token = self._peek()
+        if token is not None:
+            raise InvalidFilterExpression(f"Unexpected '{token[1]}' at position {token[2]} in filter expression: {self.source!r}")
+        return node
+
+    def _or(self) -> Node:
+        items = [self._and()]
+        while self._keyword("or"):
+            items.append(self._and())
+        return _join(Or, items)
+
+    def _and(self) -> Node:
+        items = [self._not()]
+        while self._keyword("and"):
+            items.append(self._not())
+        return _join(And, items)
+
+    def _not(self) -> Node:
+        if self._keyword("not"):
+            return Not(self._not())
+
+        token = self._peek()
+        if token and token[0] == "lparen":
+            self.position += 1
+            node = self._or()
+            closing = self._next("')'")
+            if closing[0] != "rparen":
+                raise InvalidFilterExpression(f"Expected ')' at position {closing[2]} in filter expression: {self.source!r}")
+            return node
+
+        return self._comparison()
+
+    def _comparison(self) -> Comparison:
+        field = self._next("a field name")
+        if field[0] != "name":
+            raise InvalidFilterExpression(f"Expected a field name at position {field[2]} in filter expression: {self.source!r}")
+
+        op = self._next("an operator")
+        if op[0] != "op":
+            raise InvalidFilterExpression(f"Expected an operator after '{field[1]}' in filter expression: {self.source!r}")
+
+        literal = self._next("a value")
+        value: float | int | str
+        if literal[0] == "number":
+            value = int(literal[1]) if literal[1].lstrip("-").isdigit() else float(literal[1])
+        elif literal[0] == "string":
+            value = ast.literal_eval(literal[1])
+        else:
+            raise InvalidFilterExpression(f"Expected a number or quoted string after '{field[1]} {op[1]}' in filter expression: {self.source!r}")
+
+        return comparison(field[1], op[1], value)
+
+def _generate(node: Node) -> str:
+    if isinstance(node, And):
+        return "(" + " and ".join(_generate(item) for item in node.items) + ")"
+    if isinstance(node, Or):
+        return "(" + " or ".join(_generate(item) for item in node.items) + ")"
+    if isinstance(node, Not):
+        # A missing field fails the negated comparison too, so `not` alone would match it.
+        present = "".join(f"_v.{attribute} is not None and " for attribute in _attributes(node.item))
+        return f"({present}not {_generate(node.item)})"
+
+    attribute = f"_v.{node.attribute}"
+    if node.op == "~":
+        return f"({attribute} is not None and {str(node.value).lower()!r} in {attribute}.lower())"
+    if node.op == "!~":
+        return f"({attribute} is not None and {str(node.value).lower()!r} not in {attribute}.lower())"
+
+    return f"({attribute} is not None and {attribute} {node.op} {node.value!r})"
+
+def _attributes(node: Node) -> dict[str, None]:
+    """Returns the attributes `node` compares, in order of appearance."""
+    if isinstance(node, Comparison):
+        return {node.attribute: None}
+    if isinstance(node, Not):
+        return _attributes(node.item)
+    return {attribute: None for item in node.items for attribute in _attributes(item)}
+
+def compile_predicate(node: Node) -> Callable[["DLSnippet"], bool]:
+    """
+    Compiles an expression tree into a single Python function.
+
+    Only field names from `FIELDS` and `repr()`-quoted literals reach the generated source.
+    """
+    source = f"lambda _v: {_generate(node)}"
+    return eval(compile(source, "<filter expression>", "eval"), {"__builtins__": {}})
+
+class FilterExpression:
+    """
+    A declarative, serializable snippet filter.
+
+    Expressions are parsed once and compiled into a single Python predicate, so several
+    conditions cost one function call per snippet. Instances are hashable, comparable and
+    picklable (they pickle as their canonical source), which makes them usable as cache key
+    material and safe to send to worker processes.
+
+    Grammar: comparisons like `views >= 1000`, `duration < 600` or `title ~ "python"`
+    (case-insensitive substring, `!~` negates) combined with `and`, `or`, `not` and parentheses.
+    Comparisons against a missing field never match, and neither does `not` over a
+    condition that references one.
+
+    Args:
+        expression (str): The expression source, e.g. `'views>=1000 and title~"python"'`.
+    """
+    __slots__ = ("node", "_predicate")
+
+    def __init__(self, expression: str):
+        if not isinstance(expression, str) or not expression.strip():
+            raise InvalidFilterExpression("Filter expression must be a non-empty string.")
+        self._set_node(_Parser(expression).parse())
+
+    @classmethod
+    def from_node(cls, node: Node) -> "FilterExpression":
+        instance = cls.__new__(cls)
+        instance._set_node(node)
+        return instance
+
+    @classmethod
+    def all_of(cls, expressions: Iterable["FilterExpression"]) -> "FilterExpression":
+        """Combines several expressions into one that matches when all of them match."""
+        nodes = [expression.node for expression in expressions]
+
+        if not nodes:
+            raise InvalidFilterExpression("Cannot combine an empty list of filter expressions.")
+
+        return cls.from_node(_join(And, nodes))
+
+    def _set_node(self, node: Node) -> None:
+        self.node = node
+        self._predicate = compile_predicate(node)
+
+    def lower_bound(self, field: str) -> float | int | str | None:
+        """
+        Returns the minimum value of `field` a matching snippet must have, or None if the
+        expression does not bound it from below.
+        """
+        if field not in FIELDS:
+            raise InvalidFilterExpression(f"Unknown field '{field}'. Available fields: {', '.join(sorted(FIELDS))}.")
+        return lower_bound(self.node, FIELDS[field][0])
+
+    def __call__(self, snippet: "DLSnippet") -> bool:
+        return self._predicate(snippet)
+
+    def __and__(self, other: "FilterExpression") -> "FilterExpression":
+        return FilterExpression.all_of((self, other))
+
+    def __or__(self, other: "FilterExpression") -> "FilterExpression":
+        return FilterExpression.from_node(_join(Or, (self.node, other.node)))
+
+    def __invert__(self) -> "FilterExpression":
+        return FilterExpression.from_node(Not(self.node))
+
+    def __str__(self) -> str:
+        return str(self.node)
+
+    def __repr__(self) -> str:
+        return f"FilterExpression({str(self)!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FilterExpression):
+            return NotImplemented
+        return self.node == other.node
+
+    def __hash__(self) -> int:
+        return hash(self.node)
+
+    def __reduce__(self):
+        return (FilterExpression, (str(self),))
@@ -4,10 +4,17 @@ from ytfetcher.models.channel import (
     FailedTranscript,
     TranscriptFetchResult
 )
+from ytfetcher.models.compact import CompactTranscript
 from ytfetcher.config.http_config import HTTPConfig
+from ytfetcher.normalizers import TranscriptNormalizer
 from ytfetcher.exceptions import TranscriptFetchError
+from ytfetcher.stats import RunStats
+from ytfetcher.metrics import FetchMetrics
+from ytfetcher.profiling import RunProfiler
 from ytfetcher.utils.state import should_disable_progress
-from ytfetcher.utils.constants import PERMANENTLY_FAILED_EXCEPTIONS
+from ytfetcher.utils.constants import PERMANENTLY_FAILED_EXCEPTIONS, RETRYABLE_ERRORS
+from ytfetcher.utils.helpers import dedupe_video_ids
+from ytfetcher.utils.singleflight import SingleFlight
 from youtube_transcript_api.proxies import ProxyConfig
 from youtube_transcript_api._errors import (
     CouldNotRetrieveTranscript,
@@ -15,27 +22,51 @@ from youtube_transcript_api._errors import (
 )
 from youtube_transcript_api import YouTubeTranscriptApi
 from concurrent import futures
-from requests.adapters import HTTPAdapter
+from pydantic import TypeAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from requests.exceptions import RequestException
 from tqdm import tqdm
-from typing import Iterable
-from collections import Counter
+from typing import Callable, Iterable, TypeVar
+from collections import Counter, deque
 from tenacity import (
+    RetryCallState,
     retry,
     stop_after_attempt,
-    wait_exponential,
     retry_if_exception_type,
 )
 import requests
+import heapq
+import itertools
 import logging
-import re
+import math
+import random
 import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole transcript in a single pydantic-core call instead of one call per segment.
+_TRANSCRIPT_LIST_ADAPTER = TypeAdapter(list[Transcript])
+
+ResultT = TypeVar("ResultT", VideoTranscript, FailedTranscript)
+
+# Shared by all fetchers so concurrent identical requests make one network call.
+_TRANSCRIPT_FLIGHTS: SingleFlight[tuple, "VideoTranscript | FailedTranscript"] = SingleFlight()
+
+def _count_retry(retry_state: RetryCallState) -> None:
+    fetcher = retry_state.args[0]
+    if fetcher.stats is not None:
+        fetcher.stats.increment("retries")
+    if fetcher.metrics is not None:
+        fetcher.metrics.retries.inc()
+
 class TimeoutSession(requests.Session):
+    def __init__(self, timeout: float | tuple[float, float] = 10):
+        super().__init__()
+        self.timeout = timeout
+
     def request(self, *args, **kwargs):
-        kwargs.setdefault('timeout', 10)
+        kwargs.setdefault('timeout', self.timeout)
         return super().request(*args, **kwargs)
 
 class TranscriptFetcher:
@@ -50,6 +81,15 @@ class TranscriptFetcher:
     transcripts and skips auto-generated ones. This is useful for videos where
     you only want creator-provided transcripts and not AI-generated ones.
 
+    Used as a context manager, the fetcher keeps its sessions, connection pools and
+    `YouTubeTranscriptApi` clients open across `fetch` calls, e.g. for batches or retry
+    passes, until the block exits. Otherwise `fetch` closes the sessions it created when done.
+
+    Example:
+        with TranscriptFetcher([], languages=["en"]) as fetcher:
+            first = fetcher.fetch(["dQw4w9WgXcQ"])
+            retried = fetcher.fetch([f.video_id for f in first.failed])
+
     Args:
         video_ids (list[str]):
             List of YouTube video IDs to fetch transcripts for.
@@ -72,6 +112,45 @@ class TranscriptFetcher:
         
         max_concurrent_requests (int):
             Maximum number of concurrent network requests to make when fetching transcripts.
+
+        normalizer (TranscriptNormalizer | None):
+            Text-normalization pipeline applied to every fetched transcript.
+            Defaults to `TranscriptNormalizer.default()`.
+
+        strict_validation (bool):
+            If True, validates every segment in pydantic strict mode instead of the
+            fast batched path used for trusted `youtube_transcript_api` data. Defaults to False.
+
+        compact_transcripts (bool):
+            If True, stores segments in a columnar `CompactTranscript` instead of
+            `Transcript` models. Defaults to False.
+
+        stats (RunStats | None):
+            Run statistics to update with requests, received bytes and retries. Defaults to None.
+
+        metrics (FetchMetrics | None):
+            Metrics registry to update with in-flight fetches, latencies and outcomes. Defaults to None.
+
+        profiler (RunProfiler | None):
+            Profiler whose current phase the worker tasks are profiled in. Defaults to None.
+
+        retry_attempts (int):
+            Times a video is fetched again after a transient failure (see `RETRYABLE_ERRORS`).
+            Retries wait for their own backoff and then join the worker pool alongside the
+            remaining videos. A network error is also retried once, immediately, before it
+            counts as a failure. Defaults to 0.
+
+        retry_delay (float):
+            Seconds before a video's first retry. Each further retry doubles the delay, and
+            every delay is jittered by ±50%. Defaults to 5.
+
+        retry_max_delay (float):
+            Upper bound of a retry delay in seconds. Defaults to 60.
+
+        session (requests.Session | list[requests.Session] | None):
+            Existing HTTP session, or sessions to spread the workers over, to reuse, e.g. built
+            with `create_sessions`. Their connection pools are shared with the caller and left
+            open after `fetch`. Defaults to `http_config.sessions` new sessions.
     """
 
     def __init__(
@@ -81,13 +160,24 @@ class TranscriptFetcher:
         proxy_config: ProxyConfig | None = None,
         languages: Iterable[str] | None = None,
         manually_created: bool = False,
-        max_concurrent_requests: int = 20
+        max_concurrent_requests: int = 20,
+        normalizer: TranscriptNormalizer | None = None,
+        strict_validation: bool = False,
+        compact_transcripts: bool = False,
+        session: requests.Session | list[requests.Session] | None = None,
+        on_result: Callable[[VideoTranscript | FailedTranscript], None] | None = None,
+        stats: RunStats | None = None,
+        metrics: FetchMetrics | None = None,
+        profiler: RunProfiler | None = None,
+        retry_attempts: int = 0,
+        retry_delay: float = 5.0,
+        retry_max_delay: float = 60.0
     ):
         """
         Initialize the TranscriptFetcher.
 
         Args:
-            video_ids: List of YouTube video IDs to fetch transcripts for.
+            video_ids: List of YouTube video IDs to fetch transcripts for. Duplicates are fetched once.
             http_config: Optional HTTP configuration (e.g., headers, timeout).
             proxy_config: Optional proxy configuration for the YouTube Transcript API.
             languages: List of language codes in descending priority. Defaults to ("en",).
@@ -95,87 +185,310 @@ class TranscriptFetcher:
                 and skip auto-generated ones. When True and no manual transcripts
                 are found, logs an error. Defaults to False.
             max_concurrent_requests: Maximum number of concurrent network requests to make when fetching transcripts.
+            normalizer: Text-normalization pipeline for transcript segments. Defaults to `TranscriptNormalizer.default()`.
+            strict_validation: Validate segments in pydantic strict mode. Defaults to False.
+            compact_transcripts: Store segments in a columnar `CompactTranscript`. Defaults to False.
+            session: Existing HTTP session, or list of sessions, to reuse. They are not closed by `fetch`.
+                Defaults to the sessions built by `create_sessions`.
+            on_result: Called from the collecting thread with each result as soon as it completes,
+                e.g. to hand it to a `WriteBehindCache`. Should return quickly.
+            stats: Run statistics to update. Requests on the sessions this fetcher creates are
+                counted by a response hook that reports to the current `stats`, so it can be
+                swapped between runs. Sessions passed in are counted by whoever owns them.
+            metrics: Metrics registry to update. Requests are counted like for `stats`; outcomes,
+                latencies and in-flight fetches are also counted by `fetch_one`.
+            profiler: Profiler to time and profile worker tasks with, see `RunProfiler.task`.
+            retry_attempts: Retries per video after a transient failure, scheduled with a
+                per-video backoff while other videos are fetched. Defaults to 0.
+            retry_delay: Seconds before a video's first retry, doubled for each further one. Defaults to 5.
+            retry_max_delay: Upper bound of a retry delay in seconds. Defaults to 60.
         """
 
         self.http_config = http_config or HTTPConfig()
         self.proxy_config = proxy_config
-        self.video_ids = video_ids
+        self.video_ids = dedupe_video_ids(video_ids)
         self.languages = languages
         self.manually_created = manually_created
         self.max_concurrent_requests = max_concurrent_requests
+        self.normalizer = normalizer or TranscriptNormalizer.default()
+        self.strict_validation = strict_validation
+        self.compact_transcripts = compact_transcripts
+        self.on_result = on_result
+        self.stats = stats
+        self.metrics = metrics
+        self.profiler = profiler
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
 
         if self.max_concurrent_requests < 1:
             raise ValueError("max_concurrent_requests must be at least 1.")
 
+        if retry_attempts < 0 or retry_delay < 0 or retry_max_delay < 0:
+            raise ValueError("retry_attempts, retry_delay and retry_max_delay must not be negative.")
+
         self._network_warning_shown = threading.Event()
         self._warning_lock = threading.Lock()
-        self._ip_blocked = threading.Event()
-
-        self._session = TimeoutSession()
-        self._session.headers.update(self.http_config.headers)
-
-        adapter = HTTPAdapter(
-            pool_connections=self.max_concurrent_requests,
-            pool_maxsize=self.max_concurrent_requests
-        )
-
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
+        # The IP-block flag of the fetch pass the current worker thread runs for, see `_run_task`.
+        self._pass = threading.local()
+
+        self._owns_session = session is None
+        if session is None:
+            self._sessions = self.create_sessions(self.http_config, self.max_concurrent_requests)
+            for owned in self._sessions:
+                owned.hooks["response"].append(self._record_response)
+        elif isinstance(session, requests.Session):
+            self._sessions = [session]
+        else:
+            self._sessions = list(session)
+        self._session = self._sessions[0]
+        # Each worker thread sticks to one session, so its cookies and connections stay together.
+        self._session_cycle = itertools.cycle(self._sessions)
+        self._thread_sessions = threading.local()
+        self._session_lock = threading.Lock()
+        self._clients: dict[int, YouTubeTranscriptApi] = {}
+        self._keep_open = False
 
         if manually_created and not languages:
             raise TranscriptFetchError(
                 "You must provide a language when using manually_created."
             )
 
-    def fetch(self) -> TranscriptFetchResult:
+    @staticmethod
+    def create_session(http_config: HTTPConfig, pool_size: int = 20, headers: dict | None = None) -> requests.Session:
+        """
+        Builds an HTTP session with the configured timeouts and headers and a connection
+        pool sized for `pool_size` concurrent requests.
+
+        Args:
+            http_config: Timeouts and headers of the session.
+            pool_size: Connections kept open per host.
+            headers: Headers to use instead of `http_config.headers`.
+        """
+        session = TimeoutSession(timeout=http_config.timeout)
+        session.headers.update(http_config.headers if headers is None else headers)
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @classmethod
+    def create_sessions(cls, http_config: HTTPConfig, max_concurrent_requests: int = 20) -> list[requests.Session]:
+        """
+        Builds the `http_config.sessions` sessions that `max_concurrent_requests` workers are spread over.
+
+        Each session gets its own headers (see `HTTPConfig.session_headers`), cookie jar and a
+        connection pool of `http_config.pool_maxsize` connections, by default enough for the
+        workers sharing it. There are never more sessions than workers.
+        """
+        count = max(1, min(http_config.sessions, max_concurrent_requests))
+        pool_size = http_config.pool_maxsize or math.ceil(max_concurrent_requests / count)
+        return [cls.create_session(http_config, pool_size, headers) for headers in http_config.session_headers(count)]
+
+    def __enter__(self) -> "TranscriptFetcher":
+        self._keep_open = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._keep_open = False
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the connection pools of the sessions this fetcher created. Sessions passed
+        in by the caller are left open.
+        """
+        if self._owns_session:
+            for session in self._sessions:
+                session.close()
+
+    def fetch(
+        self,
+        video_ids: list[str] | None = None,
+        on_result: Callable[[VideoTranscript | FailedTranscript], None] | None = None
+    ) -> TranscriptFetchResult:
         """
         Synchronously fetches transcripts for all provided video IDs.
 
         Transcripts are fetched using threads wrapped in ThreadPoolExecutor. Results are streamed as they are completed,
         and errors like `NoTranscriptFound`, `TranscriptsDisabled`, or `VideoUnavailable` are silently handled.
 
+        Args:
+            video_ids: Video IDs to fetch instead of the ones given to the constructor. Duplicates are fetched once.
+            on_result: Callback to use instead of the constructor's `on_result` for this call.
+
         Returns:
             list[VideoTranscript]: A list of successful transcripts from list of videos with video_id information.
         """
+        video_ids = self.video_ids if video_ids is None else dedupe_video_ids(video_ids)
+        on_result = on_result or self.on_result
 
         logger.debug(
             "Starting transcript fetch: %d videos | languages=%s | manually_created=%s",
-            len(self.video_ids),
+            len(video_ids),
             self.languages,
             self.manually_created,
         )
 
-        if not self.video_ids:
+        if not video_ids:
             return TranscriptFetchResult(success=[], failed=[])
 
+        # An IP block stops the current call only; a later call tries again.
+        blocked = threading.Event()
+
         try:
             with futures.ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
-                tasks, cancelled = self._submit_tasks(executor=executor)
-                result = self._collect_results(tasks=tasks)
-                result.failed.extend(cancelled)
+                result = self._collect_results(
+                    tasks={},
+                    on_result=on_result,
+                    executor=executor,
+                    blocked=blocked,
+                    queued=video_ids
+                )
 
                 if not result.success and self.manually_created: 
                     logger.info(f"No manually created transcripts found for requested languages: {self.languages}")
             
-                if len(self.video_ids) == len(result.failed):
+                if len(video_ids) == len(result.failed):
                     summary = Counter(f.reason for f in result.failed)
                     logger.warning(
                         "All %d transcript fetches failed. Reasons: %s",
-                        len(self.video_ids),
+                        len(video_ids),
                         dict(summary)
                     )
 
                 return result
         finally:
-            self._session.close()
+            if not self._keep_open:
+                self.close()
+
+    def _record_response(self, response: requests.Response, *args, **kwargs) -> None:
+        """Response hook of the owned sessions, forwarding to the current `stats` and `metrics`."""
+        stats, metrics = self.stats, self.metrics
+        if stats is not None:
+            stats.record_response(response)
+        if metrics is not None:
+            metrics.record_response(response)
+
+    def fetch_one(self, video_id: str) -> VideoTranscript | FailedTranscript:
+        """
+        Fetches a single transcript in the calling thread.
+
+        Network errors (after retries) and IP blocks are reported as `FailedTranscript`
+        results, like in `fetch`. An IP block only fails this call; the next call tries again.
+
+        Args:
+            video_id (str): The ID of the YouTube video to fetch.
+
+        Returns:
+            VideoTranscript | FailedTranscript: The transcript, or why it could not be fetched.
+        """
+        try:
+            result = self._fetch_single(video_id)
+        except Exception as e:
+            result = self._failure_from_exception(video_id, e)
+
+        self._observe(result)
+        return result
+
+    def _fetch_single(self, video_id: str) -> VideoTranscript | FailedTranscript:
+        """
+        Fetches a single transcript, sharing the request with identical in-flight fetches.
+
+        Concurrent calls for the same video with the same language, normalization and
+        validation settings and the same proxy, from any `TranscriptFetcher` in the process,
+        share one network call and its result or exception.
+        """
+        try:
+            if self.metrics is None:
+                return _TRANSCRIPT_FLIGHTS.do(self._flight_key(video_id), lambda: self._fetch_transcript(video_id))
+
+            with self.metrics.transcripts_in_flight.track(), self.metrics.transcript_duration.time():
+                return _TRANSCRIPT_FLIGHTS.do(self._flight_key(video_id), lambda: self._fetch_transcript(video_id))
+        except IpBlocked:
+            blocked = getattr(self._pass, "blocked", None)
+            if blocked is not None:
+                blocked.set()
+            raise
+
+    def _worker_session(self) -> requests.Session:
+        """Returns the session of the calling thread, assigning sessions to threads round-robin."""
+        session = getattr(self._thread_sessions, "session", None)
+        if session is None:
+            with self._session_lock:
+                session = next(self._session_cycle)
+            self._thread_sessions.session = session
+        return session
+
+    def _worker_client(self) -> YouTubeTranscriptApi:
+        """
+        Returns the `YouTubeTranscriptApi` client of the calling thread's session.
+
+        Clients keep no per-request state, so the threads sharing a session share its client.
+        Each one is created once per session: creating a client configures the session's
+        proxies and, for proxies with `retries_when_blocked`, mounts new adapters.
+        """
+        session = self._worker_session()
+        client = self._clients.get(id(session))
+        if client is None:
+            with self._session_lock:
+                client = self._clients.get(id(session))
+                if client is None:
+                    client = self._clients[id(session)] = self._create_client(session)
+        return client
+
+    def _create_client(self, session: requests.Session) -> YouTubeTranscriptApi:
+        sized = {prefix: session.get_adapter(prefix) for prefix in ("https://", "http://")}
+        client = YouTubeTranscriptApi(http_client=session, proxy_config=self.proxy_config)
+
+        for prefix, adapter in sized.items():
+            mounted = session.get_adapter(prefix)
+            if mounted is not adapter and isinstance(adapter, HTTPAdapter) and isinstance(mounted, HTTPAdapter):
+                # The client mounts retrying adapters with default pool sizes; keep the configured sizes.
+                session.mount(prefix, HTTPAdapter(
+                    pool_connections=getattr(adapter, "_pool_connections", DEFAULT_POOLSIZE),
+                    pool_maxsize=getattr(adapter, "_pool_maxsize", DEFAULT_POOLSIZE),
+                    max_retries=mounted.max_retries
+                ))
+        return client
+
+    def _run_task(self, video_id: str, blocked: threading.Event | None = None) -> VideoTranscript | FailedTranscript:
+        """
+        Worker pool entry point; `_fetch_single` plus queue depth accounting. `blocked` is the
+        IP-block flag of the fetch pass: once set, the pass's remaining videos are cancelled.
+        """
+        if self.metrics is not None:
+            self.metrics.transcript_queue_depth.dec()
+        self._pass.blocked = blocked
+        try:
+            return self._fetch_single(video_id)
+        finally:
+            self._pass.blocked = None
 
+    def _flight_key(self, video_id: str) -> tuple:
+        return (
+            video_id,
+            tuple(self.languages) if self.languages else None,
+            self.manually_created,
+            self.normalizer,
+            self.strict_validation,
+            self.compact_transcripts,
+            # Fetchers behind different proxies must not share a call, or an IP block of one
+            # proxy would fail (and cancel) the fetches made through another.
+            tuple(sorted(self.proxy_config.to_requests_dict().items())) if self.proxy_config else None,
+        )
+
+    # One immediate retry for dropped connections; delayed retries are scheduled by `_collect_results`
+    # so a waiting video does not hold a worker.
     @retry(
         reraise=True,
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=3, max=8),
-        retry=retry_if_exception_type((RequestException))
+        stop=stop_after_attempt(2),
+        retry=retry_if_exception_type((RequestException)),
+        before_sleep=_count_retry
     )
-    def _fetch_single(self, video_id: str) -> VideoTranscript | FailedTranscript:
+    def _fetch_transcript(self, video_id: str) -> VideoTranscript | FailedTranscript:
         """
         Fetches a single transcript and returns structured data.
 
@@ -190,15 +503,10 @@ class TranscriptFetcher:
                          or None if transcript is unavailable.
         """
         try:
-            if self._ip_blocked.is_set():
-                return FailedTranscript(
-                    video_id=video_id,
-                    reason='IpBlocked',
-                    message="Cancelled due to IP block",
-                    is_permanent_exception=False
-                )
-            yt_api = YouTubeTranscriptApi(http_client=self._session, proxy_config=self.proxy_config)
-            transcript: list[Transcript] = self._decide_fetch_method(yt_api, video_id)
+            blocked = getattr(self._pass, "blocked", None)
+            if blocked is not None and blocked.is_set():
+                return self._cancelled_by_ip_block(video_id)
+            transcript = self._decide_fetch_method(self._worker_client(), video_id)
 
             if not transcript:
                 logger.warning("No transcript found for video_id: %s", video_id)
@@ -209,15 +517,21 @@ class TranscriptFetcher:
                     is_permanent_exception=True
                 )
 
-            cleaned_transcript = self._clean_transcripts(transcript)
+            cleaned_transcript = self._clean_transcripts(transcript, normalizer=self.normalizer)
             logger.debug("Transcript fetched for %s", video_id)
-            return VideoTranscript(
+
+            if self.strict_validation:
+                return VideoTranscript(video_id=video_id, transcripts=cleaned_transcript)
+
+            # Segments are already validated, skip walking the list again.
+            return VideoTranscript.model_construct(
                 video_id=video_id,
                 transcripts=cleaned_transcript
             )
         except IpBlocked as e:
             logger.error("YouTube is blocking your IP address. Please try using a proxy or wait before retrying.", exc_info=True)
-            self._ip_blocked.set()
+            if self.metrics is not None:
+                self.metrics.ip_blocks.inc()
             raise
         except CouldNotRetrieveTranscript as e:
             logger.debug(str(e).replace(e.GITHUB_REFERRAL, ''), exc_info=True)
@@ -234,7 +548,7 @@ class TranscriptFetcher:
                     self._network_warning_shown.set()
                     logger.warning(
                         "Network issues detected while fetching transcripts. This may be due to connectivity problems or rate limiting. "
-                        "The fetcher will automatically retry failed requests up to 3 times with exponential backoff. "
+                        "Failed requests are retried once immediately, and again with a backoff if recovery retries are enabled. "
                         "If you continue to see this warning, consider using a proxy or checking your network connection."
                     )
             raise
@@ -242,7 +556,7 @@ class TranscriptFetcher:
             logger.exception("Unexpected error while fetching transcript for %s", video_id)
             raise
 
-    def _decide_fetch_method(self, yt_api: YouTubeTranscriptApi, video_id: str) -> list[Transcript]:
+    def _decide_fetch_method(self, yt_api: YouTubeTranscriptApi, video_id: str) -> list[Transcript] | CompactTranscript:
         """
         Selects and executes the appropriate transcript retrieval strategy.
 
@@ -275,7 +589,7 @@ class TranscriptFetcher:
         self,
         yt_api: YouTubeTranscriptApi,
         video_id: str
-    ) -> list[Transcript]:
+    ) -> list[Transcript] | CompactTranscript:
         """
         Fetches manually created transcripts for the given video.
 
@@ -300,13 +614,13 @@ class TranscriptFetcher:
             .find_manually_created_transcript(language_codes=self.languages)
         )
         raw = transcript.fetch().to_raw_data()
-        return self._convert_to_transcript_object(raw)
+        return self._to_segments(raw)
 
     def _fetch_first_available_transcript(
         self,
         yt_api: YouTubeTranscriptApi,
         video_id: str
-    ) -> list[Transcript]:
+    ) -> list[Transcript] | CompactTranscript:
         """
         Fetches the first available transcript for a video.
 
@@ -326,14 +640,14 @@ class TranscriptFetcher:
         transcript_list = yt_api.list(video_id)
         for transcript in transcript_list:
             raw = transcript.fetch().to_raw_data()
-            return self._convert_to_transcript_object(raw)
+            return self._to_segments(raw)
         
         return []
     def _fetch_by_languages(
         self,
         yt_api: YouTubeTranscriptApi,
         video_id: str
-    ) -> list[Transcript]:
+    ) -> list[Transcript] | CompactTranscript:
         """
         Fetches a transcript matching the configured language priority.
 
@@ -361,24 +675,34 @@ class TranscriptFetcher:
             languages=self.languages
         ).to_raw_data()
 
-        return self._convert_to_transcript_object(raw)
+        return self._to_segments(raw)
 
-    def _submit_tasks(self, executor: futures.ThreadPoolExecutor) -> tuple[dict[futures.Future, str], list[FailedTranscript]]:
+    def _submit_tasks(
+        self,
+        executor: futures.ThreadPoolExecutor,
+        video_ids: list[str] | None = None,
+        blocked: threading.Event | None = None
+    ) -> tuple[dict[futures.Future, str], list[FailedTranscript]]:
         tasks = {}
         cancelled = []
-        for video_id in self.video_ids:
-            if self._ip_blocked.is_set():
-                cancelled.append(FailedTranscript(
-                    video_id=video_id,
-                    reason="IpBlocked",
-                    message="Cancelled due to IP block",
-                    is_permanent_exception=False
-                ))
+        run_task = self._run_task if self.profiler is None else self.profiler.task(self._run_task)
+        for video_id in self.video_ids if video_ids is None else video_ids:
+            if blocked is not None and blocked.is_set():
+                cancelled.append(self._cancelled_by_ip_block(video_id))
             else:
-                tasks[executor.submit(self._fetch_single, video_id)] = video_id
+                if self.metrics is not None:
+                    self.metrics.transcript_queue_depth.inc()
+                tasks[executor.submit(run_task, video_id, blocked)] = video_id
         return tasks, cancelled
 
-    def _collect_results(self, tasks: dict[futures.Future, str]) -> TranscriptFetchResult:
+    def _collect_results(
+        self,
+        tasks: dict[futures.Future, str],
+        on_result: Callable[[VideoTranscript | FailedTranscript], None] | None = None,
+        executor: futures.ThreadPoolExecutor | None = None,
+        blocked: threading.Event | None = None,
+        queued: Iterable[str] = ()
+    ) -> TranscriptFetchResult:
         """
         Collects successful VideoTranscript objects from completed futures.
 
@@ -386,56 +710,174 @@ class TranscriptFetcher:
         non-None results, and returns them as a list. Progress is displayed
         using a tqdm progress bar unless disabled.
 
+        With an `executor`, the `queued` videos are submitted as results come in, keeping at
+        most two tasks per worker in flight. Transient failures are not final: each video waits
+        for its own backoff (see `_retry_delay`) and is then submitted ahead of the queued
+        videos, up to `retry_attempts` times. Results are reported once, when final.
+
         Args:
             tasks: List of Future objects representing in-progress transcript
                 fetch operations.
+            on_result: Called with each result. Defaults to the constructor's `on_result`.
+            executor: Pool to submit queued videos and retries to. Without one, nothing is retried.
+            blocked: IP-block flag of the fetch pass, set when a task raises `IpBlocked`.
+            queued: Video IDs not submitted yet. Requires an `executor`.
         """
+        on_result = on_result or self.on_result
         success: list[VideoTranscript] = []
         failed: list[FailedTranscript] = []
 
-        for future in tqdm(futures.as_completed(tasks), total=len(tasks), desc="Fetching transcripts", unit='transcript', disable=should_disable_progress()):
-            video_id = tasks[future]
+        pending = dict(tasks)
+        fresh = deque(queued)
+        total = len(pending) + len(fresh)
+        # Enough queued work to keep every worker busy while results are handled here.
+        window = 2 * self.max_concurrent_requests
+        # Videos waiting for a retry: a heap of (ready time, video id), and their last failure.
+        delayed: list[tuple[float, str]] = []
+        waiting: dict[str, FailedTranscript] = {}
+        attempts: Counter[str] = Counter()
+        stopped = False
+
+        with tqdm(total=total, desc="Fetching transcripts", unit='transcript', disable=should_disable_progress()) as progress:
+            while (pending or delayed or fresh) and not stopped:
+                while len(pending) < window:
+                    if delayed and (delayed[0][0] <= time.monotonic() or not (pending or fresh)):
+                        ready, video_id = heapq.heappop(delayed)
+                        # Only sleeps when there is nothing else to fetch.
+                        time.sleep(max(0.0, ready - time.monotonic()))
+                        waiting.pop(video_id)
+                    elif fresh:
+                        video_id = fresh.popleft()
+                    else:
+                        break
+
+                    assert executor is not None, "Only videos with an executor are queued or retried."
+                    submitted, cancelled = self._submit_tasks(executor, [video_id], blocked)
+                    pending.update(submitted)
+                    for failure in cancelled:
+                        failed.append(self._report(failure, on_result))
+                        progress.update()
+
+                if not pending:
+                    continue
+
+                timeout = max(0.0, delayed[0][0] - time.monotonic()) if delayed else None
+                done, _ = futures.wait(pending, timeout=timeout, return_when=futures.FIRST_COMPLETED)
+
+                for future in done:
+                    video_id = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except IpBlocked as e:
+                        logger.error('IP blocked. Stopping all operations.')
+                        stopped = True
+                        if blocked is not None:
+                            blocked.set()
+                        result = self._failure_from_exception(video_id, e)
+                    except Exception as e:
+                        result = self._failure_from_exception(video_id, e)
+
+                    if (
+                        executor is not None
+                        and not stopped
+                        and isinstance(result, FailedTranscript)
+                        and result.reason in RETRYABLE_ERRORS
+                        and attempts[video_id] < self.retry_attempts
+                    ):
+                        attempts[video_id] += 1
+                        delay = self._retry_delay(attempts[video_id])
+                        logger.debug("Retrying %s in %.1f seconds (attempt %d).", video_id, delay, attempts[video_id])
+                        heapq.heappush(delayed, (time.monotonic() + delay, video_id))
+                        waiting[video_id] = result
+                        self._count_queued_retry()
+                        continue
+
+                    if isinstance(result, VideoTranscript):
+                        success.append(self._report(result, on_result))
+                        if attempts[video_id] and self.stats is not None:
+                            self.stats.increment("recovered")
+                    else:
+                        failed.append(self._report(result, on_result))
+                    progress.update()
+
+            if stopped:
+                self._cancel_tasks(tasks=pending)
+                # Videos waiting for a retry keep their last failure.
+                failed.extend(self._report(failure, on_result) for failure in waiting.values())
+                failed.extend(self._report(self._cancelled_by_ip_block(video_id), on_result) for video_id in fresh)
+
+        logger.info("Collected %d successful transcripts out of %d tasks", len(success), total)
+
+        return TranscriptFetchResult(success=success, failed=failed)
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Backoff before retry `attempt` (1-based): `retry_delay` doubled per attempt, jittered
+        by ±50% so retries of videos that failed together spread out, and capped at `retry_max_delay`.
+        """
+        return min(self.retry_max_delay, self.retry_delay * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+
+    def _count_queued_retry(self) -> None:
+        if self.stats is not None:
+            self.stats.increment("retries")
+        if self.metrics is not None:
+            self.metrics.retries.inc()
+
+    def _report(self, result: ResultT, on_result: Callable[[VideoTranscript | FailedTranscript], None] | None = None) -> ResultT:
+        self._observe(result)
+        if on_result is not None:
             try:
-                result = future.result()
-                if isinstance(result, VideoTranscript):
-                    success.append(result)
-                elif isinstance(result, FailedTranscript):
-                    failed.append(result)
-            except IpBlocked:
-                logger.error('IP blocked. Stopping all operations.')
-                failed.append(FailedTranscript(
-                    video_id=video_id,
-                    reason="IpBlocked",
-                    message="Fetch stopped due to IP block",
-                    is_permanent_exception=False
-                ))
-                self._cancel_tasks(tasks=tasks)
-                break
-            except RequestException as e:
-                logger.debug(
-                    "Failed to fetch transcript for %s after retries: %s",
-                    video_id,
-                    str(e)
-                )
-                failed.append(FailedTranscript(
-                    video_id=video_id,
-                    reason="TransientNetworkError",
-                    message="Connection failed after retries"
-                ))
-            except Exception as e:
-                logger.exception('Unexpected error while retrieving result from future.')
-                failed.append(FailedTranscript(
-                    video_id=video_id,
-                    reason="UnexpectedError",
-                    message=str(e)
-                ))
+                on_result(result)
+            except Exception:
+                logger.exception("on_result callback failed for %s", result.video_id)
+        return result
 
-        logger.info("Collected %d successful transcripts out of %d tasks", len(success), len(tasks))
+    def _observe(self, result: VideoTranscript | FailedTranscript) -> None:
+        if self.metrics is not None:
+            self.metrics.transcripts.inc(result="success" if isinstance(result, VideoTranscript) else result.reason)
 
-        return TranscriptFetchResult(success=success, failed=failed)
-    
     @staticmethod
-    def _cancel_tasks(tasks: dict[futures.Future, str]):
+    def _cancelled_by_ip_block(video_id: str) -> FailedTranscript:
+        return FailedTranscript(
+            video_id=video_id,
+            reason="IpBlocked",
+            message="Cancelled due to IP block",
+            is_permanent_exception=False
+        )
+
+    @staticmethod
+    def _failure_from_exception(video_id: str, error: Exception) -> FailedTranscript:
+        """
+        Converts an exception raised while fetching `video_id` into a `FailedTranscript`.
+        """
+        if isinstance(error, IpBlocked):
+            return FailedTranscript(
+                video_id=video_id,
+                reason="IpBlocked",
+                message="Fetch stopped due to IP block",
+                is_permanent_exception=False
+            )
+
+        if isinstance(error, RequestException):
+            logger.debug(
+                "Failed to fetch transcript for %s after retries: %s",
+                video_id,
+                str(error)
+            )
+            return FailedTranscript(
+                video_id=video_id,
+                reason="TransientNetworkError",
+                message="Connection failed after retries"
+            )
+
+        logger.error('Unexpected error while retrieving transcript for %s.', video_id, exc_info=error)
+        return FailedTranscript(
+            video_id=video_id,
+            reason="UnexpectedError",
+            message=str(error)
+        )
+
+    def _cancel_tasks(self, tasks: dict[futures.Future, str]):
         cancelled_count = 0
         for f, vid in tasks.items():
             if not f.done():
@@ -444,49 +886,72 @@ class TranscriptFetcher:
                     logger.debug("Task for %s still running and cannot be cancelled", vid)
                 else:
                     cancelled_count += 1
+                    if self.metrics is not None:
+                        self.metrics.transcript_queue_depth.dec()
         
         if cancelled_count:
             logger.info("Cancelled %d queued tasks due to IP block.", cancelled_count)
 
     @staticmethod
-    def _clean_transcripts(transcripts: list[Transcript]) -> list[Transcript]:
+    def _clean_transcripts(
+        transcripts: list[Transcript] | CompactTranscript,
+        normalizer: TranscriptNormalizer | None = None
+    ) -> list[Transcript] | CompactTranscript:
         """
         Cleans unnecessary text from transcripts like [Music], [Applause], etc.
+
+        The whole transcript is normalized in one batched pass, see `TranscriptNormalizer`.
+
+        Args:
+            transcripts: Transcript segments to clean. `Transcript` lists are cleaned in place,
+                a `CompactTranscript` is replaced by a cleaned copy.
+            normalizer: Pipeline to apply. Defaults to `TranscriptNormalizer.default()`.
+
         Returns:
-            list[Transcript]: list of Transcript objects.
+            list[Transcript] | CompactTranscript: Cleaned segments.
         """
-        for entry in transcripts:
-
-            # Remove unnecessary text patterns like [Music], [Applause], etc.
-            cleaned_text = re.sub(r'\[.*?\]', '', entry.text)
+        normalizer = normalizer or TranscriptNormalizer.default()
+        if normalizer.is_noop:
+            return transcripts
 
-            # Remove leading '>>' markers (and optional spaces)
-            cleaned_text = re.sub(r'^\s*>>\s*', '', cleaned_text)
+        if isinstance(transcripts, CompactTranscript):
+            return transcripts.with_texts(normalizer.normalize(transcripts.texts()))
 
-            # Remove extra whitespace
-            cleaned_text = ' '.join(cleaned_text.split())
+        cleaned_texts = normalizer.normalize([entry.text for entry in transcripts])
 
-            # Update the transcript text
+        for entry, cleaned_text in zip(transcripts, cleaned_texts):
             entry.text = cleaned_text
 
         return transcripts
     
+    def _to_segments(self, raw: list[dict]) -> list[Transcript] | CompactTranscript:
+        """
+        Builds the configured segment representation from raw API data.
+        """
+        if not self.compact_transcripts:
+            return self._convert_to_transcript_object(raw, strict=self.strict_validation)
+
+        if self.strict_validation:
+            return CompactTranscript.from_segments(self._convert_to_transcript_object(raw, strict=True))
+
+        return CompactTranscript.from_raw(raw)
+
     @staticmethod
-    def _convert_to_transcript_object(transcript_dict: list[dict]) -> list[Transcript]:
+    def _convert_to_transcript_object(transcript_dict: list[dict], strict: bool = False) -> list[Transcript]:
         """
         Converts raw transcript dictionaries to Transcript model objects.
 
-        Uses Pydantic model validation to ensure each dictionary conforms to
-        the Transcript model schema. Assumes all input dictionaries are valid
-        and complete.
+        The whole list is validated in one pydantic-core call, which is considerably
+        faster than validating segment by segment. Assumes all input dictionaries are
+        valid and complete.
 
         Args:
             transcript_dict: List of dictionaries containing raw transcript data
                 with fields like text, start, and duration.
+            strict: Validate in pydantic strict mode (no type coercion).
 
         Returns:
             List of validated Transcript model objects.
         """
         # No need for exception handling, transcripts should be complete.
-        return [Transcript.model_validate(transcript) for transcript in transcript_dict]
-
+        return _TRANSCRIPT_LIST_ADAPTER.validate_python(transcript_dict, strict=strict)
@@ -3,6 +3,12 @@ import concurrent.futures
 import logging
 from ytfetcher.models.channel import DLSnippet, Comment, VideoComments
 from ytfetcher.utils.state import should_disable_progress
+from ytfetcher.filters import FilterExpression, combine
+from ytfetcher.utils.helpers import dedupe_video_ids
+from ytfetcher.utils.singleflight import SingleFlight
+from ytfetcher.stats import RunStats
+from ytfetcher.metrics import FetchMetrics
+from ytfetcher.profiling import RunProfiler
 from ytfetcher.exceptions import (
     YTFetcherError,
     ChannelFetchError,
@@ -15,19 +21,76 @@ from ytfetcher.exceptions import (
     InCompleteVideoId,
     VideoUnavailable
 )
-from yt_dlp.utils import DownloadError
+from yt_dlp.utils import DownloadError, DownloadCancelled
 from tqdm import tqdm
 from abc import ABC, abstractmethod
 from urllib.parse import urlparse, parse_qs
-from typing import Any, cast, Literal
+from typing import Any, Callable, Iterable, Iterator, TypeVar, cast, Literal
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pydantic import ValidationError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Shared by all concurrent fetchers so identical in-flight extractions run once.
+_YOUTUBE_DL_FLIGHTS: SingleFlight[tuple, Any] = SingleFlight()
+
+class _ListingComplete(DownloadCancelled):
+    """Raised from the match filter to stop pagination once enough matches were collected."""
+    msg = "Collected enough matching entries, stopping listing."
+
+class _PushdownMatcher:
+    """
+    yt-dlp `match_filter` callable that evaluates snippet filters while a listing paginates.
+
+    Matching entries are collected as they arrive, so `limit` counts matching videos
+    instead of listed ones and pagination stops as soon as the limit is reached.
+    For newest-first listings, `stop_before` (a `YYYYMMDD` upload date) also stops
+    pagination at the first entry uploaded before it.
+    """
+    def __init__(self, filters: list[Callable[[DLSnippet], bool]], limit: int | None, stop_before: str | None = None):
+        self.filters = filters
+        self.predicate = combine(filters)
+        self.limit = limit
+        self.stop_before = stop_before
+        self.snippets: list[DLSnippet] = []
+        self.scanned = 0
+
+    def __call__(self, info_dict: Any, *, incomplete: bool = False) -> str | None:
+        # Playlist-level info is matched too; it has no video id.
+        if "id" not in info_dict:
+            return None
+
+        self.scanned += 1
+
+        try:
+            snippet = DLSnippet.model_validate(dict(info_dict))
+        except ValidationError:
+            logger.debug("Failed to validate a snippet, skipping.")
+            return "Invalid entry"
+
+        if self.stop_before and snippet.upload_date and snippet.upload_date < self.stop_before:
+            logger.debug("Reached videos uploaded before %s, stopping listing.", self.stop_before)
+            raise _ListingComplete()
+
+        if not self.predicate(snippet):
+            return f"{snippet.video_id} does not match filters"
+
+        self.snippets.append(snippet)
+
+        if self.limit is not None and len(self.snippets) >= self.limit:
+            raise _ListingComplete()
+
+        return None
+
 class BaseYoutubeDLFetcher(ABC):
     """
     Abstract base class for YouTube data fetching using yt_dlp.
     """
+    newest_first: bool = False
+    """Whether listed entries are ordered by upload date, newest first."""
 
     def __init__(self, max_results: int | None = 20):
         """
@@ -38,12 +101,135 @@ class BaseYoutubeDLFetcher(ABC):
                 Set to None to fetch all available entries. Defaults to 20.
         """
         self.max_results = max_results
+        self.filters: list[Callable[[DLSnippet], bool]] = []
+        self.stats: RunStats | None = None
+        self.metrics: FetchMetrics | None = None
+        self.profiler: RunProfiler | None = None
 
     @abstractmethod
     def fetch(self) -> list[DLSnippet]:
         """Abstract method to be implemented by subclasses."""
         pass
 
+    def push_down_filters(self, filters: Iterable[Callable[[DLSnippet], bool]]) -> None:
+        """
+        Evaluates snippet filters during listing instead of after it.
+
+        Fetchers that paginate a listing (channels and playlists) apply the filters to each
+        entry as it arrives, so `max_results` counts matching videos and pagination stops
+        as soon as enough matches were found. Other fetchers ignore them.
+
+        Args:
+            filters: Predicates every snippet must satisfy.
+        """
+        self.filters = list(filters)
+
+    def attach_stats(self, stats: RunStats | None) -> None:
+        """
+        Sets the run statistics that extractions and failures are counted in.
+
+        Args:
+            stats: Statistics of the current run, or None to stop counting.
+        """
+        self.stats = stats
+
+    def attach_metrics(self, metrics: FetchMetrics | None) -> None:
+        """
+        Sets the metrics registry that extraction counts, latencies and failures are recorded in.
+
+        Args:
+            metrics: Process-wide metrics, or None to stop recording.
+        """
+        self.metrics = metrics
+
+    def attach_profiler(self, profiler: RunProfiler | None) -> None:
+        """
+        Sets the profiler that worker pool tasks are profiled with.
+
+        Args:
+            profiler: Profiler of the current run, or None to stop profiling.
+        """
+        self.profiler = profiler
+
+    def _task(self, fn: Callable[..., T]) -> Callable[..., T]:
+        """Wraps a worker pool task for the attached profiler, if any."""
+        return fn if self.profiler is None else self.profiler.task(fn)
+
+    @contextmanager
+    def _extraction(self) -> Iterator[None]:
+        """Counts and times one yt-dlp extraction."""
+        if self.stats is not None:
+            self.stats.increment("ytdlp_extractions")
+
+        if self.metrics is None:
+            yield
+            return
+
+        fetcher = type(self).__name__
+        self.metrics.ytdlp_extractions.inc(fetcher=fetcher)
+        with self.metrics.ytdlp_in_flight.track(), self.metrics.ytdlp_duration.time(fetcher=fetcher):
+            yield
+
+    def _record_failure(self, error: Exception) -> None:
+        if self.stats is not None:
+            self.stats.record_failure(type(error).__name__, source="ytdlp")
+        if self.metrics is not None:
+            self.metrics.ytdlp_failures.inc(reason=type(error).__name__)
+
+    def _extract_listing(self, url: str) -> list[DLSnippet]:
+        """
+        Lists a paginated channel tab or playlist, honouring pushed down filters.
+        """
+        ydl_opts = self._setup_ydl_opts()
+
+        if not self.filters:
+            if self.max_results is not None:
+                ydl_opts["playlistend"] = self.max_results
+
+            with self._extraction(), yt_dlp.YoutubeDL(ydl_opts) as ydl: #type: ignore[arg-type]
+                info = ydl.extract_info(url, download=False)
+                entries = cast(list[dict[str, Any]], info.get("entries", []))
+                return self._to_snippets(entries)
+
+        matcher = _PushdownMatcher(
+            filters=self.filters,
+            limit=self.max_results,
+            stop_before=self._recency_cutoff() if self.newest_first else None
+        )
+        ydl_opts.update(lazy_playlist=True, match_filter=matcher)
+
+        try:
+            with self._extraction(), yt_dlp.YoutubeDL(ydl_opts) as ydl: #type: ignore[arg-type]
+                ydl.extract_info(url, download=False)
+        except _ListingComplete:
+            pass
+
+        logger.debug(
+            "Listing scanned %d entries, %d matched the filters.",
+            matcher.scanned,
+            len(matcher.snippets)
+        )
+        return matcher.snippets
+
+    def _recency_cutoff(self) -> str | None:
+        """
+        Returns the oldest upload date (YYYYMMDD) the pushed down filter expressions accept, if any.
+        """
+        cutoffs: list[str] = []
+        for f in self.filters:
+            if not isinstance(f, FilterExpression):
+                continue
+
+            upload_date = f.lower_bound("upload_date")
+            if isinstance(upload_date, str):
+                cutoffs.append(upload_date)
+
+            timestamp = f.lower_bound("timestamp")
+            if isinstance(timestamp, (int, float)):
+                cutoffs.append(datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y%m%d"))
+
+        return max(cutoffs) if cutoffs else None
+
     def _setup_ydl_opts(self, **extra_opts) -> dict:
         """Prepare yt_dlp options with safe defaults for metadata extraction."""
         base_opts = {
@@ -51,6 +237,8 @@ class BaseYoutubeDLFetcher(ABC):
             "skip_download": True,
             "extract_flat": True,
             "no_warnings": True,
+            # Parse "3 weeks ago" style labels so flat entries carry an (approximate) timestamp.
+            "extractor_args": {"youtubetab": {"approximate_date": [""]}},
         }
         base_opts.update(extra_opts)
         return base_opts
@@ -76,33 +264,63 @@ class ConcurrentYoutubeDLFetcher(BaseYoutubeDLFetcher):
         Initialize the concurrent fetcher.
 
         Args:
-            video_ids (list[str]): List of YouTube video IDs to process.
+            video_ids (list[str]): List of YouTube video IDs to process. Duplicates are fetched once.
             info (str | None): Short name for the type of data being fetched (for logging).
             description (str | None): Description text for the tqdm progress bar.
         """
-        self.video_ids = video_ids
+        self.video_ids = dedupe_video_ids(video_ids)
         self.info = info
         self.description = description
+        self.stats = None
+        self.metrics = None
+        self.profiler = None
+
+        if len(self.video_ids) < len(video_ids):
+            logger.debug(f"Skipping {len(video_ids) - len(self.video_ids)} duplicate video ids.")
     
     def fetch(self) -> list:
+        """
+        Fetches every video once and returns the results in input order.
+        """
         logger.info(f"Starting to fetch {self.info} for {len(self.video_ids)} videos...")
         with concurrent.futures.ThreadPoolExecutor(max_workers=30) as executor:
-            futures = [executor.submit(self.fetch_single, video_id) for video_id in self.video_ids]
-            results = []
+            fetch_single = self._task(self.fetch_single)
+            futures = {executor.submit(fetch_single, video_id): video_id for video_id in self.video_ids}
+            results = {}
             for future in tqdm(concurrent.futures.as_completed(futures), total=len(self.video_ids), desc=self.description, disable=should_disable_progress()):
                 try:
                     res = future.result()
                     if res is not None:
-                        results.append(res)
+                        results[futures[future]] = res
                 except YTFetcherError as e:
                     logger.warning(str(e))
+                    self._record_failure(e)
                     continue
-                except Exception:
+                except Exception as e:
                     logger.exception("Thread encountered an unexpected error while fetching data.")
-            return results
+                    self._record_failure(e)
+            return [results[video_id] for video_id in self.video_ids if video_id in results]
 
-    @abstractmethod
     def fetch_single(self, video_id: str):
+        """
+        Fetches one video, sharing the call with identical in-flight requests.
+
+        Concurrent calls with the same fetcher type, video id and options, from any
+        fetcher instance in the process, share one yt-dlp extraction and its result or exception.
+        """
+        key = (type(self).__name__, *self._flight_key(video_id))
+        return _YOUTUBE_DL_FLIGHTS.do(key, lambda: self._extract(video_id))
+
+    def _extract(self, video_id: str):
+        with self._extraction():
+            return self._fetch_single(video_id)
+
+    def _flight_key(self, video_id: str) -> tuple:
+        """Returns the video id and every option that changes the result of `_fetch_single`."""
+        return (video_id,)
+
+    @abstractmethod
+    def _fetch_single(self, video_id: str):
         """Must be implemented by subclass"""
         pass
 
@@ -125,7 +343,10 @@ class CommentFetcher(ConcurrentYoutubeDLFetcher):
         self.max_comments = max_comments
         self.sort = sort
             
-    def fetch_single(self, video_id: str) -> VideoComments:
+    def _flight_key(self, video_id: str) -> tuple:
+        return (video_id, self.max_comments, self.sort)
+
+    def _fetch_single(self, video_id: str) -> VideoComments:
         video_url = f'https://www.youtube.com/watch?v={video_id}'
         ydl_opts_deep = {
             "quiet": True,
@@ -169,6 +390,7 @@ class ChannelFetcher(BaseYoutubeDLFetcher):
     """
     Fetches recent videos from a YouTube channel via handles or URLs.
     """
+    newest_first = True
 
     def __init__(self, channel_handle: str, max_results: int | None = 20, tab: Literal['videos', 'shorts', 'streams'] = 'videos'):
         """
@@ -189,17 +411,10 @@ class ChannelFetcher(BaseYoutubeDLFetcher):
             self.channel_handle = self._find_channel_handle_from_url(channel_handle)
 
     def fetch(self) -> list[DLSnippet]:
-        ydl_opts = self._setup_ydl_opts()
-        if self.max_results is not None:
-            ydl_opts["playlistend"] = self.max_results
-
         url = f"https://www.youtube.com/@{self.channel_handle.replace('@', '').strip()}/{self.tab}"
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl: #type: ignore[arg-type]
-                info = ydl.extract_info(url, download=False)
-                entries = cast(list[dict[str, Any]], info.get("entries", []))
-                return self._to_snippets(entries)
+            return self._extract_listing(url)
 
         except DownloadError as e:
             msg = str(e).lower()
@@ -249,16 +464,9 @@ class PlaylistFetcher(BaseYoutubeDLFetcher):
             self.playlist_id = self._find_playlist_id_from_url(url=playlist_id)
 
     def fetch(self) -> list[DLSnippet]:
-        ydl_opts = self._setup_ydl_opts()
-        if self.max_results is not None:
-            ydl_opts["playlistend"] = self.max_results
-
         url = f"https://www.youtube.com/playlist?list={self.playlist_id.strip()}"
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl: #type: ignore[arg-type]
-                info = ydl.extract_info(url, download=False)
-                entries = cast(list[dict[str, Any]], info.get("entries", []))
-                return self._to_snippets(entries)
+            return self._extract_listing(url)
         except DownloadError as e:
             msg = str(e).lower()
 
@@ -303,7 +511,7 @@ class SearchFetcher(BaseYoutubeDLFetcher):
         logger.info(f"Searching via yt-dlp: '{self.query}'")
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl: #type: ignore[arg-type]
+            with self._extraction(), yt_dlp.YoutubeDL(ydl_opts) as ydl: #type: ignore[arg-type]
                 info = ydl.extract_info(search_query, download=False)
                 entries = cast(list[dict[str, Any]], info.get("entries", []))
                 return self._to_snippets(entries)
@@ -327,7 +535,7 @@ class VideoListFetcher(ConcurrentYoutubeDLFetcher):
         """
         super().__init__(video_ids, 'metadata', 'Extracting Metadata')
 
-    def fetch_single(self, video_id: str) -> DLSnippet:
+    def _fetch_single(self, video_id: str) -> DLSnippet:
         ydl_opts = self._setup_ydl_opts()
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl: #type: ignore[arg-type]
@@ -349,4 +557,78 @@ class VideoListFetcher(ConcurrentYoutubeDLFetcher):
         
         except Exception as e:
             logger.debug(f'Critical yt-dlp failure for VideoListFetcher: {video_id}', exc_info=True)
-            raise VideoListFetchError(f"Unexpected error while fetching from video ID: {video_id}") from e
\ No newline at end of file
+            raise VideoListFetchError(f"Unexpected error while fetching from video ID: {video_id}") from e
+
+class MultiSourceFetcher(BaseYoutubeDLFetcher):
+    """
+    Lists several sources concurrently and merges them into one deduplicated snippet list.
+
+    Each video is returned once, in the order it was first listed, while `source_video_ids`
+    keeps every source's own ordered list of video ids so results can be mapped back to all
+    sources that listed a video. A failing source is logged and recorded in `failed_sources`
+    instead of aborting the whole run.
+    """
+    def __init__(self, sources: dict[str, BaseYoutubeDLFetcher], max_workers: int = 4):
+        """
+        Initialize the MultiSourceFetcher.
+
+        Args:
+            sources (dict[str, BaseYoutubeDLFetcher]): Fetchers keyed by unique source name.
+            max_workers (int): Number of sources listed concurrently. Defaults to 4.
+        """
+        super().__init__(max_results=None)
+        self.sources = sources
+        self.max_workers = max_workers
+        self.source_video_ids: dict[str, list[str]] = {}
+        self.failed_sources: dict[str, str] = {}
+
+    def push_down_filters(self, filters: Iterable[Callable[[DLSnippet], bool]]) -> None:
+        super().push_down_filters(filters)
+        for fetcher in self.sources.values():
+            fetcher.push_down_filters(self.filters)
+
+    def attach_stats(self, stats: RunStats | None) -> None:
+        super().attach_stats(stats)
+        for fetcher in self.sources.values():
+            fetcher.attach_stats(stats)
+
+    def attach_metrics(self, metrics: FetchMetrics | None) -> None:
+        super().attach_metrics(metrics)
+        for fetcher in self.sources.values():
+            fetcher.attach_metrics(metrics)
+
+    def attach_profiler(self, profiler: RunProfiler | None) -> None:
+        super().attach_profiler(profiler)
+        for fetcher in self.sources.values():
+            fetcher.attach_profiler(profiler)
+
+    def fetch(self) -> list[DLSnippet]:
+        logger.info(f"Listing {len(self.sources)} sources...")
+        listed: dict[str, list[DLSnippet]] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = {executor.submit(self._task(fetcher.fetch)): name for name, fetcher in self.sources.items()}
+            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc='Listing Sources', disable=should_disable_progress()):
+                name = futures[future]
+                try:
+                    listed[name] = future.result()
+                except Exception as e:
+                    if not isinstance(e, YTFetcherError):
+                        logger.debug(f"Unexpected error while listing source {name}", exc_info=True)
+                    logger.warning(f"Skipping source {name}: {e}")
+                    self.failed_sources[name] = str(e)
+                    self._record_failure(e)
+
+        snippets: dict[str, DLSnippet] = {}
+        for name in self.sources:
+            if name not in listed:
+                continue
+
+            self.source_video_ids[name] = list(dict.fromkeys(snippet.video_id for snippet in listed[name]))
+            for snippet in listed[name]:
+                snippets.setdefault(snippet.video_id, snippet)
+
+        total = sum(len(ids) for ids in self.source_video_ids.values())
+        logger.info(f"Listed {len(snippets)} unique videos ({total - len(snippets)} duplicates across sources).")
+
+        return list(snippets.values())
@@ -1,3 +1,23 @@
+from ytfetcher.cache.base import CacheBackend, CacheEntry, CacheStats, build_transcript_cache_key
 from ytfetcher.cache.sqlite_cache import SQLiteCache
+from ytfetcher.cache.sharded_sqlite_cache import ShardedSQLiteCache
+from ytfetcher.cache.filesystem_cache import FileSystemCache
+from ytfetcher.cache.memory_cache import MemoryCache
+from ytfetcher.cache.factory import create_cache
+from ytfetcher.cache.write_behind import WriteBehindCache
+from ytfetcher.cache.archive import export_cache, import_cache
 
-__all__ = ["SQLiteCache"]
+__all__ = [
+    "CacheBackend",
+    "CacheEntry",
+    "CacheStats",
+    "build_transcript_cache_key",
+    "SQLiteCache",
+    "ShardedSQLiteCache",
+    "FileSystemCache",
+    "MemoryCache",
+    "create_cache",
+    "WriteBehindCache",
+    "export_cache",
+    "import_cache"
+]
@@ -0,0 +1,95 @@
+from pathlib import Path
+from typing import IO, Iterator
+from ytfetcher.cache.base import CacheBackend, CacheEntry
+from ytfetcher.exceptions import InvalidCacheArchive
+import gzip
+import itertools
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMAT = "ytfetcher-cache"
+ARCHIVE_VERSION = 1
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8", newline="\n")
+
+def export_cache(cache: CacheBackend, path: str) -> int:
+    """
+    Writes every cache entry to a portable JSON Lines archive, gzip-compressed if `path` ends in `.gz`.
+
+    The archive does not depend on the backend, so it can move entries between machines or
+    between backends, e.g. from SQLite to the filesystem store.
+
+    Args:
+        cache (CacheBackend): Cache to export.
+        path (str): Archive path, e.g. `cache.jsonl.gz`.
+
+    Returns:
+        int: Number of exported entries.
+    """
+    archive = Path(path).expanduser()
+    archive.parent.mkdir(parents=True, exist_ok=True)
+
+    count = 0
+    with _open(archive, "w") as f:
+        f.write(json.dumps({"format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION}) + "\n")
+        for entry in cache.export_entries():
+            f.write(json.dumps(entry._asdict()) + "\n")
+            count += 1
+
+    logger.debug("Exported %d cache entries to %s", count, archive)
+    return count
+
+def import_cache(cache: CacheBackend, path: str, batch_size: int = 1000) -> int:
+    """
+    Loads an archive written by `export_cache` into `cache`. Existing entries are only replaced by newer ones.
+
+    Args:
+        cache (CacheBackend): Cache to import into.
+        path (str): Archive path.
+        batch_size (int): Entries written per backend call. Defaults to 1000.
+
+    Returns:
+        int: Number of entries written.
+
+    Raises:
+        InvalidCacheArchive: If the file is missing, not an archive, or has an unsupported version.
+    """
+    archive = Path(path).expanduser()
+    if not archive.is_file():
+        raise InvalidCacheArchive(f"Cache archive not found: {archive}")
+
+    written = 0
+    try:
+        with _open(archive, "r") as f:
+            entries = _read_entries(f, archive)
+            while batch := list(itertools.islice(entries, batch_size)):
+                written += cache.import_entries(batch)
+    except (OSError, UnicodeDecodeError) as e:
+        raise InvalidCacheArchive(f"Could not read cache archive {archive}: {e}") from e
+
+    logger.debug("Imported %d cache entries from %s", written, archive)
+    return written
+
+def _read_entries(lines: IO[str], archive: Path) -> Iterator[CacheEntry]:
+    try:
+        header = json.loads(next(lines, "") or "null")
+    except json.JSONDecodeError:
+        header = None
+
+    if not isinstance(header, dict) or header.get("format") != ARCHIVE_FORMAT:
+        raise InvalidCacheArchive(f"{archive} is not a ytfetcher cache archive.")
+    if header.get("version") != ARCHIVE_VERSION:
+        raise InvalidCacheArchive(f"Unsupported cache archive version {header.get('version')!r} in {archive}.")
+
+    for line_number, line in enumerate(lines, start=2):
+        if not line.strip():
+            continue
+        try:
+            yield CacheEntry(**json.loads(line))
+        except (json.JSONDecodeError, TypeError) as e:
+            raise InvalidCacheArchive(f"Invalid entry on line {line_number} of {archive}: {e}") from e
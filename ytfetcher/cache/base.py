@@ -0,0 +1,211 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Literal, NamedTuple, Protocol, runtime_checkable
+from ytfetcher.models.channel import FailedTranscript, VideoTranscript
+from ytfetcher.models.compact import CompactTranscript
+from ytfetcher.normalizers import TranscriptNormalizer
+import json
+import time
+
+CacheBackendName = Literal["sqlite", "sharded-sqlite", "filesystem", "memory"]
+
+@dataclass
+class CacheStats:
+    """
+    Summary of a cache backend's contents.
+    """
+    backend: str
+    """Backend name, e.g. 'sqlite'."""
+
+    location: str
+    """Where the cache lives (file or directory path, or ':memory:')."""
+
+    entries: int
+    """Total number of cached rows."""
+
+    successes: int
+    """Number of cached transcripts."""
+
+    failures: int
+    """Number of cached permanent failures."""
+
+    size_bytes: int
+    """Approximate on-disk (or in-memory payload) size in bytes."""
+
+    payload_bytes: int = 0
+    """Total size of the cached transcript payloads in bytes."""
+
+    by_cache_key: dict[str, int] = field(default_factory=dict)
+    """Number of entries per cache key (i.e. per language / transcript option combination)."""
+
+    age_histogram: dict[str, int] = field(default_factory=dict)
+    """Number of entries per age bucket ('<1d', '1-7d', '7-30d', '30-90d', '>=90d')."""
+
+    @property
+    def avg_payload_bytes(self) -> float:
+        """Average transcript payload size in bytes."""
+        return self.payload_bytes / self.successes if self.successes else 0.0
+
+    @classmethod
+    def from_entries(cls, backend: str, location: str, entries: Iterable["CacheEntry"], size_bytes: int | None = None) -> "CacheStats":
+        """
+        Builds stats by scanning entries. Used by backends without an aggregate query.
+
+        Args:
+            size_bytes: Storage size. Defaults to the total payload size.
+        """
+        now = time.time()
+        stats = cls(backend=backend, location=location, entries=0, successes=0, failures=0, size_bytes=0)
+
+        for entry in entries:
+            stats.entries += 1
+            if entry.status == "SUCCESS":
+                stats.successes += 1
+                stats.payload_bytes += len(entry.payload or "")
+            else:
+                stats.failures += 1
+            stats.by_cache_key[entry.cache_key] = stats.by_cache_key.get(entry.cache_key, 0) + 1
+            bucket = age_bucket((now - entry.updated_at) / 86400)
+            stats.age_histogram[bucket] = stats.age_histogram.get(bucket, 0) + 1
+
+        stats.size_bytes = stats.payload_bytes if size_bytes is None else size_bytes
+        return stats
+
+    @classmethod
+    def combine(cls, backend: str, location: str, parts: Iterable["CacheStats"]) -> "CacheStats":
+        """Sums the stats of several stores, e.g. the shards of one cache."""
+        stats = cls(backend=backend, location=location, entries=0, successes=0, failures=0, size_bytes=0)
+        for part in parts:
+            stats.entries += part.entries
+            stats.successes += part.successes
+            stats.failures += part.failures
+            stats.size_bytes += part.size_bytes
+            stats.payload_bytes += part.payload_bytes
+            for key, count in part.by_cache_key.items():
+                stats.by_cache_key[key] = stats.by_cache_key.get(key, 0) + count
+            for bucket, count in part.age_histogram.items():
+                stats.age_histogram[bucket] = stats.age_histogram.get(bucket, 0) + count
+        return stats
+
+class CacheEntry(NamedTuple):
+    """
+    One raw cache row, as exported to and imported from cache archives.
+    """
+    video_id: str
+    cache_key: str
+    status: str
+    """'SUCCESS' or 'FAILED'."""
+    fail_reason: str | None
+    payload: str | None
+    """`VideoTranscript` JSON for successful entries."""
+    updated_at: float
+    """Unix timestamp of the last write."""
+
+# Upper bounds in days for the stats age histogram; older entries fall into OLDEST_AGE_BUCKET.
+AGE_BUCKETS: tuple[tuple[int, str], ...] = ((1, "<1d"), (7, "1-7d"), (30, "7-30d"), (90, "30-90d"))
+OLDEST_AGE_BUCKET = ">=90d"
+
+def age_bucket(age_days: float) -> str:
+    for limit, label in AGE_BUCKETS:
+        if age_days < limit:
+            return label
+    return OLDEST_AGE_BUCKET
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """
+    Storage interface used by `YTFetcher` to read and write cached transcripts.
+
+    Entries are addressed by `(video_id, cache_key)`, where the cache key is built with
+    `build_transcript_cache_key()` from the transcript options. Implementations must be
+    safe to call from several threads.
+    """
+    ttl: int
+
+    def get_cached_states(self, video_ids: list[str], cache_key: str) -> tuple[list[VideoTranscript], list[FailedTranscript]]:
+        """Returns the cached transcripts and permanent failures for `video_ids`. Missing ids are omitted."""
+        ...
+
+    def upsert_transcripts(self, transcripts: list[VideoTranscript], cache_key: str) -> None:
+        """Stores or replaces transcripts."""
+        ...
+
+    def upsert_failures(self, failures: list[FailedTranscript], cache_key: str) -> None:
+        """Stores or replaces permanent failures so they are not fetched again."""
+        ...
+
+    def upsert_results(self, transcripts: list[VideoTranscript], failures: list[FailedTranscript], cache_key: str) -> None:
+        """Stores transcripts and permanent failures together, in one transaction where the backend has them."""
+        ...
+
+    def purge_expired(self, older_than_days: int | None = None) -> int:
+        """Removes entries older than `older_than_days` (default: `ttl`) days and returns how many were removed."""
+        ...
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        ...
+
+    def vacuum(self) -> None:
+        """Reclaims storage left behind by deleted entries."""
+        ...
+
+    def stats(self) -> CacheStats:
+        """Returns a summary of the cache contents."""
+        ...
+
+    def export_entries(self) -> Iterator[CacheEntry]:
+        """Yields every raw entry, e.g. to write a portable archive."""
+        ...
+
+    def import_entries(self, entries: Iterable[CacheEntry]) -> int:
+        """Stores raw entries, keeping whichever copy of an entry is newer. Returns how many were written."""
+        ...
+
+def build_transcript_cache_key(
+    languages: list[str] | str,
+    manually_created: bool,
+    normalizer: TranscriptNormalizer | None = None
+) -> str:
+    """
+    Builds the cache key of transcripts fetched with the given options.
+
+    Transcripts are cached after normalization, so a non-default `normalizer` is part of the key.
+    The default normalizer is left out to keep keys written by earlier versions valid.
+    """
+    key: dict[str, Any] = {
+        "languages": languages,
+        "manually_created": manually_created,
+    }
+    if normalizer is not None and normalizer != TranscriptNormalizer.default():
+        key["normalizer"] = normalizer.fingerprint
+    return json.dumps(key, sort_keys=True)
+
+def decode_transcript(payload: str, strict_validation: bool = False, compact_transcripts: bool = False) -> VideoTranscript:
+    """
+    Decodes a cached `VideoTranscript` JSON payload.
+
+    Args:
+        payload (str): JSON produced by `VideoTranscript.model_dump_json()`.
+        strict_validation (bool): Validate in pydantic strict mode.
+        compact_transcripts (bool): Decode segments into a `CompactTranscript`.
+    """
+    if not compact_transcripts:
+        return VideoTranscript.model_validate_json(payload, strict=strict_validation)
+
+    if strict_validation:
+        transcript = VideoTranscript.model_validate_json(payload, strict=True)
+        transcript.transcripts = CompactTranscript.from_segments(transcript.transcripts)
+        return transcript
+
+    data = json.loads(payload)
+    return VideoTranscript.model_construct(
+        video_id=data["video_id"],
+        transcripts=CompactTranscript.from_raw(data["transcripts"])
+    )
+
+def cached_failure(video_id: str, fail_reason: str | None) -> FailedTranscript:
+    return FailedTranscript(
+        video_id=video_id,
+        reason=fail_reason or "Unknown",
+        message=f"Cached failure: {fail_reason}"
+    )
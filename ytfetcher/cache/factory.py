@@ -0,0 +1,61 @@
+from typing import TYPE_CHECKING
+from ytfetcher.cache.base import CacheBackend
+from ytfetcher.cache.filesystem_cache import FileSystemCache
+from ytfetcher.cache.memory_cache import MemoryCache
+from ytfetcher.cache.sharded_sqlite_cache import ShardedSQLiteCache
+from ytfetcher.cache.sqlite_cache import SQLiteCache
+
+if TYPE_CHECKING:
+    from ytfetcher.config.fetch_config import FetchOptions
+
+def create_cache(options: "FetchOptions") -> CacheBackend | None:
+    """
+    Builds the cache backend selected by `options.cache_backend`.
+
+    Args:
+        options (FetchOptions): Fetch options. A `CacheBackend` instance in `cache_backend` is returned as-is.
+
+    Returns:
+        CacheBackend | None: The backend, or None when caching is disabled.
+
+    Raises:
+        ValueError: If `cache_backend` names an unknown backend.
+    """
+    if not options.cache_enabled:
+        return None
+
+    backend = options.cache_backend
+    if not isinstance(backend, str):
+        return backend
+
+    match backend:
+        case "sqlite":
+            return SQLiteCache(
+                cache_dir=options.cache_path,
+                ttl=options.cache_ttl,
+                strict_validation=options.strict_validation,
+                compact_transcripts=options.compact_transcripts
+            )
+        case "sharded-sqlite":
+            return ShardedSQLiteCache(
+                cache_dir=options.cache_path,
+                shards=options.cache_shards,
+                ttl=options.cache_ttl,
+                strict_validation=options.strict_validation,
+                compact_transcripts=options.compact_transcripts
+            )
+        case "filesystem":
+            return FileSystemCache(
+                cache_dir=options.cache_path,
+                ttl=options.cache_ttl,
+                strict_validation=options.strict_validation,
+                compact_transcripts=options.compact_transcripts
+            )
+        case "memory":
+            return MemoryCache(
+                ttl=options.cache_ttl,
+                strict_validation=options.strict_validation,
+                compact_transcripts=options.compact_transcripts
+            )
+        case _:
+            raise ValueError(f"Unknown cache backend: {backend!r}. Use 'sqlite', 'sharded-sqlite', 'filesystem' or 'memory'.")
@@ -0,0 +1,214 @@
+from pathlib import Path
+from typing import Iterable, Iterator
+from ytfetcher.cache.base import CacheEntry, CacheStats, cached_failure, decode_transcript
+from ytfetcher.models.channel import FailedTranscript, VideoTranscript
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+class FileSystemCache:
+    """
+    Content-addressed transcript cache stored as one JSON file per entry.
+
+    Each `(video_id, cache_key)` pair is hashed with SHA-256 and stored under
+    `<cache_dir>/transcripts/<aa>/<bb>/<hash>.json`. Files are written to a temporary name and
+    atomically renamed, so several processes or machines can share the directory (for example
+    over NFS or a synced object-store mirror) without a lock: readers see either the old or
+    the new entry, and the last writer wins.
+
+    Expired entries are ignored on read and removed by `purge_expired()`, which walks the whole
+    tree and is therefore not run automatically.
+    """
+    def __init__(self, cache_dir: str, ttl: int = 7, strict_validation: bool = False, compact_transcripts: bool = False):
+        """
+        Initialize the FileSystemCache.
+
+        Args:
+            cache_dir (str): Directory holding the `transcripts/` tree. Will be expanded if using tilde.
+            ttl (int): Time-To-Live in days. Use 0 to disable expiration. Defaults to 7.
+            strict_validation (bool): Validate cached payloads in pydantic strict mode.
+            compact_transcripts (bool): Decode cached payloads into `CompactTranscript` containers.
+
+        Raises:
+            ValueError: If the provided cache_dir exists but is not a directory.
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+
+        if self.cache_dir.exists() and not self.cache_dir.is_dir():
+            raise ValueError('cache_dir must be a directory.')
+
+        self.root = self.cache_dir / "transcripts"
+        self.ttl = ttl
+        self.strict_validation = strict_validation
+        self.compact_transcripts = compact_transcripts
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, video_id: str, cache_key: str) -> Path:
+        digest = hashlib.sha256(f"{cache_key}\0{video_id}".encode("utf-8")).hexdigest()
+        return self.root / digest[:2] / digest[2:4] / f"{digest}.json"
+
+    def _is_expired(self, updated_at: float, now: float, days: int | None = None) -> bool:
+        days = self.ttl if days is None else days
+        return days > 0 and now - updated_at >= days * 86400
+
+    def _read(self, path: Path) -> dict | None:
+        try:
+            return json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable cache entry at %s", path)
+            return None
+
+    def get_cached_states(self, video_ids: list[str], cache_key: str) -> tuple[list[VideoTranscript], list[FailedTranscript]]:
+        successes: list[VideoTranscript] = []
+        failures: list[FailedTranscript] = []
+        now = time.time()
+
+        for video_id in video_ids:
+            entry = self._read(self._path(video_id, cache_key))
+            if entry is None or self._is_expired(entry["updated_at"], now):
+                continue
+
+            if entry["status"] == "SUCCESS" and entry["payload"]:
+                successes.append(decode_transcript(entry["payload"], self.strict_validation, self.compact_transcripts))
+            else:
+                failures.append(cached_failure(video_id, entry["fail_reason"]))
+
+        logger.debug(
+            "Cache lookup for %d videos | hits=%d successes, %d known failures",
+            len(video_ids), len(successes), len(failures)
+        )
+
+        return successes, failures
+
+    def upsert_transcripts(self, transcripts: list[VideoTranscript], cache_key: str) -> None:
+        for transcript in transcripts:
+            self._write(transcript.video_id, cache_key, "SUCCESS", None, transcript.model_dump_json())
+
+        if transcripts:
+            logger.debug("Upserted %d transcripts into cache with key=%s", len(transcripts), cache_key)
+
+    def upsert_failures(self, failures: list[FailedTranscript], cache_key: str) -> None:
+        for failure in failures:
+            self._write(failure.video_id, cache_key, "FAILED", failure.reason, None)
+
+        if failures:
+            logger.debug("Upserted %d failures into cache with key=%s", len(failures), cache_key)
+
+    def upsert_results(self, transcripts: list[VideoTranscript], failures: list[FailedTranscript], cache_key: str) -> None:
+        # Every entry is its own file, replaced atomically; there is no wider transaction.
+        self.upsert_transcripts(transcripts, cache_key)
+        self.upsert_failures(failures, cache_key)
+
+    def _write(
+        self,
+        video_id: str,
+        cache_key: str,
+        status: str,
+        fail_reason: str | None,
+        payload: str | None,
+        updated_at: float | None = None
+    ) -> None:
+        path = self._path(video_id, cache_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "video_id": video_id,
+            "cache_key": cache_key,
+            "status": status,
+            "fail_reason": fail_reason,
+            "payload": payload,
+            "updated_at": time.time() if updated_at is None else updated_at,
+        }
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _entries(self):
+        return self.root.glob("*/*/*.json")
+
+    def purge_expired(self, older_than_days: int | None = None) -> int:
+        days = self.ttl if older_than_days is None else older_than_days
+        if days <= 0:
+            logger.debug("TTL <= 0, skipping cache purge.")
+            return 0
+
+        now = time.time()
+        deleted = 0
+        for path in self._entries():
+            entry = self._read(path)
+            if entry is not None and self._is_expired(entry["updated_at"], now, days):
+                path.unlink(missing_ok=True)
+                deleted += 1
+
+        return deleted
+
+    def clear(self) -> None:
+        logger.info("Clearing entire transcript cache at %s", self.root)
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def vacuum(self) -> None:
+        """
+        Removes temporary files left by interrupted writes (older than an hour) and empty shard directories.
+        """
+        cutoff = time.time() - 3600
+        for path in self.root.glob("*/*/.tmp-*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                pass
+
+        for directory in sorted(self.root.glob("*/*"), reverse=True) + sorted(self.root.glob("*")):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+
+    def stats(self) -> CacheStats:
+        size = 0
+
+        def entries() -> Iterator[CacheEntry]:
+            nonlocal size
+            for path, entry in self._read_all():
+                size += path.stat().st_size
+                yield entry
+
+        stats = CacheStats.from_entries(backend="filesystem", location=str(self.root), entries=entries())
+        stats.size_bytes = size
+        return stats
+
+    def _read_all(self) -> Iterator[tuple[Path, CacheEntry]]:
+        for path in self._entries():
+            entry = self._read(path)
+            if entry is not None:
+                yield path, CacheEntry(
+                    entry["video_id"], entry["cache_key"], entry["status"],
+                    entry["fail_reason"], entry["payload"], entry["updated_at"]
+                )
+
+    def export_entries(self) -> Iterator[CacheEntry]:
+        for _, entry in self._read_all():
+            yield entry
+
+    def import_entries(self, entries: Iterable[CacheEntry]) -> int:
+        written = 0
+        for entry in entries:
+            current = self._read(self._path(entry.video_id, entry.cache_key))
+            if current is None or entry.updated_at > current["updated_at"]:
+                self._write(entry.video_id, entry.cache_key, entry.status, entry.fail_reason, entry.payload, entry.updated_at)
+                written += 1
+        return written
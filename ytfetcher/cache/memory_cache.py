@@ -0,0 +1,127 @@
+from typing import Iterable, Iterator, NamedTuple
+from ytfetcher.cache.base import CacheEntry, CacheStats, cached_failure, decode_transcript
+from ytfetcher.models.channel import FailedTranscript, VideoTranscript
+import threading
+import time
+
+class _Entry(NamedTuple):
+    status: str
+    fail_reason: str | None
+    payload: str | None
+    updated_at: float
+
+class MemoryCache:
+    """
+    Process-local transcript cache kept in a dictionary.
+
+    Useful for tests, one-off runs and long-lived services that should not touch the disk.
+    Payloads are stored serialized, so cached results are independent copies.
+    """
+    def __init__(self, ttl: int = 7, strict_validation: bool = False, compact_transcripts: bool = False):
+        """
+        Initialize the MemoryCache.
+
+        Args:
+            ttl (int): Time-To-Live in days. Use 0 to disable expiration. Defaults to 7.
+            strict_validation (bool): Validate cached payloads in pydantic strict mode.
+            compact_transcripts (bool): Decode cached payloads into `CompactTranscript` containers.
+        """
+        self.ttl = ttl
+        self.strict_validation = strict_validation
+        self.compact_transcripts = compact_transcripts
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._lock = threading.Lock()
+
+    def _is_expired(self, entry: _Entry, now: float, days: int | None = None) -> bool:
+        days = self.ttl if days is None else days
+        return days > 0 and now - entry.updated_at >= days * 86400
+
+    def get_cached_states(self, video_ids: list[str], cache_key: str) -> tuple[list[VideoTranscript], list[FailedTranscript]]:
+        now = time.time()
+        with self._lock:
+            found = [(video_id, self._entries.get((cache_key, video_id))) for video_id in video_ids]
+
+        successes: list[VideoTranscript] = []
+        failures: list[FailedTranscript] = []
+
+        for video_id, entry in found:
+            if entry is None or self._is_expired(entry, now):
+                continue
+            if entry.status == "SUCCESS" and entry.payload:
+                successes.append(decode_transcript(entry.payload, self.strict_validation, self.compact_transcripts))
+            else:
+                failures.append(cached_failure(video_id, entry.fail_reason))
+
+        return successes, failures
+
+    def upsert_transcripts(self, transcripts: list[VideoTranscript], cache_key: str) -> None:
+        now = time.time()
+        rows = {
+            (cache_key, transcript.video_id): _Entry("SUCCESS", None, transcript.model_dump_json(), now)
+            for transcript in transcripts
+        }
+        with self._lock:
+            self._entries.update(rows)
+
+    def upsert_failures(self, failures: list[FailedTranscript], cache_key: str) -> None:
+        now = time.time()
+        rows = {
+            (cache_key, failure.video_id): _Entry("FAILED", failure.reason, None, now)
+            for failure in failures
+        }
+        with self._lock:
+            self._entries.update(rows)
+
+    def upsert_results(self, transcripts: list[VideoTranscript], failures: list[FailedTranscript], cache_key: str) -> None:
+        now = time.time()
+        rows = {
+            (cache_key, transcript.video_id): _Entry("SUCCESS", None, transcript.model_dump_json(), now)
+            for transcript in transcripts
+        }
+        rows.update(
+            ((cache_key, failure.video_id), _Entry("FAILED", failure.reason, None, now))
+            for failure in failures
+        )
+        with self._lock:
+            self._entries.update(rows)
+
+    def purge_expired(self, older_than_days: int | None = None) -> int:
+        days = self.ttl if older_than_days is None else older_than_days
+        if days <= 0:
+            return 0
+
+        now = time.time()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if self._is_expired(entry, now, days)]
+            for key in expired:
+                del self._entries[key]
+
+        return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def vacuum(self) -> None:
+        """Nothing to reclaim; deleted entries are freed immediately."""
+
+    def stats(self) -> CacheStats:
+        return CacheStats.from_entries(backend="memory", location=":memory:", entries=self.export_entries())
+
+    def export_entries(self) -> Iterator[CacheEntry]:
+        with self._lock:
+            items = list(self._entries.items())
+
+        for (cache_key, video_id), entry in items:
+            yield CacheEntry(video_id, cache_key, entry.status, entry.fail_reason, entry.payload, entry.updated_at)
+
+    def import_entries(self, entries: Iterable[CacheEntry]) -> int:
+        written = 0
+        with self._lock:
+            for entry in entries:
+                key = (entry.cache_key, entry.video_id)
+                current = self._entries.get(key)
+                if current is None or entry.updated_at > current.updated_at:
+                    self._entries[key] = _Entry(entry.status, entry.fail_reason, entry.payload, entry.updated_at)
+                    written += 1
+        return written
@@ -0,0 +1,146 @@
+from concurrent import futures
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+from ytfetcher.cache.base import CacheEntry, CacheStats
+from ytfetcher.cache.sqlite_cache import SQLiteCache
+from ytfetcher.models.channel import FailedTranscript, VideoTranscript
+import logging
+import zlib
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class ShardedSQLiteCache:
+    """
+    Transcript cache spread over several SQLite files to scale concurrent writers.
+
+    SQLite serializes writers per database file, so many processes writing to one
+    `cache.sqlite3` contend for the same lock. This backend hashes each video id (CRC32) into
+    one of `shards` databases stored in `<cache_dir>/shards-<N>/`, so writers only contend
+    when they touch the same shard. Batched lookups and upserts are grouped by shard and run
+    in parallel, one transaction per shard.
+
+    The shard count is part of the directory name, so changing it starts a new, empty layout
+    instead of reading entries from the wrong shard.
+    """
+    def __init__(
+        self,
+        cache_dir: str,
+        shards: int = 8,
+        ttl: int = 7,
+        strict_validation: bool = False,
+        compact_transcripts: bool = False
+    ):
+        """
+        Initialize the ShardedSQLiteCache.
+
+        Args:
+            cache_dir (str): Directory holding the `shards-<N>/` directory. Will be expanded if using tilde.
+            shards (int): Number of SQLite files. Defaults to 8.
+            ttl (int): Time-To-Live in days. Use 0 to disable expiration. Defaults to 7.
+            strict_validation (bool): Validate cached payloads in pydantic strict mode.
+            compact_transcripts (bool): Decode cached payloads into `CompactTranscript` containers.
+
+        Raises:
+            ValueError: If shards is less than 1 or cache_dir exists but is not a directory.
+        """
+        if shards < 1:
+            raise ValueError('shards must be at least 1.')
+
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.shard_dir = self.cache_dir / f"shards-{shards}"
+        self.ttl = ttl
+        self.shards = [
+            SQLiteCache(
+                cache_dir=str(self.shard_dir),
+                ttl=ttl,
+                strict_validation=strict_validation,
+                compact_transcripts=compact_transcripts,
+                filename=f"shard-{index:02d}.sqlite3"
+            )
+            for index in range(shards)
+        ]
+
+    def shard_for(self, video_id: str) -> SQLiteCache:
+        return self.shards[zlib.crc32(video_id.encode("utf-8")) % len(self.shards)]
+
+    def _group(self, items: list[T], video_id: Callable[[T], str]) -> dict[int, list[T]]:
+        groups: dict[int, list[T]] = {}
+        for item in items:
+            index = zlib.crc32(video_id(item).encode("utf-8")) % len(self.shards)
+            groups.setdefault(index, []).append(item)
+        return groups
+
+    def _fan_out(self, groups: dict[int, list[Any]], call: Callable[[SQLiteCache, list[Any]], T]) -> list[T]:
+        if len(groups) <= 1:
+            return [call(self.shards[index], items) for index, items in groups.items()]
+
+        with futures.ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix="ytfetcher-shard") as executor:
+            tasks = [executor.submit(call, self.shards[index], items) for index, items in groups.items()]
+            return [task.result() for task in tasks]
+
+    def get_cached_states(self, video_ids: list[str], cache_key: str) -> tuple[list[VideoTranscript], list[FailedTranscript]]:
+        results = self._fan_out(
+            self._group(video_ids, lambda video_id: video_id),
+            lambda shard, ids: shard.get_cached_states(video_ids=ids, cache_key=cache_key)
+        )
+
+        successes = [transcript for shard_successes, _ in results for transcript in shard_successes]
+        failures = [failure for _, shard_failures in results for failure in shard_failures]
+        return successes, failures
+
+    def upsert_transcripts(self, transcripts: list[VideoTranscript], cache_key: str) -> None:
+        self._fan_out(
+            self._group(transcripts, lambda transcript: transcript.video_id),
+            lambda shard, items: shard.upsert_transcripts(transcripts=items, cache_key=cache_key)
+        )
+
+    def upsert_failures(self, failures: list[FailedTranscript], cache_key: str) -> None:
+        self._fan_out(
+            self._group(failures, lambda failure: failure.video_id),
+            lambda shard, items: shard.upsert_failures(failures=items, cache_key=cache_key)
+        )
+
+    def upsert_results(self, transcripts: list[VideoTranscript], failures: list[FailedTranscript], cache_key: str) -> None:
+        # One transaction per shard, holding both the transcripts and the failures of that shard.
+        groups: dict[int, list[VideoTranscript | FailedTranscript]] = self._group(
+            [*transcripts, *failures], lambda result: result.video_id
+        )
+        self._fan_out(
+            groups,
+            lambda shard, items: shard.upsert_results(
+                transcripts=[item for item in items if isinstance(item, VideoTranscript)],
+                failures=[item for item in items if isinstance(item, FailedTranscript)],
+                cache_key=cache_key
+            )
+        )
+
+    def purge_expired(self, older_than_days: int | None = None) -> int:
+        return sum(shard.purge_expired(older_than_days) for shard in self.shards)
+
+    def clear(self) -> None:
+        logger.info("Clearing entire transcript cache at %s", self.shard_dir)
+        for shard in self.shards:
+            shard.clear()
+
+    def vacuum(self) -> None:
+        for shard in self.shards:
+            shard.vacuum()
+
+    def stats(self) -> CacheStats:
+        return CacheStats.combine(
+            backend="sharded-sqlite",
+            location=str(self.shard_dir),
+            parts=[shard.stats() for shard in self.shards]
+        )
+
+    def export_entries(self) -> Iterator[CacheEntry]:
+        for shard in self.shards:
+            yield from shard.export_entries()
+
+    def import_entries(self, entries: Iterable[CacheEntry]) -> int:
+        return sum(self._fan_out(
+            self._group(list(entries), lambda entry: entry.video_id),
+            lambda shard, items: shard.import_entries(items)
+        ))
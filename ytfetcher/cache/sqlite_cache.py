@@ -2,6 +2,16 @@ import sqlite3
 import json
 import logging
 from pathlib import Path
+from typing import Iterable, Iterator
+from ytfetcher.cache.base import (
+    AGE_BUCKETS,
+    OLDEST_AGE_BUCKET,
+    CacheEntry,
+    CacheStats,
+    build_transcript_cache_key,
+    cached_failure,
+    decode_transcript
+)
 from ytfetcher.models.channel import FailedTranscript, VideoTranscript
 
 logger = logging.getLogger(__name__)
@@ -14,7 +24,15 @@ class SQLiteCache:
     providing methods to store, retrieve, and manage transcript entries
     with support for multiple cache keys and language configurations.
     """
-    def __init__(self, cache_dir: str, ttl: int = 7):
+    def __init__(
+        self,
+        cache_dir: str,
+        ttl: int = 7,
+        strict_validation: bool = False,
+        compact_transcripts: bool = False,
+        filename: str = "cache.sqlite3",
+        purge_interval: int = 3600
+    ):
         """
         Initialize the SQLiteCache.
 
@@ -23,6 +41,14 @@ class SQLiteCache:
                 will be stored. Will be expanded if using tilde (e.g., "~/cache").
             ttl (int): Time-To-Live in days. Cached entries older than this 
                 will be considered expired. Defaults to 7.
+            strict_validation (bool): Validate cached payloads in pydantic strict mode.
+                Defaults to False.
+            compact_transcripts (bool): Decode cached payloads into `CompactTranscript`
+                containers instead of `Transcript` models. Defaults to False.
+            filename (str): Name of the database file inside cache_dir. Defaults to "cache.sqlite3".
+            purge_interval (int): Minimum seconds between the automatic purges run on
+                initialization. The last purge time is stored in the database, so it is shared
+                by every process using it. 0 purges on every initialization. Defaults to 3600.
 
         Raises:
             ValueError: If the provided cache_dir exists but is not a directory.
@@ -32,8 +58,11 @@ class SQLiteCache:
         if self.cache_dir.exists() and not self.cache_dir.is_dir():
             raise ValueError('cache_dir must be a directory.')
         
-        self.db_file = self.cache_dir / "cache.sqlite3"
+        self.db_file = self.cache_dir / filename
         self.ttl = ttl
+        self.strict_validation = strict_validation
+        self.compact_transcripts = compact_transcripts
+        self.purge_interval = purge_interval
         self._initialize()
 
     def _connect(self) -> sqlite3.Connection:
@@ -74,12 +103,24 @@ class SQLiteCache:
 
             self._migrate(conn)
 
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_transcript_cache_updated_at ON transcript_cache (updated_at)")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (key TEXT PRIMARY KEY, value TEXT)")
+
         logger.debug("SQLite cache table ensured.")
 
-        if self.ttl > 0:
+        if self.ttl > 0 and self._purge_due():
             removed_rows = self.purge_expired()
             if removed_rows > 0:
                 logger.debug(f'Removed records older than {self.ttl} days. Total rows removed: {removed_rows}')
+
+    def _purge_due(self) -> bool:
+        with self._connect() as conn:
+            recent = conn.execute(
+                "SELECT 1 FROM cache_meta WHERE key = 'last_purge_at' AND value > datetime('now', ?)",
+                (f"-{self.purge_interval} seconds",)
+            ).fetchone()
+        return recent is None
+
     def _migrate(self, conn: sqlite3.Connection) -> None:
         existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(transcript_cache)")}
 
@@ -121,28 +162,54 @@ class SQLiteCache:
         with self._connect() as conn:
             conn.execute("DELETE from transcript_cache")
     
-    def purge_expired(self) -> int:
+    def purge_expired(self, older_than_days: int | None = None, batch_size: int = 5000) -> int:
         """
-        Remove rows older than ttl days.
+        Remove rows older than ttl days (or `older_than_days`, when given).
+
+        Rows are deleted in batches of `batch_size`, each in its own short transaction, so
+        concurrent readers and writers are never locked out for the whole purge.
         Returns the number of rows deleted.
         """
+        days = self.ttl if older_than_days is None else older_than_days
 
-        if self.ttl <= 0:
+        if days <= 0:
             logger.debug("TTL <= 0, skipping cache purge.")
             return 0
-        
+
         sql = """
         DELETE FROM transcript_cache
-        WHERE updated_at <= datetime('now', ?)
+        WHERE rowid IN (
+            SELECT rowid FROM transcript_cache
+            WHERE updated_at <= datetime('now', ?)
+            LIMIT ?
+        )
         """
 
+        deleted = 0
+        while True:
+            with self._connect() as conn:
+                removed = conn.execute(sql, (f"-{days} days", batch_size)).rowcount
+            deleted += removed
+            if removed < batch_size:
+                break
+
         with self._connect() as conn:
-            cur = conn.execute(sql, (f"-{self.ttl} days",))
-            deleted = cur.rowcount if hasattr(cur, "rowcount") else 0
-            conn.commit()
-        
+            conn.execute(
+                "INSERT INTO cache_meta (key, value) VALUES ('last_purge_at', datetime('now')) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+            )
+
         return deleted
 
+    def vacuum(self) -> None:
+        """
+        Rebuilds the database file to reclaim space left by deleted rows and truncates the WAL file.
+        """
+        logger.info("Vacuuming transcript cache at %s", self.db_file)
+        with self._connect() as conn:
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def get_cached_states(self, video_ids: list[str], cache_key: str) -> tuple[list[VideoTranscript], list[FailedTranscript]]:
         if not video_ids:
             logger.debug("Cache lookup skipped: empty video_ids list.")
@@ -153,22 +220,24 @@ class SQLiteCache:
             f"SELECT video_id, status, fail_reason, payload FROM transcript_cache WHERE cache_key = ? "
             f"AND video_id IN ({placeholders})"
         )
+        params: list[str] = [cache_key, *video_ids]
+
+        # Purges are rate-limited, so expired rows can still be present; never serve them.
+        if self.ttl > 0:
+            query += " AND updated_at > datetime('now', ?)"
+            params.append(f"-{self.ttl} days")
 
         with self._connect() as conn:
-            rows = conn.execute(query, [cache_key, *video_ids]).fetchall()
+            rows = conn.execute(query, params).fetchall()
 
         successes: list[VideoTranscript] = []
         failures: list[FailedTranscript] = []
 
         for video_id, status, fail_reason, payload in rows:
             if status == "SUCCESS" and payload:
-                successes.append(VideoTranscript.model_validate_json(payload))
+                successes.append(self._decode_transcript(payload))
             else:
-                failures.append(FailedTranscript(
-                    video_id=video_id,
-                    reason=fail_reason or "Unknown",
-                    message=f"Cached failure: {fail_reason}"
-                ))
+                failures.append(cached_failure(video_id, fail_reason))
 
         logger.debug(
             "Cache lookup for %d videos | hits=%d successes, %d known failures",
@@ -177,15 +246,83 @@ class SQLiteCache:
 
         return successes, failures
 
+    def _decode_transcript(self, payload: str) -> VideoTranscript:
+        return decode_transcript(payload, self.strict_validation, self.compact_transcripts)
+
+    def stats(self) -> CacheStats:
+        age_case = " ".join(f"WHEN age < {limit} THEN '{label}'" for limit, label in AGE_BUCKETS)
+
+        with self._connect() as conn:
+            per_key = conn.execute(
+                """
+                SELECT cache_key, COUNT(*), COALESCE(SUM(status = 'SUCCESS'), 0),
+                       COALESCE(SUM(CASE WHEN status = 'SUCCESS' THEN LENGTH(payload) END), 0)
+                FROM transcript_cache GROUP BY cache_key
+                """
+            ).fetchall()
+            ages = conn.execute(
+                f"""
+                SELECT CASE {age_case} ELSE '{OLDEST_AGE_BUCKET}' END AS bucket, COUNT(*)
+                FROM (SELECT julianday('now') - julianday(updated_at) AS age FROM transcript_cache)
+                GROUP BY bucket
+                """
+            ).fetchall()
+
+        total = sum(row[1] for row in per_key)
+        successes = sum(row[2] for row in per_key)
+        size = sum(
+            path.stat().st_size
+            for path in (self.db_file, self.db_file.with_name(self.db_file.name + "-wal"))
+            if path.exists()
+        )
+        return CacheStats(
+            backend="sqlite",
+            location=str(self.db_file),
+            entries=total,
+            successes=successes,
+            failures=total - successes,
+            size_bytes=size,
+            payload_bytes=sum(row[3] for row in per_key),
+            by_cache_key={row[0]: row[1] for row in per_key},
+            age_histogram=dict(ages)
+        )
+
+    def export_entries(self) -> Iterator[CacheEntry]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT video_id, cache_key, status, fail_reason, payload,
+                       COALESCE(CAST(strftime('%s', updated_at) AS REAL), 0)
+                FROM transcript_cache
+                """
+            )
+            for row in rows:
+                yield CacheEntry(*row)
+
+    def import_entries(self, entries: Iterable[CacheEntry]) -> int:
+        rows = [tuple(entry) for entry in entries]
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT INTO transcript_cache (video_id, cache_key, status, fail_reason, payload, updated_at)
+                VALUES (?, ?, ?, ?, ?, datetime(?, 'unixepoch'))
+                ON CONFLICT(video_id, cache_key) DO UPDATE SET
+                    status      = excluded.status,
+                    fail_reason = excluded.fail_reason,
+                    payload     = excluded.payload,
+                    updated_at  = excluded.updated_at
+                WHERE excluded.updated_at > transcript_cache.updated_at
+                """,
+                rows,
+            )
+            return conn.total_changes - before
+
     def upsert_transcripts(self, transcripts: list[VideoTranscript], cache_key: str) -> None:
         if not transcripts:
             return
 
-        rows = [
-            (transcript.video_id, cache_key, "SUCCESS", None, transcript.model_dump_json())
-            for transcript in transcripts
-        ]
-        self._upsert(rows)
+        self._upsert(self._transcript_rows(transcripts, cache_key))
 
         logger.debug("Upserted %d transcripts into cache with key=%s", len(transcripts), cache_key)
 
@@ -196,13 +333,37 @@ class SQLiteCache:
         if not failures:
             return
 
-        rows = [
+        self._upsert(self._failure_rows(failures, cache_key))
+
+        logger.debug("Upserted %d failures into cache with key=%s", len(failures), cache_key)
+
+    def upsert_results(self, transcripts: list[VideoTranscript], failures: list[FailedTranscript], cache_key: str) -> None:
+        """
+        Persists transcripts and permanent failures in a single transaction.
+        """
+        if not transcripts and not failures:
+            return
+
+        self._upsert(self._transcript_rows(transcripts, cache_key) + self._failure_rows(failures, cache_key))
+
+        logger.debug(
+            "Upserted %d transcripts and %d failures into cache with key=%s",
+            len(transcripts), len(failures), cache_key
+        )
+
+    @staticmethod
+    def _transcript_rows(transcripts: list[VideoTranscript], cache_key: str) -> list[tuple]:
+        return [
+            (transcript.video_id, cache_key, "SUCCESS", None, transcript.model_dump_json())
+            for transcript in transcripts
+        ]
+
+    @staticmethod
+    def _failure_rows(failures: list[FailedTranscript], cache_key: str) -> list[tuple]:
+        return [
             (failure.video_id, cache_key, "FAILED", failure.reason, None)
             for failure in failures
         ]
-        self._upsert(rows)
-
-        logger.debug("Upserted %d failures into cache with key=%s", len(failures), cache_key)
 
     def _upsert(self, rows: list[tuple]) -> None:
         with self._connect() as conn:
@@ -219,12 +380,4 @@ class SQLiteCache:
                 rows,
             )
 
-    @staticmethod
-    def build_transcript_cache_key(languages: list[str] | str, manually_created: bool) -> str:
-        return json.dumps(
-            {
-                "languages": languages,
-                "manually_created": manually_created,
-            },
-            sort_keys=True,
-        )
+    build_transcript_cache_key = staticmethod(build_transcript_cache_key)
@@ -0,0 +1,148 @@
+from ytfetcher.cache.base import CacheBackend
+from ytfetcher.metrics import FetchMetrics
+from ytfetcher.models.channel import FailedTranscript, VideoTranscript
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_FLUSH = object()
+_STOP = object()
+
+class WriteBehindCache:
+    """
+    Background writer that persists fetch results to a cache backend as they arrive.
+
+    `put()` only enqueues, so fetch threads never wait for disk. A single writer thread drains
+    the queue and writes batches of up to `max_batch_size` results, or whatever arrived within
+    `flush_interval` seconds of the first queued result, with one `upsert_results` call (a single
+    transaction on SQLite backends) per cache key. `close()` (or leaving the `with` block) writes everything still queued.
+
+    Transient failures are dropped, matching the synchronous path: only transcripts and
+    permanent failures are cached.
+
+    Example:
+        with WriteBehindCache(cache) as writer:
+            fetcher = TranscriptFetcher(video_ids, on_result=lambda r: writer.put(r, cache_key))
+            fetcher.fetch()
+    """
+    def __init__(
+        self,
+        backend: CacheBackend,
+        max_batch_size: int = 200,
+        flush_interval: float = 1.0,
+        metrics: FetchMetrics | None = None
+    ):
+        """
+        Initialize the WriteBehindCache and start its writer thread.
+
+        Args:
+            backend (CacheBackend): Cache to write to.
+            max_batch_size (int): Maximum number of results written per batch. Defaults to 200.
+            flush_interval (float): Maximum seconds a result waits in the queue before its batch
+                is written. Defaults to 1.0.
+            metrics (FetchMetrics | None): Registry to update with queue depth, writes and write errors.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1.")
+
+        self.backend = backend
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.metrics = metrics
+        self.written = 0
+        """Number of results persisted so far."""
+        self.failed_writes = 0
+        """Number of results whose batch could not be written."""
+
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ytfetcher-cache-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "WriteBehindCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def put(self, result: VideoTranscript | FailedTranscript, cache_key: str) -> None:
+        """
+        Queues a result for writing. Returns immediately.
+
+        Args:
+            result: A fetched transcript or failure. Transient failures are ignored.
+            cache_key: Cache key built from the transcript options.
+        """
+        if self._closed:
+            raise RuntimeError("WriteBehindCache is closed.")
+
+        if isinstance(result, FailedTranscript) and not result.is_permanent_exception:
+            return
+
+        if self.metrics is not None:
+            self.metrics.cache_write_queue_depth.inc()
+        self._queue.put((cache_key, result))
+
+    def flush(self) -> None:
+        """Blocks until every result queued so far has been written."""
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self) -> None:
+        """Writes all queued results and stops the writer thread."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+
+            while batch[-1] is not _FLUSH and batch[-1] is not _STOP and len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            items = [item for item in batch if item is not _FLUSH and item is not _STOP]
+            if self.metrics is not None:
+                self.metrics.cache_write_queue_depth.dec(len(items))
+            try:
+                self._write(items)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if batch[-1] is _STOP:
+                return
+
+    def _write(self, items: list[tuple[str, VideoTranscript | FailedTranscript]]) -> None:
+        grouped: dict[str, tuple[list[VideoTranscript], list[FailedTranscript]]] = {}
+        for cache_key, result in items:
+            transcripts, failures = grouped.setdefault(cache_key, ([], []))
+            if isinstance(result, VideoTranscript):
+                transcripts.append(result)
+            else:
+                failures.append(result)
+
+        for cache_key, (transcripts, failures) in grouped.items():
+            try:
+                self.backend.upsert_results(transcripts=transcripts, failures=failures, cache_key=cache_key)
+                self.written += len(transcripts) + len(failures)
+                if self.metrics is not None:
+                    self.metrics.cache_writes.inc(len(transcripts) + len(failures))
+            except Exception:
+                self.failed_writes += len(transcripts) + len(failures)
+                if self.metrics is not None:
+                    self.metrics.cache_write_errors.inc(len(transcripts) + len(failures))
+                logger.exception("Failed to write %d results to the cache.", len(transcripts) + len(failures))
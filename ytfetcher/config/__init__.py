@@ -1,8 +1,11 @@
-from .http_config import HTTPConfig
-from .fetch_config import FetchOptions
+from typing import TYPE_CHECKING, Any
 from .logging_config import setup_logging
-from .fetch_config import default_cache_path
-from youtube_transcript_api.proxies import ProxyConfig, GenericProxyConfig, WebshareProxyConfig
+import importlib
+
+if TYPE_CHECKING:
+    from .http_config import HTTPConfig
+    from .fetch_config import FetchOptions, default_cache_path
+    from youtube_transcript_api.proxies import ProxyConfig, GenericProxyConfig, WebshareProxyConfig
 
 __all__ = [
     "HTTPConfig",
@@ -12,4 +15,25 @@ __all__ = [
     "WebshareProxyConfig",
     "FetchOptions",
     "default_cache_path"
-]
\ No newline at end of file
+]
+
+# Loaded on first access, see `ytfetcher/__init__.py`.
+_LAZY_IMPORTS = {
+    "HTTPConfig": "ytfetcher.config.http_config",
+    "FetchOptions": "ytfetcher.config.fetch_config",
+    "default_cache_path": "ytfetcher.config.fetch_config",
+    "ProxyConfig": "youtube_transcript_api.proxies",
+    "GenericProxyConfig": "youtube_transcript_api.proxies",
+    "WebshareProxyConfig": "youtube_transcript_api.proxies",
+}
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
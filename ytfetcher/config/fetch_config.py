@@ -1,9 +1,16 @@
 from dataclasses import dataclass, field
-from typing import Iterable, Callable
+from typing import TYPE_CHECKING, Iterable, Callable
 from pathlib import Path
-from ytfetcher.config import HTTPConfig
+from ytfetcher.cache.base import CacheBackend, CacheBackendName
+from ytfetcher.config.http_config import HTTPConfig
+from ytfetcher.events import FetchEvents
+from ytfetcher.metrics import FetchMetrics
+from ytfetcher.profiling import RunProfiler
 from ytfetcher.models import DLSnippet
-from youtube_transcript_api.proxies import ProxyConfig
+from ytfetcher.normalizers import TranscriptNormalizer
+
+if TYPE_CHECKING:
+    from youtube_transcript_api.proxies import ProxyConfig
 
 def default_cache_path() -> str:
     """Get the default cache path for ytfetcher.
@@ -27,7 +34,7 @@ class FetchOptions:
     http_config: HTTPConfig = field(default_factory=HTTPConfig)
     """Custom HTTP settings including headers, cookies, and timeout configurations."""
 
-    proxy_config: ProxyConfig | None = None
+    proxy_config: "ProxyConfig | None" = None
     """Optional proxy settings to route requests through a specific gateway."""
 
     languages: Iterable[str] | None = None
@@ -36,6 +43,15 @@ class FetchOptions:
     manually_created: bool = False
     """If True, only fetches transcripts written by humans; skips auto-generated ones."""
 
+    normalizer: TranscriptNormalizer = field(default_factory=TranscriptNormalizer.default)
+    """Text-normalization pipeline applied to transcript segments. Use `TranscriptNormalizer.noop()` to keep raw text."""
+
+    strict_validation: bool = False
+    """If True, validates transcript segments from the API and the cache in pydantic strict mode."""
+
+    compact_transcripts: bool = False
+    """If True, stores transcript segments in a columnar `CompactTranscript` to reduce memory on large runs."""
+
     filters: list[Callable[["DLSnippet"], bool]] | None = None
     """A list of predicate functions to filter out specific videos before fetching data."""
 
@@ -45,14 +61,35 @@ class FetchOptions:
     cache_path: str = field(default_factory=default_cache_path)
     """The directory path where cached transcript files are stored."""
 
+    cache_backend: CacheBackendName | CacheBackend = "sqlite"
+    """Cache storage: 'sqlite' (single file), 'sharded-sqlite' (several SQLite files for many concurrent writers), 'filesystem' (sharded JSON files that several machines can share), 'memory', or a custom `CacheBackend` instance."""
+
+    cache_shards: int = 8
+    """Number of SQLite files used by the 'sharded-sqlite' cache backend."""
+
     cache_ttl: int = 7
     """Cache Time-To-Live in days. Data older than this will be re-fetched."""
 
     with_recovery: bool = True
-    """Retry transient failures once more after a short delay."""
+    """Retry transient failures. Each failed video waits for its own jittered backoff and then rejoins the worker pool while other videos are fetched. When False, a network error still gets one immediate retry and one retry after about 3 seconds."""
 
-    recovery_delay: int = 5
-    """Seconds to wait before the recovery retry."""
+    recovery_delay: float = 5
+    """Seconds before a video's first retry. Each further retry doubles the delay, and every delay is jittered by ±50%."""
+
+    recovery_attempts: int = 2
+    """Retries per video after a transient failure."""
+
+    recovery_max_delay: float = 60
+    """Upper bound of a retry delay in seconds."""
 
     max_concurrent_requests: int = 20
     """Maximum number of concurrent network requests to make when fetching transcripts."""
+
+    metrics: FetchMetrics | None = None
+    """Process-wide metrics registry updated by the transcript fetcher, yt-dlp fetchers and cache. Render it with `metrics.render()` or `metrics.write_textfile()`."""
+
+    events: FetchEvents | None = None
+    """Callbacks for per-video progress, failures, IP blocks, cache hits and phase timings, see `FetchEvents`."""
+
+    profile: RunProfiler | None = None
+    """Profiler that captures cProfile stats, wall vs CPU time and stack samples per phase and worker thread. Call `profile.write(directory)` after the run."""
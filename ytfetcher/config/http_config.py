@@ -1,20 +1,70 @@
-from ytfetcher.utils.headers import get_realistic_headers
+from ytfetcher.utils.headers import default_header_pool, get_realistic_headers
 from ytfetcher.exceptions import InvalidHeaders
 
 class HTTPConfig:
     """
     Configuration object for HTTP client settings.
 
-    This class provides a structured way to configure HTTP-related headers when making network requests. It ensures 
-    that headers are valid and assigns default, realistic browser-like headers 
+    This class provides a structured way to configure HTTP-related headers when making network requests. It ensures
+    that headers are valid and assigns default, realistic browser-like headers
     if none are provided.
 
-    Attributes:  
-        headers (dict): 
+    Attributes:
+        headers (dict):
             Dictionary of HTTP headers to be used in requests.
+        connect_timeout (float):
+            Seconds to wait for a connection to be established. Defaults to 10.
+        read_timeout (float):
+            Seconds to wait for the server between bytes of a response. Defaults to 10.
+        sessions (int):
+            Number of HTTP sessions the transcript workers are spread over. Each session has its own
+            cookie jar, connection pool and, unless `headers` are given, its own browser header
+            profile, so a large run does not look like one client. Defaults to 1.
+        pool_maxsize (int | None):
+            Connections kept open per host in each session. Defaults to the number of workers
+            sharing the session.
     """
-    def __init__(self, headers: dict | None = None):
+    def __init__(
+        self,
+        headers: dict | None = None,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 10.0,
+        sessions: int = 1,
+        pool_maxsize: int | None = None
+    ):
         self.headers = headers or get_realistic_headers()
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.sessions = sessions
+        self.pool_maxsize = pool_maxsize
+        self._custom_headers = headers is not None
 
         if headers is not None and not isinstance(headers, dict):
             raise InvalidHeaders("Invalid headers.")
+
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError("Timeouts must be positive.")
+
+        if sessions < 1:
+            raise ValueError("sessions must be at least 1.")
+
+        if pool_maxsize is not None and pool_maxsize < 1:
+            raise ValueError("pool_maxsize must be at least 1.")
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        """The (connect, read) timeout passed to `requests`."""
+        return (self.connect_timeout, self.read_timeout)
+
+    def session_headers(self, count: int) -> list[dict]:
+        """
+        Returns the headers of `count` sessions.
+
+        The first session uses `headers`. With default headers, the others get the next profiles
+        of `default_header_pool()`; custom headers are shared by all sessions.
+        """
+        if self._custom_headers:
+            return [dict(self.headers) for _ in range(count)]
+
+        pool = default_header_pool()
+        return [dict(self.headers), *(pool.next() for _ in range(count - 1))]
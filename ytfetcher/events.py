@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from typing import Any, Callable
+from ytfetcher.models.channel import DLSnippet, FailedTranscript, VideoTranscript
+import logging
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class FetchEvents:
+    """
+    Callbacks for following a `YTFetcher` run video by video, e.g. to drive a progress UI.
+
+    Set any subset and pass the instance as `FetchOptions.events`. Callbacks run in the thread
+    that called the fetch method, never in worker threads, so they may update UI state without
+    locking. They should return quickly: a slow callback delays collecting further results.
+    Exceptions raised by a callback are logged and ignored.
+
+    Example:
+        events = FetchEvents(
+            on_snippets_listed=lambda snippets: bar.reset(total=len(snippets)),
+            on_transcript_done=lambda transcript: bar.update(),
+            on_failure=lambda failure: bar.update(),
+            on_cache_hit=lambda result: bar.update(),
+        )
+        fetcher = YTFetcher.from_channel("TheOffice", options=FetchOptions(events=events))
+    """
+    on_snippets_listed: Callable[[list[DLSnippet]], None] | None = None
+    """Called once per fetcher with the videos left after listing, deduplication and filtering."""
+
+    on_transcript_done: Callable[[VideoTranscript], None] | None = None
+    """Called with each transcript fetched from YouTube as soon as it completes."""
+
+    on_failure: Callable[[FailedTranscript], None] | None = None
+    """Called with each final failure as soon as it is known. Transient failures that will be retried are not reported."""
+
+    on_ip_blocked: Callable[[FailedTranscript], None] | None = None
+    """Called once per fetch pass with the first failure caused by YouTube blocking the IP address."""
+
+    on_cache_hit: Callable[[VideoTranscript | FailedTranscript], None] | None = None
+    """Called with each transcript or permanent failure answered from the cache."""
+
+    on_phase_end: Callable[[str, float], None] | None = None
+    """Called with the phase name (see `ytfetcher.stats.PHASES`) and its wall time in seconds when a phase ends."""
+
+    def emit(self, event: str, *args: Any) -> None:
+        """
+        Calls the callback for `event` (e.g. 'on_failure') if it is set, logging its exceptions.
+        """
+        callback = getattr(self, event)
+        if callback is None:
+            return
+
+        try:
+            callback(*args)
+        except Exception:
+            logger.exception("%s callback failed.", event)
@@ -91,4 +91,19 @@ class VideoUnavailable(VideoListFetchError):
     """
     def __init__(self, video_id: str):
         self.video_id = video_id
-        super().__init__(f"Video id {video_id} is not available.")
\ No newline at end of file
+        super().__init__(f"Video id {video_id} is not available.")
+
+class InvalidFilterExpression(YTFetcherError):
+    """
+    Raises when a filter expression cannot be parsed or type-checked.
+    """
+
+class InvalidManifest(YTFetcherError):
+    """
+    Raises when a batch manifest cannot be read or contains invalid sources.
+    """
+
+class InvalidCacheArchive(YTFetcherError):
+    """
+    Raises when a cache archive cannot be read or was not written by `ytfetcher cache export`.
+    """
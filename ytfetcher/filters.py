@@ -1,7 +1,71 @@
-from typing import Callable
+from typing import Callable, Iterable
+from datetime import date, datetime, timedelta, timezone
 from ytfetcher.models.channel import DLSnippet
+from ytfetcher._filter_expression import FilterExpression, comparison
+
+__all__ = [
+    "FilterExpression",
+    "where",
+    "combine",
+    "min_duration",
+    "max_duration",
+    "min_views",
+    "max_views",
+    "filter_by_title",
+    "published_after",
+    "published_before",
+]
+
+def where(expression: str) -> FilterExpression:
+    """
+    Parses a filter expression such as `'views>=1000 and duration<600 and title~"python"'`.
+
+    Args:
+        expression (str): Comparisons on `views`, `duration`, `title`, `description`, `id`, `url`,
+            `uploader_url`, `upload_date` or `timestamp` joined with `and`, `or`, `not` and
+            parentheses. `~` is a case-insensitive substring match and `!~` its negation.
+
+    Returns:
+        FilterExpression: A compiled, picklable filter that can be passed to `FetchOptions.filters`.
+
+    Raises:
+        InvalidFilterExpression: If the expression cannot be parsed or compares a field with the wrong type.
+    """
+    return FilterExpression(expression)
+
+
+def combine(filters: Iterable[Callable[[DLSnippet], bool]]) -> Callable[[DLSnippet], bool]:
+    """
+    Combines filters into a single predicate that matches when every filter matches.
+
+    Filter expressions (including the built-in helpers below) are merged and compiled into one
+    function, so they cost a single call per snippet. Plain callables are still supported and
+    are evaluated after the compiled expression.
+
+    Args:
+        filters: Filter expressions or custom `DLSnippet -> bool` callables.
+
+    Returns:
+        function: A predicate over `DLSnippet` objects.
+    """
+    filters = list(filters)
+    expressions = [f for f in filters if isinstance(f, FilterExpression)]
+    custom = [f for f in filters if not isinstance(f, FilterExpression)]
+
+    if not expressions and not custom:
+        return lambda v: True
+
+    if not custom:
+        return FilterExpression.all_of(expressions)
+
+    if not expressions:
+        return lambda v: all(f(v) for f in custom)
+
+    compiled = FilterExpression.all_of(expressions)
+    return lambda v: compiled(v) and all(f(v) for f in custom)
+
 
-def min_duration(sec: float) -> Callable[[DLSnippet], bool]:
+def min_duration(sec: float) -> FilterExpression:
     """
     Returns a filter function that checks if a video's duration is greater than or equal to the specified seconds.
 
@@ -9,12 +73,12 @@ def min_duration(sec: float) -> Callable[[DLSnippet], bool]:
         sec (float): The minimum duration in seconds.
 
     Returns:
-        function: A function that takes a video object and returns True if its duration is greater than or equal to sec, otherwise False.
+        FilterExpression: A filter equivalent to `duration >= sec`.
     """
-    return lambda v: v.duration is not None and v.duration >= sec
+    return FilterExpression.from_node(comparison("duration", ">=", sec))
 
 
-def max_duration(sec: float) -> Callable[[DLSnippet], bool]:
+def max_duration(sec: float) -> FilterExpression:
     """
     Returns a filter function that checks if a video's duration is less than or equal to the specified seconds.
 
@@ -22,12 +86,12 @@ def max_duration(sec: float) -> Callable[[DLSnippet], bool]:
         sec (float): The maximum duration in seconds.
 
     Returns:
-        function: A function that takes a video object and returns True if its duration is less than or equal to sec, otherwise False.
+        FilterExpression: A filter equivalent to `duration <= sec`.
     """
-    return lambda v: v.duration is not None and v.duration <= sec
+    return FilterExpression.from_node(comparison("duration", "<=", sec))
 
 
-def min_views(n: int) -> Callable[[DLSnippet], bool]:
+def min_views(n: int) -> FilterExpression:
     """
     Returns a filter function that checks if a video's view count is greater than or equal to the specified number.
 
@@ -35,12 +99,12 @@ def min_views(n: int) -> Callable[[DLSnippet], bool]:
         n (int): The minimum number of views.
 
     Returns:
-        function: A function that takes a video object and returns True if its view count is greater than or equal to n, otherwise False.
+        FilterExpression: A filter equivalent to `views >= n`.
     """
-    return lambda v: v.view_count is not None and v.view_count >= n
+    return FilterExpression.from_node(comparison("views", ">=", n))
 
 
-def max_views(n: int) -> Callable[[DLSnippet], bool]:
+def max_views(n: int) -> FilterExpression:
     """
     Returns a filter function that checks if a video's view count is less than or equal to the specified number.
 
@@ -48,12 +112,12 @@ def max_views(n: int) -> Callable[[DLSnippet], bool]:
         n (int): The maximum number of views.
 
     Returns:
-        function: A function that takes a video object and returns True if its view count is less than or equal to n, otherwise False.
+        FilterExpression: A filter equivalent to `views <= n`.
     """
-    return lambda v: v.view_count is not None and v.view_count <= n
+    return FilterExpression.from_node(comparison("views", "<=", n))
 
 
-def filter_by_title(search_query: str) -> Callable[[DLSnippet], bool]:
+def filter_by_title(search_query: str) -> FilterExpression:
     """
     Returns a filter function that checks if a video's title includes the specified string.
 
@@ -61,9 +125,50 @@ def filter_by_title(search_query: str) -> Callable[[DLSnippet], bool]:
         search_query (str): The title string to check against.
 
     Returns:
-        function: A function that takes a video object and returns True if its title includes title, otherwise False.
+        FilterExpression: A filter equivalent to `title ~ search_query` (case-insensitive).
     """
+    return FilterExpression.from_node(comparison("title", "~", search_query))
 
-    query = search_query.lower()
 
-    return lambda v: v.title is not None and query in v.title.lower()
\ No newline at end of file
+def _to_upload_date(value: date | datetime | timedelta | str) -> str:
+    if isinstance(value, timedelta):
+        value = datetime.now(timezone.utc) - value
+
+    if isinstance(value, datetime):
+        value = value.astimezone(timezone.utc) if value.tzinfo else value
+
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+
+    return value
+
+
+def published_after(when: date | datetime | timedelta | str) -> FilterExpression:
+    """
+    Returns a filter function that checks if a video was uploaded on or after the specified date.
+
+    Channel listings are ordered newest first, so when this filter is passed to a channel fetcher
+    the listing stops at the first older video instead of paginating the whole channel.
+
+    Args:
+        when (date | datetime | timedelta | str): The earliest upload date. A `timedelta` is
+            relative to now (e.g. `timedelta(days=30)`), strings use `YYYY-MM-DD` or `YYYYMMDD`.
+
+    Returns:
+        FilterExpression: A filter equivalent to `upload_date >= when`.
+    """
+    return FilterExpression.from_node(comparison("upload_date", ">=", _to_upload_date(when)))
+
+
+def published_before(when: date | datetime | timedelta | str) -> FilterExpression:
+    """
+    Returns a filter function that checks if a video was uploaded before the specified date.
+
+    Args:
+        when (date | datetime | timedelta | str): The exclusive upper bound for the upload date.
+            A `timedelta` is relative to now, strings use `YYYY-MM-DD` or `YYYYMMDD`.
+
+    Returns:
+        FilterExpression: A filter equivalent to `upload_date < when`.
+    """
+    return FilterExpression.from_node(comparison("upload_date", "<", _to_upload_date(when)))
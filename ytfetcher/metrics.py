@@ -0,0 +1,291 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+import math
+import os
+import tempfile
+import threading
+import time
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+"""Histogram bucket upper bounds in seconds."""
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+class _Metric:
+    type = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...], **extra: str) -> dict[str, str]:
+        return {**dict(zip(self.labelnames, key)), **extra}
+
+    def samples(self) -> list[str]:
+        raise NotImplementedError
+
+class Counter(_Metric):
+    """
+    Monotonically increasing value, exposed with a `_total` suffix.
+    """
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}_total{_format_labels(self._labels(key))} {_format_value(value)}" for key, value in values]
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down, e.g. the number of requests in flight.
+    """
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {} if labelnames else {(): 0}
+
+    def inc(self, amount: float = 1, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    @contextmanager
+    def track(self, **labels: Any) -> Iterator[None]:
+        """Increments the gauge for the duration of the `with` block."""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}" for key, value in values]
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values, e.g. request latencies, in cumulative buckets.
+    """
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observes the wall time of the `with` block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: Any) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), []))
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            series = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+
+        lines = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(self._labels(key, le=_format_value(bound)))} {cumulative}")
+            lines.append(f"{self.name}_count{_format_labels(self._labels(key))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self._labels(key))} {_format_value(total)}")
+        return lines
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of metrics rendered in the OpenMetrics text format.
+
+    Has no dependencies: expose `render()` from any HTTP endpoint (`ytfetcher serve` does so
+    at `/metrics`), or write it with `write_textfile()` for the node_exporter textfile collector.
+    """
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric_type: type[_Metric], name: str, help: str, labelnames: tuple[str, ...], **kwargs: Any) -> Any:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not metric_type or existing.labelnames != labelnames:
+                    raise ValueError(f"Metric {name} is already registered with a different type or labels.")
+                return existing
+
+            metric = metric_type(name, help, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Returns the counter called `name`, creating it on first use."""
+        return self._register(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Returns the gauge called `name`, creating it on first use."""
+        return self._register(Gauge, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Returns the histogram called `name`, creating it on first use."""
+        return self._register(Histogram, name, help, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Returns all metrics in the OpenMetrics text format, terminated by `# EOF`."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+            lines.extend(metric.samples())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str | Path) -> None:
+        """
+        Writes `render()` to `path` atomically, so collectors never read a partial file.
+        """
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".prom")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+class FetchMetrics(MetricsRegistry):
+    """
+    Registry with the metrics updated by the transcript fetcher, the yt-dlp fetchers and the cache.
+
+    Pass one instance as `FetchOptions.metrics` and keep it for the lifetime of the process;
+    values accumulate across runs.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.transcripts_in_flight = self.gauge(
+            "ytfetcher_transcript_fetches_in_flight", "Transcript fetches currently running.")
+        self.transcript_queue_depth = self.gauge(
+            "ytfetcher_transcript_queue_depth", "Transcript fetches submitted to the worker pool but not started yet.")
+        self.transcript_duration = self.histogram(
+            "ytfetcher_transcript_fetch_duration_seconds", "Wall time of one transcript fetch, including retries.")
+        self.transcripts = self.counter(
+            "ytfetcher_transcripts", "Transcript results by outcome: 'success' or the failure reason.", ("result",))
+        self.http_requests = self.counter(
+            "ytfetcher_http_requests", "HTTP requests made by the transcript fetcher, by status code.", ("status",))
+        self.http_request_duration = self.histogram(
+            "ytfetcher_http_request_duration_seconds", "Time from sending a transcript request until its response headers arrived.")
+        self.http_response_bytes = self.counter(
+            "ytfetcher_http_response_bytes", "Decoded response body bytes received by the transcript fetcher.")
+        self.retries = self.counter(
+            "ytfetcher_retries", "Transcript fetch attempts repeated after a network error, including delayed per-video retries.")
+        self.ip_blocks = self.counter(
+            "ytfetcher_ip_blocks", "Responses YouTube answered with an IP block.")
+        self.ytdlp_in_flight = self.gauge(
+            "ytfetcher_ytdlp_extractions_in_flight", "yt-dlp extractions currently running.")
+        self.ytdlp_extractions = self.counter(
+            "ytfetcher_ytdlp_extractions", "yt-dlp extractions started, by fetcher.", ("fetcher",))
+        self.ytdlp_duration = self.histogram(
+            "ytfetcher_ytdlp_extraction_duration_seconds", "Wall time of one yt-dlp extraction, by fetcher.", ("fetcher",))
+        self.ytdlp_failures = self.counter(
+            "ytfetcher_ytdlp_failures", "Failed yt-dlp extractions, by exception type.", ("reason",))
+        self.cache_lookups = self.counter(
+            "ytfetcher_cache_lookups", "Videos looked up in the cache, by result: 'hit' or 'miss'.", ("result",))
+        self.cache_hit_ratio = self.gauge(
+            "ytfetcher_cache_hit_ratio", "Share of all cache lookups answered from the cache.")
+        self.cache_writes = self.counter(
+            "ytfetcher_cache_writes", "Results written to the cache.")
+        self.cache_write_errors = self.counter(
+            "ytfetcher_cache_write_errors", "Results that could not be written to the cache.")
+        self.cache_write_queue_depth = self.gauge(
+            "ytfetcher_cache_write_queue_depth", "Results waiting for the background cache writer.")
+
+    def record_response(self, response: Any, *args, **kwargs) -> None:
+        """
+        `requests` response hook counting requests by status, latency and received bytes.
+        """
+        self.http_requests.inc(status=response.status_code)
+        self.http_request_duration.observe(response.elapsed.total_seconds())
+        self.http_response_bytes.inc(len(response.content or b""))
+
+    def record_cache_lookup(self, hits: int, misses: int) -> None:
+        """Counts a cache lookup and updates the overall hit ratio."""
+        self.cache_lookups.inc(hits, result="hit")
+        self.cache_lookups.inc(misses, result="miss")
+
+        total_hits = self.cache_lookups.value(result="hit")
+        total = total_hits + self.cache_lookups.value(result="miss")
+        self.cache_hit_ratio.set(total_hits / total if total else 0.0)
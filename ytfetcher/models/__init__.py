@@ -1,8 +1,13 @@
 from .channel import ChannelData, VideoTranscript, Transcript, DLSnippet
+from .compact import CompactTranscript, TranscriptSegment
+from .source import Source
 
 __all__ = [
     "ChannelData",
     "VideoTranscript",
     "Transcript",
-    "DLSnippet"
+    "DLSnippet",
+    "CompactTranscript",
+    "TranscriptSegment",
+    "Source"
 ]
\ No newline at end of file
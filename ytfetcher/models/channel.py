@@ -1,4 +1,6 @@
 from pydantic import BaseModel, Field, model_validator, ConfigDict
+from datetime import datetime, timezone
+from ytfetcher.models.compact import CompactTranscript
 
 class Comment(BaseModel):
 
@@ -22,6 +24,8 @@ class DLSnippet(BaseModel):
     view_count: int | None = None
     thumbnails: list[dict] | None = None
     uploader_url: str | None = None
+    upload_date: str | None = None
+    timestamp: int | None = None
 
     @model_validator(mode='after')
     def validate_url(self) -> 'DLSnippet':
@@ -30,6 +34,13 @@ class DLSnippet(BaseModel):
             self.url = f"https://youtube.com/watch?v={self.video_id}"
         return self
 
+    @model_validator(mode='after')
+    def validate_upload_date(self) -> 'DLSnippet':
+        """If upload date is missing, derive it (UTC, YYYYMMDD) from the timestamp."""
+        if not self.upload_date and self.timestamp is not None:
+            self.upload_date = datetime.fromtimestamp(self.timestamp, tz=timezone.utc).strftime("%Y%m%d")
+        return self
+
 class Transcript(BaseModel):
     text: str
     start: float
@@ -44,7 +55,7 @@ class FailedTranscript(BaseModel):
 
 class VideoTranscript(BaseModel):
     video_id: str
-    transcripts: list[Transcript]
+    transcripts: list[Transcript] | CompactTranscript
 
     def to_dict(self) -> dict:
         return self.model_dump()
@@ -59,7 +70,7 @@ class TranscriptFetchResult(BaseModel):
 
 class ChannelData(BaseModel):
     video_id: str
-    transcripts: list[Transcript]
+    transcripts: list[Transcript] | CompactTranscript
     metadata: DLSnippet | None = None
     comments: list[Comment]
 
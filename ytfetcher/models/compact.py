@@ -0,0 +1,229 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, Protocol, overload
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+import json
+
+if TYPE_CHECKING:
+    from ytfetcher.models.channel import Transcript
+
+class _SegmentLike(Protocol):
+    @property
+    def text(self) -> str: ...
+    @property
+    def start(self) -> float: ...
+    @property
+    def duration(self) -> float: ...
+
+class TranscriptSegment:
+    """
+    Lazy, read-only view of a single segment stored in a `CompactTranscript`.
+
+    Exposes the same `text`, `start` and `duration` attributes as `Transcript`,
+    but only reads them from the owning container when accessed.
+    """
+    __slots__ = ("_owner", "_index")
+
+    def __init__(self, owner: "CompactTranscript", index: int):
+        self._owner = owner
+        self._index = index
+
+    @property
+    def text(self) -> str:
+        return self._owner._text_at(self._index)
+
+    @property
+    def start(self) -> float:
+        return self._owner._starts[self._index]
+
+    @property
+    def duration(self) -> float:
+        return self._owner._durations[self._index]
+
+    def to_transcript(self) -> "Transcript":
+        """Materializes this segment as a `Transcript` model."""
+        from ytfetcher.models.channel import Transcript
+        return Transcript.model_construct(text=self.text, start=self.start, duration=self.duration)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"text": self.text, "start": self.start, "duration": self.duration}
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return (self.text, self.start, self.duration) == (other.text, other.start, other.duration)  # type: ignore[attr-defined]
+        except AttributeError:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.text, self.start, self.duration))
+
+    def __repr__(self) -> str:
+        return f"TranscriptSegment(text={self.text!r}, start={self.start}, duration={self.duration})"
+
+class CompactTranscript(Sequence[TranscriptSegment]):
+    """
+    Columnar, memory-efficient container for the segments of one transcript.
+
+    Starts and durations live in `array('d')` columns and all segment texts share a single
+    string buffer addressed by an offsets array, so a segment costs roughly 20 bytes plus its
+    text instead of a pydantic model, a dict and three boxed values. Indexing and iteration
+    yield lazy `TranscriptSegment` views, so exporters and helpers that read `.text`, `.start`
+    and `.duration` work unchanged.
+
+    It serializes to the same list of `{"text", "start", "duration"}` dicts as `list[Transcript]`,
+    so cached payloads and exports are interchangeable between both representations.
+    """
+    __slots__ = ("_starts", "_durations", "_text", "_offsets")
+
+    def __init__(self, starts: array, durations: array, text: str, offsets: array):
+        if not (len(starts) == len(durations) == len(offsets) - 1):
+            raise ValueError("starts, durations and offsets must describe the same number of segments.")
+
+        self._starts = starts
+        self._durations = durations
+        self._text = text
+        self._offsets = offsets
+
+    @classmethod
+    def from_columns(cls, texts: Sequence[str], starts: Iterable[float], durations: Iterable[float]) -> "CompactTranscript":
+        """Builds a container from parallel columns of texts, starts and durations."""
+        offsets = array("Q", [0])
+        position = 0
+        for text in texts:
+            position += len(text)
+            offsets.append(position)
+
+        return cls(
+            starts=array("d", starts),
+            durations=array("d", durations),
+            text="".join(texts),
+            offsets=offsets,
+        )
+
+    @classmethod
+    def from_raw(cls, raw: Sequence[dict[str, Any]]) -> "CompactTranscript":
+        """Builds a container from raw `{"text", "start", "duration"}` dictionaries."""
+        return cls.from_columns(
+            texts=[str(entry["text"]) for entry in raw],
+            starts=(float(entry["start"]) for entry in raw),
+            durations=(float(entry["duration"]) for entry in raw),
+        )
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[_SegmentLike]) -> "CompactTranscript":
+        """Builds a container from `Transcript` models or segment views."""
+        items = list(segments)
+        return cls.from_columns(
+            texts=[segment.text for segment in items],
+            starts=(segment.start for segment in items),
+            durations=(segment.duration for segment in items),
+        )
+
+    @classmethod
+    def from_json(cls, payload: str | bytes) -> "CompactTranscript":
+        """Builds a container from a JSON array of segment dictionaries."""
+        return cls.from_raw(json.loads(payload))
+
+    def _text_at(self, index: int) -> str:
+        return self._text[self._offsets[index]:self._offsets[index + 1]]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> TranscriptSegment: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CompactTranscript": ...
+
+    def __getitem__(self, index: int | slice) -> "TranscriptSegment | CompactTranscript":
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return CompactTranscript.from_segments(self[i] for i in range(start, stop, step))
+
+            stop = max(start, stop)
+            base = self._offsets[start]
+            return CompactTranscript(
+                starts=self._starts[start:stop],
+                durations=self._durations[start:stop],
+                text=self._text[base:self._offsets[stop]],
+                offsets=array("Q", (offset - base for offset in self._offsets[start:stop + 1])),
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompactTranscript index out of range")
+
+        return TranscriptSegment(self, index)
+
+    def __iter__(self) -> Iterator[TranscriptSegment]:
+        for index in range(len(self)):
+            yield TranscriptSegment(self, index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CompactTranscript):
+            return (
+                self._starts == other._starts
+                and self._durations == other._durations
+                and self._text == other._text
+                and self._offsets == other._offsets
+            )
+        if isinstance(other, list):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def texts(self) -> list[str]:
+        """Returns all segment texts in order."""
+        offsets = self._offsets
+        return [self._text[offsets[i]:offsets[i + 1]] for i in range(len(self))]
+
+    def joined_text(self, separator: str = " ") -> str:
+        """Joins all segment texts with `separator` without creating segment views."""
+        if separator == "":
+            return self._text
+        return separator.join(self.texts())
+
+    def with_texts(self, texts: Sequence[str]) -> "CompactTranscript":
+        """Returns a copy with the segment texts replaced, keeping the timing columns."""
+        if len(texts) != len(self):
+            raise ValueError("texts must contain exactly one entry per segment.")
+        return CompactTranscript.from_columns(texts=texts, starts=self._starts, durations=self._durations)
+
+    def to_transcripts(self) -> list["Transcript"]:
+        """Materializes every segment as a `Transcript` model."""
+        return [segment.to_transcript() for segment in self]
+
+    def to_raw(self) -> list[dict[str, Any]]:
+        """Returns segments as plain `{"text", "start", "duration"}` dictionaries."""
+        return [
+            {"text": text, "start": start, "duration": duration}
+            for text, start, duration in zip(self.texts(), self._starts, self._durations)
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate payload size of the columns in bytes, excluding object headers."""
+        return (
+            self._starts.itemsize * len(self._starts)
+            + self._durations.itemsize * len(self._durations)
+            + self._offsets.itemsize * len(self._offsets)
+            + len(self._text.encode("utf-8"))
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactTranscript(segments={len(self)})"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.is_instance_schema(
+            cls,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.to_raw(),
+                return_schema=core_schema.list_schema(core_schema.dict_schema()),
+            ),
+        )
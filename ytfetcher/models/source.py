@@ -0,0 +1,80 @@
+from pydantic import BaseModel, ConfigDict, model_validator
+from typing import Any, Literal
+import re
+
+SourceKind = Literal['channel', 'playlist', 'search', 'video']
+
+# Manifest shorthand keys -> source kind.
+_SHORTHAND_KEYS: dict[str, SourceKind] = {
+    'channel': 'channel',
+    'playlist': 'playlist',
+    'playlist_id': 'playlist',
+    'search': 'search',
+    'video_ids': 'video',
+}
+
+# Names become output file names, so they are limited to characters that are safe in one.
+_NAME_CHARS = r'A-Za-z0-9_.-'
+_NAME = re.compile(rf'[{_NAME_CHARS}]+')
+
+class Source(BaseModel):
+    """
+    A single listing to fetch in a multi-source run (see `YTFetcher.from_sources`).
+
+    Besides the explicit `kind`/`target` form, the shorthand used by batch manifests is accepted:
+    `{"channel": "@TheOffice", "max_results": 50}`, `{"playlist": "PL..."}`,
+    `{"search": "python tutorial"}` or `{"video_ids": ["dQw4w9WgXcQ"]}`.
+
+    Args:
+        kind: Which fetcher to use: 'channel', 'playlist', 'search' or 'video'.
+        target: Channel handle, playlist id, search query, or a list of video ids.
+        max_results: Maximum videos to list. None lists everything (not supported for searches).
+        tab: Channel tab to list. Only used by channel sources.
+        name: Unique name used to group results and name per-source outputs. Letters, digits,
+            '_', '.' and '-' only. Defaults to a name derived from kind and target.
+    """
+    model_config = ConfigDict(extra='forbid')
+
+    kind: SourceKind
+    target: str | list[str]
+    max_results: int | None = 20
+    tab: Literal['videos', 'shorts', 'streams'] = 'videos'
+    name: str = ''
+
+    @model_validator(mode='before')
+    @classmethod
+    def expand_shorthand(cls, data: Any) -> Any:
+        if not isinstance(data, dict) or 'kind' in data:
+            return data
+
+        keys = [key for key in _SHORTHAND_KEYS if key in data]
+        if len(keys) != 1:
+            raise ValueError(f"Source must define exactly one of {', '.join(_SHORTHAND_KEYS)}, got {sorted(data)}.")
+
+        data = dict(data)
+        key = keys[0]
+        data['kind'] = _SHORTHAND_KEYS[key]
+        data['target'] = data.pop(key)
+        return data
+
+    @model_validator(mode='after')
+    def validate_target(self) -> 'Source':
+        if self.kind == 'video':
+            if isinstance(self.target, str):
+                self.target = [self.target]
+            if not self.target:
+                raise ValueError("Video sources require at least one video id.")
+        elif not isinstance(self.target, str) or not self.target.strip():
+            raise ValueError(f"{self.kind.capitalize()} sources require a single non-empty target.")
+
+        if self.kind == 'search' and self.max_results is None:
+            raise ValueError("Search sources require max_results.")
+
+        if not self.name:
+            target = self.target if isinstance(self.target, str) else self.target[0]
+            slug = re.sub(rf'[^{_NAME_CHARS}]+', '_', target).strip('_.')[:80]
+            self.name = f"{self.kind}-{slug}" if slug else self.kind
+        elif not _NAME.fullmatch(self.name) or not self.name.strip('.'):
+            raise ValueError(f"Source name {self.name!r} may only contain letters, digits, '_', '.' and '-'.")
+
+        return self
@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from typing import Iterable
+import hashlib
+import json
+import re
+
+SEGMENT_SEPARATOR = "\x00"
+"""
+Precedes every segment in the buffer used by the batched pass.
+Rules must never consume it; anchor per-segment patterns on it instead of `^`.
+"""
+
+@dataclass(frozen=True)
+class NormalizationRule:
+    """
+    A single regex substitution applied to transcript text.
+
+    Args:
+        pattern (str | re.Pattern): Regular expression to search for.
+        replacement (str): Replacement string passed to `re.sub`. Defaults to an empty string.
+    """
+    pattern: str | re.Pattern[str]
+    replacement: str = ""
+
+    def compile(self) -> re.Pattern[str]:
+        if isinstance(self.pattern, re.Pattern):
+            return self.pattern
+        return re.compile(self.pattern)
+
+# Remove unnecessary text patterns like [Music], [Applause], etc.
+REMOVE_BRACKETED = NormalizationRule(r"\[[^\]\n\x00]*\]")
+
+# Remove leading '>>' markers (and optional spaces) at the start of each segment.
+REMOVE_SPEAKER_MARKERS = NormalizationRule(r"\x00\s*>>\s*", SEGMENT_SEPARATOR)
+
+DEFAULT_RULES: tuple[NormalizationRule, ...] = (REMOVE_BRACKETED, REMOVE_SPEAKER_MARKERS)
+
+class TranscriptNormalizer:
+    """
+    Configurable text-normalization pipeline for transcript segments.
+
+    Rules are compiled once and applied to a whole transcript at a time: every segment text
+    is prefixed with `SEGMENT_SEPARATOR` and joined into one buffer, each rule runs over the
+    buffer in a single pass and the result is split back into segments. If a custom rule
+    consumes a separator, the normalizer falls back to applying the rules segment by segment.
+
+    Args:
+        rules (Iterable[NormalizationRule]): Substitutions applied in order. Defaults to no rules.
+        collapse_whitespace (bool): Collapse runs of whitespace into a single space and strip
+            each segment. Defaults to True.
+    """
+    def __init__(self, rules: Iterable[NormalizationRule] = (), collapse_whitespace: bool = True):
+        self.rules = tuple(rules)
+        self.collapse_whitespace = collapse_whitespace
+        self._compiled = [(rule.compile(), rule.replacement) for rule in self.rules]
+
+    @classmethod
+    def default(cls) -> "TranscriptNormalizer":
+        """Strips `[Music]`-style annotations and `>>` speaker markers, then collapses whitespace."""
+        return cls(rules=DEFAULT_RULES)
+
+    @classmethod
+    def noop(cls) -> "TranscriptNormalizer":
+        """Returns a normalizer that leaves transcript text untouched."""
+        return cls(rules=(), collapse_whitespace=False)
+
+    @property
+    def is_noop(self) -> bool:
+        return not self._compiled and not self.collapse_whitespace
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable digest of the rules and options, e.g. to key cached output of this normalizer."""
+        spec = {
+            "rules": [[pattern.pattern, pattern.flags, replacement] for pattern, replacement in self._compiled],
+            "collapse_whitespace": self.collapse_whitespace,
+        }
+        return hashlib.sha256(json.dumps(spec).encode("utf-8")).hexdigest()[:16]
+
+    def normalize(self, texts: list[str]) -> list[str]:
+        """
+        Normalizes the text of every segment of a single transcript.
+
+        Args:
+            texts: Segment texts in transcript order.
+
+        Returns:
+            list[str]: Normalized texts, one per input segment.
+        """
+        if self.is_noop or not texts:
+            return texts
+
+        joined = SEGMENT_SEPARATOR + SEGMENT_SEPARATOR.join(texts)
+
+        for pattern, replacement in self._compiled:
+            joined = pattern.sub(replacement, joined)
+
+        if self.collapse_whitespace:
+            # The separator is not whitespace, so it survives the split/join.
+            joined = " ".join(joined.split())
+
+        parts = joined.split(SEGMENT_SEPARATOR)
+
+        if len(parts) != len(texts) + 1:
+            return [self._normalize_one(text) for text in texts]
+
+        if self.collapse_whitespace:
+            return [part.strip() for part in parts[1:]]
+
+        return parts[1:]
+
+    def _normalize_one(self, text: str) -> str:
+        text = SEGMENT_SEPARATOR + text
+
+        for pattern, replacement in self._compiled:
+            text = pattern.sub(replacement, text)
+
+        text = text.replace(SEGMENT_SEPARATOR, "")
+
+        if self.collapse_whitespace:
+            text = " ".join(text.split())
+
+        return text
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TranscriptNormalizer):
+            return NotImplemented
+        return (self.rules, self.collapse_whitespace) == (other.rules, other.collapse_whitespace)
+
+    def __hash__(self) -> int:
+        return hash((self.rules, self.collapse_whitespace))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rules={self.rules!r}, collapse_whitespace={self.collapse_whitespace})"
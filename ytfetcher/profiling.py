@@ -0,0 +1,310 @@
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TextIO, TypeVar
+import cProfile
+import functools
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Before Python 3.12 a cProfile profiler only sees the thread that enabled it, so worker
+# threads need their own profilers. From 3.12 on, one profiler sees every thread and only
+# one can be active at a time.
+_PER_THREAD_CPROFILE = sys.version_info < (3, 12)
+
+@dataclass
+class PhaseProfile:
+    """
+    Wall and CPU time of one phase, for the calling thread and its worker tasks.
+    """
+    name: str
+    """Phase name, see `ytfetcher.stats.PHASES`."""
+
+    wall_time: float = 0.0
+    """Seconds the phase took."""
+
+    cpu_time: float = 0.0
+    """CPU seconds used by the thread that ran the phase, excluding worker threads."""
+
+    tasks: int = 0
+    """Worker pool tasks run during the phase."""
+
+    worker_wall_time: float = 0.0
+    """Wall seconds summed over all worker tasks."""
+
+    worker_cpu_time: float = 0.0
+    """CPU seconds summed over all worker tasks. Much lower than `worker_wall_time` means workers mostly wait on the network."""
+
+    threads: dict[str, list[float]] = field(default_factory=dict)
+    """Per worker thread name: [tasks, wall seconds, CPU seconds]."""
+
+    @property
+    def worker_cpu_ratio(self) -> float:
+        """Share of worker wall time spent on the CPU."""
+        return self.worker_cpu_time / self.worker_wall_time if self.worker_wall_time else 0.0
+
+class RunProfiler:
+    """
+    Profiles a run per phase and per worker thread to find where the time goes.
+
+    Pass an instance as `FetchOptions.profile` (or use the `--profile` CLI option) and call
+    `write()` after the run. Each phase gets deterministic cProfile stats, worker pool tasks
+    are timed in wall-clock and CPU time, and a sampler thread records the stacks of all
+    profiled threads every `sample_interval` seconds. Samples are wall-clock, so stacks
+    waiting on sockets or locks show up as well as busy ones.
+
+    Profiling slows the run down considerably; use it to compare phases and functions,
+    not to measure absolute throughput.
+
+    Example:
+        profiler = RunProfiler()
+        fetcher = YTFetcher.from_channel("TheOffice", options=FetchOptions(profile=profiler))
+        fetcher.fetch_youtube_data()
+        profiler.write("profile")
+    """
+    def __init__(self, sample_interval: float = 0.005) -> None:
+        """
+        Initialize the RunProfiler.
+
+        Args:
+            sample_interval (float): Seconds between stack samples. Defaults to 0.005.
+        """
+        if sample_interval <= 0:
+            raise ValueError("sample_interval must be positive.")
+
+        self.sample_interval = sample_interval
+        self.phases: dict[str, PhaseProfile] = {}
+        """Timings per phase, in the order phases first ran."""
+        self.stacks: Counter[str] = Counter()
+        """Stack samples in collapsed format ('phase;thread;frame;...') mapped to their count."""
+
+        self._profiles: dict[tuple[str, str], cProfile.Profile] = {}
+        self._watched: dict[int, tuple[str, str]] = {}
+        self._current_phase: str | None = None
+        self._active_phases = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Profiles the calling thread for the duration of the `with` block as phase `name`.
+
+        Repeated phases accumulate. Worker tasks wrapped with `task()` inside the block
+        count towards the phase.
+        """
+        ident = threading.get_ident()
+        with self._lock:
+            profile = self.phases.setdefault(name, PhaseProfile(name=name))
+            outer_phase, self._current_phase = self._current_phase, name
+            outer_watch = self._watched.get(ident)
+            self._watched[ident] = (name, "main")
+            self._active_phases += 1
+            if self._sampler is None:
+                self._start_sampler()
+
+        wall, cpu = time.perf_counter(), time.thread_time()
+        profiler = self._enable(name, "main")
+        try:
+            yield
+        finally:
+            self._disable(profiler)
+            with self._lock:
+                profile.wall_time += time.perf_counter() - wall
+                profile.cpu_time += time.thread_time() - cpu
+                self._current_phase = outer_phase
+                if outer_watch is None:
+                    self._watched.pop(ident, None)
+                else:
+                    self._watched[ident] = outer_watch
+                self._active_phases -= 1
+                sampler = self._sampler if self._active_phases == 0 else None
+                if sampler is not None:
+                    self._sampler = None
+                    self._stop.set()
+
+            if sampler is not None:
+                sampler.join()
+
+    def task(self, fn: Callable[..., T]) -> Callable[..., T]:
+        """
+        Wraps a worker pool task so it is profiled and timed as part of the current phase.
+
+        Returns `fn` unchanged outside of a phase.
+        """
+        name = self._current_phase
+        if name is None:
+            return fn
+
+        @functools.wraps(fn)
+        def run(*args: Any, **kwargs: Any) -> T:
+            ident = threading.get_ident()
+            thread = threading.current_thread().name
+            with self._lock:
+                self._watched[ident] = (name, "worker")
+
+            wall, cpu = time.perf_counter(), time.thread_time()
+            profiler = self._enable(name, thread) if _PER_THREAD_CPROFILE else None
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._disable(profiler)
+                wall = time.perf_counter() - wall
+                cpu = time.thread_time() - cpu
+                with self._lock:
+                    self._watched.pop(ident, None)
+                    profile = self.phases[name]
+                    profile.tasks += 1
+                    profile.worker_wall_time += wall
+                    profile.worker_cpu_time += cpu
+                    totals = profile.threads.setdefault(thread, [0, 0.0, 0.0])
+                    totals[0] += 1
+                    totals[1] += wall
+                    totals[2] += cpu
+
+        return run
+
+    def stats(self, phase: str, workers: bool = False, stream: TextIO | None = None) -> pstats.Stats | None:
+        """
+        Returns the cProfile stats of a phase, or None if it was not profiled.
+
+        Args:
+            phase: Phase name.
+            workers: Return the merged stats of the worker threads instead of the calling
+                thread. From Python 3.12 on, the calling thread's stats already include
+                all threads and there are no separate worker stats.
+            stream: Stream that `print_stats()` writes to. Defaults to stdout.
+        """
+        with self._lock:
+            profiles = [
+                profile for (name, thread), profile in self._profiles.items()
+                if name == phase and (thread != "main") == workers
+            ]
+
+        if not profiles:
+            return None
+
+        return pstats.Stats(*profiles, stream=stream)
+
+    def summary(self, top: int = 15) -> str:
+        """
+        Returns a text report with wall vs CPU time per phase and worker thread, and the
+        `top` functions of each phase by cumulative time (none for 0).
+        """
+        out = io.StringIO()
+        out.write(f"{'phase':<14}{'wall s':>10}{'cpu s':>10}{'tasks':>8}{'task wall s':>13}{'task cpu s':>12}{'cpu/wall':>10}\n")
+        for profile in self.phases.values():
+            out.write(
+                f"{profile.name:<14}{profile.wall_time:>10.3f}{profile.cpu_time:>10.3f}{profile.tasks:>8}"
+                f"{profile.worker_wall_time:>13.3f}{profile.worker_cpu_time:>12.3f}{profile.worker_cpu_ratio:>10.0%}\n"
+            )
+
+        for profile in self.phases.values():
+            if profile.threads:
+                out.write(f"\n[{profile.name}] worker threads\n")
+                for thread, (tasks, wall, cpu) in sorted(profile.threads.items()):
+                    out.write(f"  {thread:<32}{int(tasks):>6} tasks{wall:>10.3f}s wall{cpu:>10.3f}s cpu\n")
+
+            for workers in (False, True) if top > 0 else ():
+                stats = self.stats(profile.name, workers=workers, stream=out)
+                if stats is None:
+                    continue
+                out.write(f"\n[{profile.name}] {'worker threads' if workers else 'calling thread'}, top {top} by cumulative time\n")
+                stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+        return out.getvalue()
+
+    def write(self, directory: str | Path) -> list[Path]:
+        """
+        Writes the profile to `directory`.
+
+        Files:
+            `<phase>.pstats`: cProfile stats of the thread that ran the phase (all threads
+                from Python 3.12 on), readable with `pstats` or snakeviz.
+            `<phase>.workers.pstats`: Merged cProfile stats of the phase's worker threads
+                (before Python 3.12 only).
+            `stacks.collapsed`: Sampled stacks in collapsed format for flamegraph.pl or speedscope.
+            `summary.txt`: Output of `summary()`.
+
+        Returns:
+            list[Path]: The written files.
+        """
+        directory = Path(directory).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+
+        for name in self.phases:
+            for workers in (False, True):
+                stats = self.stats(name, workers=workers)
+                if stats is not None:
+                    path = directory / f"{name}{'.workers' if workers else ''}.pstats"
+                    stats.dump_stats(path)
+                    written.append(path)
+
+        stacks = directory / "stacks.collapsed"
+        with self._lock:
+            lines = [f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())]
+        stacks.write_text("".join(lines), encoding="utf-8")
+        written.append(stacks)
+
+        summary = directory / "summary.txt"
+        summary.write_text(self.summary(), encoding="utf-8")
+        written.append(summary)
+        return written
+
+    def _enable(self, phase: str, thread: str) -> cProfile.Profile | None:
+        if getattr(self._local, "profiling", False):
+            return None
+
+        with self._lock:
+            profiler = self._profiles.setdefault((phase, thread), cProfile.Profile())
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler, e.g. `python -m cProfile`, is already active.
+            logger.debug("Could not enable cProfile for phase %s.", phase, exc_info=True)
+            return None
+
+        self._local.profiling = True
+        return profiler
+
+    def _disable(self, profiler: cProfile.Profile | None) -> None:
+        if profiler is not None:
+            profiler.disable()
+            self._local.profiling = False
+
+    def _start_sampler(self) -> None:
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, args=(self._stop,), name="ytfetcher-profiler", daemon=True)
+        self._sampler.start()
+
+    def _sample(self, stop: threading.Event) -> None:
+        while not stop.wait(self.sample_interval):
+            frames = sys._current_frames()
+            with self._lock:
+                watched = list(self._watched.items())
+
+            samples = []
+            for ident, (phase, role) in watched:
+                frame = frames.get(ident)
+                labels = []
+                while frame is not None:
+                    code = frame.f_code
+                    if code.co_filename != __file__:
+                        labels.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                samples.append(";".join([phase, role, *reversed(labels)]))
+
+            with self._lock:
+                self.stacks.update(samples)
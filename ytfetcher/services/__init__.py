@@ -1,9 +1,29 @@
-from .exports import CSVExporter, TXTExporter, JSONExporter
-from ._preview import PreviewRenderer
+from typing import TYPE_CHECKING, Any
+import importlib
+
+if TYPE_CHECKING:
+    from .exports import CSVExporter, TXTExporter, JSONExporter
+    from ._preview import PreviewRenderer
 
 __all__ = [
     'CSVExporter',
     'JSONExporter',
     'TXTExporter',
     'PreviewRenderer'
-]
\ No newline at end of file
+]
+
+# Loaded on first access, see `ytfetcher/__init__.py`. `PreviewRenderer` needs rich.
+_LAZY_IMPORTS = {
+    'CSVExporter': 'ytfetcher.services.exports',
+    'JSONExporter': 'ytfetcher.services.exports',
+    'TXTExporter': 'ytfetcher.services.exports',
+    'PreviewRenderer': 'ytfetcher.services._preview',
+}
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
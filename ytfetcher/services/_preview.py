@@ -5,6 +5,7 @@ from rich.text import Text
 from rich.box import ROUNDED, SIMPLE
 
 from ytfetcher.models.channel import ChannelData, Transcript, Comment, DLSnippet
+from ytfetcher.models.compact import CompactTranscript
 from ytfetcher.models.types import FetchResult
 from ytfetcher.utils.helpers import normalize_for_export
 
@@ -83,7 +84,7 @@ class PreviewRenderer:
         
         return grid
 
-    def _create_transcript_table(self, transcripts: list[Transcript], limit: int) -> Table | None:
+    def _create_transcript_table(self, transcripts: list[Transcript] | CompactTranscript, limit: int) -> Table | None:
         if not transcripts:
             return None
 
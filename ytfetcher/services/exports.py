@@ -12,9 +12,12 @@ from ytfetcher.utils.helpers import normalize_for_export
 
 logger = logging.getLogger(__name__)
 
-METADATA_LIST = Literal['title', 'description', 'url', 'duration', 'view_count', 'thumbnails', 'uploader_url']
+METADATA_LIST = Literal['title', 'description', 'url', 'duration', 'view_count', 'thumbnails', 'uploader_url', 'upload_date']
 
-DEFAULT_METADATA = get_args(METADATA_LIST)
+METADATA_FIELDS = get_args(METADATA_LIST)
+
+# Listings only carry yt-dlp's approximate upload dates, so `upload_date` is opt-in.
+DEFAULT_METADATA = tuple(field for field in METADATA_FIELDS if field != 'upload_date')
 class BaseExporter(ABC):
     """
     Handles exporting YouTube transcript and metadata to various formats: TXT, JSON, and CSV.
@@ -0,0 +1,90 @@
+from pathlib import Path
+from typing import Any
+from pydantic import ValidationError
+from ytfetcher.models.source import Source
+from ytfetcher.exceptions import InvalidManifest
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+def load_sources(path: str | Path) -> list[Source]:
+    """
+    Reads the sources of a batch manifest.
+
+    `.jsonl` manifests hold one source per line (blank lines and lines starting with `#` are
+    ignored). `.json`, `.yaml` and `.yml` manifests hold either a list of sources or a mapping
+    with a `sources` list. Reading YAML requires the optional `pyyaml` package.
+
+    Example line: `{"channel": "@TheOffice", "max_results": 50, "name": "office"}`
+
+    Args:
+        path (str | Path): Path to the manifest file.
+
+    Returns:
+        list[Source]: Parsed sources in manifest order.
+
+    Raises:
+        InvalidManifest: If the file cannot be read, parsed, or contains invalid sources.
+    """
+    path = Path(path).expanduser()
+
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise InvalidManifest(f"Could not read manifest {path}: {e}") from e
+
+    suffix = path.suffix.lower()
+    if suffix == ".jsonl":
+        entries = _parse_jsonl(text, path)
+    elif suffix in (".yaml", ".yml"):
+        entries = _unwrap(_parse_yaml(text, path), path)
+    elif suffix == ".json":
+        try:
+            entries = _unwrap(json.loads(text), path)
+        except json.JSONDecodeError as e:
+            raise InvalidManifest(f"Invalid JSON in manifest {path}: {e}") from e
+    else:
+        raise InvalidManifest(f"Unsupported manifest format '{suffix}', use .jsonl, .json, .yaml or .yml.")
+
+    sources: list[Source] = []
+    for index, entry in enumerate(entries, start=1):
+        try:
+            sources.append(Source.model_validate(entry))
+        except ValidationError as e:
+            raise InvalidManifest(f"Invalid source #{index} in manifest {path}: {e}") from None
+
+    logger.debug(f"Loaded {len(sources)} sources from {path}")
+    return sources
+
+def _parse_jsonl(text: str, path: Path) -> list[Any]:
+    entries = []
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            raise InvalidManifest(f"Invalid JSON on line {line_number} of manifest {path}: {e}") from e
+    return entries
+
+def _parse_yaml(text: str, path: Path) -> Any:
+    try:
+        import yaml
+    except ImportError:
+        raise InvalidManifest(
+            "Reading YAML manifests requires PyYAML. Install it with `pip install ytfetcher[yaml]` or use a .jsonl manifest."
+        ) from None
+
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        raise InvalidManifest(f"Invalid YAML in manifest {path}: {e}") from e
+
+def _unwrap(data: Any, path: Path) -> list[Any]:
+    if isinstance(data, dict) and "sources" in data:
+        data = data["sources"]
+    if not isinstance(data, list):
+        raise InvalidManifest(f"Manifest {path} must contain a list of sources or a 'sources' list.")
+    return data
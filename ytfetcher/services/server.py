@@ -0,0 +1,370 @@
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterable, Iterator
+from urllib.parse import parse_qs, unquote, urlsplit
+from pydantic import BaseModel
+from ytfetcher._transcript_fetcher import TranscriptFetcher
+from ytfetcher._youtube_dl import BaseYoutubeDLFetcher, ChannelFetcher, PlaylistFetcher, SearchFetcher
+from ytfetcher.cache import CacheBackend, build_transcript_cache_key, create_cache
+from ytfetcher.config.fetch_config import FetchOptions
+from ytfetcher.exceptions import (
+    ChannelNotFound,
+    ChannelTabUnavailable,
+    InvalidFilterExpression,
+    PlaylistIdNotFound,
+    YTFetcherError
+)
+from ytfetcher.filters import combine, where
+from ytfetcher.metrics import OPENMETRICS_CONTENT_TYPE, FetchMetrics
+from ytfetcher.models.channel import ChannelData, DLSnippet, FailedTranscript, VideoTranscript
+from ytfetcher.utils.helpers import dedupe_video_ids
+from ytfetcher.utils.singleflight import SingleFlight
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+TranscriptResult = VideoTranscript | FailedTranscript
+
+# Transcript fetchers kept per (languages, manually_created) request setting.
+_MAX_TRANSCRIPT_FETCHERS = 32
+
+class TranscriptService:
+    """
+    Long-lived, thread-safe fetch state shared by every request of a `ytfetcher serve` process.
+
+    Keeps the HTTP sessions (and their connection pools), one cache and one worker pool warm across
+    requests, and coalesces concurrent requests for the same transcript into a single fetch.
+
+    Args:
+        options (FetchOptions | None): Settings shared by all requests. `filters` are ignored;
+            filters are passed per request instead.
+        max_workers (int): Size of the worker pool used for transcript fetches. Defaults to
+            `options.max_concurrent_requests`.
+
+    Metrics are recorded in `options.metrics`, or in a new `FetchMetrics` registry, and served at `/metrics`.
+    """
+    def __init__(self, options: FetchOptions | None = None, max_workers: int | None = None):
+        self.options = options or FetchOptions()
+        self.max_workers = max_workers or self.options.max_concurrent_requests
+
+        self.cache: CacheBackend | None = create_cache(self.options)
+        self.metrics = self.options.metrics or FetchMetrics()
+        self._sessions = TranscriptFetcher.create_sessions(self.options.http_config, self.max_workers)
+        for session in self._sessions:
+            session.hooks["response"].append(self.metrics.record_response)
+        self._executor = futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ytfetcher-serve")
+        self._flights: SingleFlight[tuple[str, str], TranscriptResult] = SingleFlight()
+        self._fetchers: dict[tuple[tuple[str, ...] | None, bool], TranscriptFetcher] = {}
+        self._fetchers_lock = threading.Lock()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for session in self._sessions:
+            session.close()
+
+    def transcripts(
+        self,
+        video_ids: Iterable[str],
+        languages: list[str] | None = None,
+        manually_created: bool | None = None
+    ) -> Iterator[TranscriptResult]:
+        """
+        Fetches transcripts concurrently and yields each result as soon as it is available.
+
+        Args:
+            video_ids: Video IDs to fetch. Duplicates are fetched once.
+            languages: Language codes in priority order. Defaults to `options.languages`.
+            manually_created: Only fetch manually created transcripts. Defaults to `options.manually_created`.
+
+        Yields:
+            VideoTranscript | FailedTranscript: One result per unique video id, in completion order.
+        """
+        languages = languages or (list(self.options.languages) if self.options.languages else None)
+        manually_created = self.options.manually_created if manually_created is None else manually_created
+
+        if manually_created and not languages:
+            raise ValueError("You must provide a language when using manually_created.")
+
+        tasks = [
+            self._executor.submit(self._get_transcript, video_id, languages, manually_created)
+            for video_id in dedupe_video_ids(video_ids)
+        ]
+        try:
+            for task in futures.as_completed(tasks):
+                yield task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def listing(
+        self,
+        fetcher: BaseYoutubeDLFetcher,
+        filters: list[Callable[[DLSnippet], bool]] | None = None,
+        languages: list[str] | None = None,
+        manually_created: bool | None = None
+    ) -> Iterator[ChannelData | FailedTranscript]:
+        """
+        Lists a channel, playlist or search and returns an iterator over its videos with transcripts.
+
+        Listing happens before this method returns, so listing errors such as `ChannelNotFound`
+        are raised here rather than while iterating.
+
+        Returns:
+            Iterator[ChannelData | FailedTranscript]: `ChannelData` for every video with a transcript
+                and `FailedTranscript` for the others, in completion order.
+        """
+        if filters:
+            fetcher.push_down_filters(filters)
+        fetcher.attach_metrics(self.metrics)
+
+        listed = fetcher.fetch()
+        if filters:
+            # Not every fetcher pushes filters down, e.g. searches, so apply them to the listing too.
+            predicate = combine(filters)
+            listed = [snippet for snippet in listed if predicate(snippet)]
+        snippets = {snippet.video_id: snippet for snippet in listed}
+
+        def stream() -> Iterator[ChannelData | FailedTranscript]:
+            for result in self.transcripts(snippets, languages=languages, manually_created=manually_created):
+                if isinstance(result, FailedTranscript):
+                    yield result
+                    continue
+
+                yield ChannelData.model_construct(
+                    video_id=result.video_id,
+                    metadata=snippets[result.video_id],
+                    transcripts=result.transcripts,
+                    comments=[]
+                )
+
+        return stream()
+
+    def _get_transcript(self, video_id: str, languages: list[str] | None, manually_created: bool) -> TranscriptResult:
+        cache_key = build_transcript_cache_key(
+            languages=languages or ["__auto__"],
+            manually_created=manually_created,
+            normalizer=self.options.normalizer,
+        )
+        return self._flights.do(
+            (video_id, cache_key),
+            lambda: self._load_transcript(video_id, languages, manually_created, cache_key)
+        )
+
+    def _load_transcript(self, video_id: str, languages: list[str] | None, manually_created: bool, cache_key: str) -> TranscriptResult:
+        if self.cache:
+            successes, failures = self.cache.get_cached_states(video_ids=[video_id], cache_key=cache_key)
+            hit = bool(successes or failures)
+            self.metrics.record_cache_lookup(hits=int(hit), misses=int(not hit))
+            if hit:
+                return (successes or failures)[0]
+
+        result = self._transcript_fetcher(languages, manually_created).fetch_one(video_id)
+
+        if self.cache:
+            if isinstance(result, VideoTranscript):
+                self.cache.upsert_transcripts(transcripts=[result], cache_key=cache_key)
+                self.metrics.cache_writes.inc()
+            elif result.is_permanent_exception:
+                self.cache.upsert_failures(failures=[result], cache_key=cache_key)
+                self.metrics.cache_writes.inc()
+
+        return result
+
+    def _transcript_fetcher(self, languages: list[str] | None, manually_created: bool) -> TranscriptFetcher:
+        """
+        Returns the fetcher for a language setting, so its transcript API clients are reused
+        across requests. All fetchers share the service's sessions.
+        """
+        key = (tuple(languages) if languages else None, manually_created)
+        with self._fetchers_lock:
+            fetcher = self._fetchers.get(key)
+            if fetcher is None:
+                if len(self._fetchers) >= _MAX_TRANSCRIPT_FETCHERS:
+                    self._fetchers.pop(next(iter(self._fetchers)))
+                fetcher = self._fetchers[key] = TranscriptFetcher(
+                    video_ids=[],
+                    http_config=self.options.http_config,
+                    proxy_config=self.options.proxy_config,
+                    languages=languages,
+                    manually_created=manually_created,
+                    max_concurrent_requests=self.max_workers,
+                    normalizer=self.options.normalizer,
+                    strict_validation=self.options.strict_validation,
+                    compact_transcripts=self.options.compact_transcripts,
+                    session=self._sessions,
+                    metrics=self.metrics
+                )
+        return fetcher
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+        GET /health
+        GET /metrics
+        GET /transcripts?ids=ID1,ID2[&languages=en,de][&manually_created=1]
+        GET /channel/<handle>[?max_results=20][&tab=videos][&where=...]
+        GET /playlist/<playlist_id>[?max_results=20][&where=...]
+        GET /search?q=<query>[&max_results=20][&where=...]
+
+    Fetch routes stream JSON Lines (`application/x-ndjson`) as results complete.
+    """
+    protocol_version = "HTTP/1.1"
+    server: "TranscriptHTTPServer"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        parts = [unquote(part) for part in url.path.strip("/").split("/") if part]
+        self._streaming = False
+
+        try:
+            match parts:
+                case ["health"]:
+                    self._send_json(200, {"status": "ok"})
+                case ["metrics"]:
+                    self._send_text(200, OPENMETRICS_CONTENT_TYPE, self.server.service.metrics.render())
+                case ["transcripts"]:
+                    ids = [vid for value in params.get("ids", []) for vid in value.split(",") if vid]
+                    if not ids:
+                        raise ValueError("Query parameter 'ids' is required.")
+                    self._stream(self.server.service.transcripts(ids, **self._transcript_params(params)))
+                case ["channel", handle]:
+                    tab = self._param(params, "tab") or "videos"
+                    if tab not in ("videos", "shorts", "streams"):
+                        raise ValueError("tab must be one of 'videos', 'shorts' or 'streams'.")
+                    fetcher = ChannelFetcher(channel_handle=handle, max_results=self._max_results(params), tab=tab)  # type: ignore[arg-type]
+                    self._stream_listing(fetcher, params)
+                case ["playlist", playlist_id]:
+                    self._stream_listing(PlaylistFetcher(playlist_id=playlist_id, max_results=self._max_results(params)), params)
+                case ["search"]:
+                    query = self._param(params, "q")
+                    if not query:
+                        raise ValueError("Query parameter 'q' is required.")
+                    self._stream_listing(SearchFetcher(query=query, max_results=self._max_results(params) or 20), params)
+                case _:
+                    self._send_json(404, {"error": f"Unknown path: {url.path}"})
+        except (ValueError, InvalidFilterExpression) as e:
+            self._send_error(400, str(e))
+        except (ChannelNotFound, ChannelTabUnavailable, PlaylistIdNotFound) as e:
+            self._send_error(404, str(e))
+        except YTFetcherError as e:
+            self._send_error(502, str(e))
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client disconnected from %s", self.path)
+        except Exception:
+            logger.exception("Unexpected error while serving %s", self.path)
+            self._send_error(500, "Internal server error.")
+
+    def _stream_listing(self, fetcher: BaseYoutubeDLFetcher, params: dict[str, list[str]]) -> None:
+        expression = self._param(params, "where")
+        self._stream(self.server.service.listing(
+            fetcher,
+            filters=[where(expression)] if expression else None,
+            **self._transcript_params(params)
+        ))
+
+    def _transcript_params(self, params: dict[str, list[str]]) -> dict[str, Any]:
+        languages = self._param(params, "languages")
+        manually_created = self._param(params, "manually_created")
+        return {
+            "languages": [lang for lang in languages.split(",") if lang] if languages else None,
+            "manually_created": None if manually_created is None else manually_created.lower() in ("1", "true", "yes"),
+        }
+
+    @staticmethod
+    def _param(params: dict[str, list[str]], name: str) -> str | None:
+        values = params.get(name)
+        return values[-1] if values else None
+
+    def _max_results(self, params: dict[str, list[str]]) -> int | None:
+        value = self._param(params, "max_results")
+        if value is None:
+            return 20
+        if value == "all":
+            return None
+        if not value.isdigit() or int(value) < 1:
+            raise ValueError("max_results must be a positive integer or 'all'.")
+        return int(value)
+
+    def _send_error(self, status: int, message: str) -> None:
+        if not self._streaming:
+            self._send_json(status, {"error": message})
+            return
+
+        # The 200 status is already on the wire: end the stream with an error record and drop
+        # the connection so the client does not mistake the partial body for a complete one.
+        self.close_connection = True
+        try:
+            self._write_chunk(json.dumps({"error": message, "status": status}).encode("utf-8") + b"\n")
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Client disconnected from %s", self.path)
+
+    def _send_json(self, status: int, body: dict[str, Any]) -> None:
+        self._send_text(status, "application/json", json.dumps(body))
+
+    def _send_text(self, status: int, content_type: str, body: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, items: Iterator[BaseModel]) -> None:
+        # Pull the first item before sending headers so early errors still map to a status code.
+        first = next(items, None)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._streaming = True
+
+        if first is not None:
+            self._write_chunk(first.model_dump_json().encode("utf-8") + b"\n")
+            for item in items:
+                self._write_chunk(item.model_dump_json().encode("utf-8") + b"\n")
+
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+class TranscriptHTTPServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server exposing a `TranscriptService`. Each connection is handled in its own thread.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: TranscriptService):
+        super().__init__(address, _RequestHandler)
+        self.service = service
+
+def serve(host: str = "127.0.0.1", port: int = 8765, options: FetchOptions | None = None, max_workers: int | None = None) -> None:
+    """
+    Runs the ytfetcher HTTP service until interrupted.
+
+    Args:
+        host (str): Interface to bind. Defaults to localhost.
+        port (int): Port to bind. Defaults to 8765.
+        options (FetchOptions | None): Settings shared by all requests.
+        max_workers (int | None): Size of the transcript worker pool.
+    """
+    service = TranscriptService(options=options, max_workers=max_workers)
+    server = TranscriptHTTPServer((host, port), service)
+    logger.info("Serving ytfetcher on http://%s:%d", *server.server_address[:2])
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down ytfetcher server.")
+    finally:
+        server.server_close()
+        service.close()
@@ -0,0 +1,136 @@
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Any, Iterator
+import json
+import threading
+import time
+
+PHASES = ("listing", "cache_lookup", "fetch", "comments", "export")
+"""Phases timed by `YTFetcher` and the CLI, in the order they run."""
+
+@dataclass
+class RunStats:
+    """
+    Counters and per-phase wall times of one `YTFetcher` run.
+
+    A run is one call to a public fetch method such as `fetch_youtube_data()`. The stats of
+    the latest run are available as `YTFetcher.last_run_stats`. All methods are thread-safe,
+    so fetcher worker threads can update the same instance.
+    """
+    started_at: float = field(default_factory=time.time)
+    """Unix timestamp of the start of the run."""
+
+    wall_time: float = 0.0
+    """Seconds from the start of the run until `finish()` was last called."""
+
+    phases: dict[str, float] = field(default_factory=dict)
+    """Wall time in seconds per phase ('listing', 'cache_lookup', 'fetch', 'comments', 'export')."""
+
+    videos: int = 0
+    """Number of videos after listing, deduplication and filtering."""
+
+    transcripts: int = 0
+    """Number of transcripts returned, from cache or network."""
+
+    requests: int = 0
+    """HTTP requests made by the transcript fetcher."""
+
+    http_errors: int = 0
+    """Transcript fetcher responses with a 4xx or 5xx status."""
+
+    bytes_received: int = 0
+    """Decoded response body bytes received by the transcript fetcher."""
+
+    retries: int = 0
+    """Transcript fetch attempts repeated after a network error, including delayed per-video retries."""
+
+    recovered: int = 0
+    """Transcripts fetched by a delayed retry after a transient failure."""
+
+    ytdlp_extractions: int = 0
+    """yt-dlp extractions (listings, metadata and comment lookups) started."""
+
+    cache_hits: int = 0
+    """Videos answered from the cache, including known failures."""
+
+    cache_misses: int = 0
+    """Videos that had to be fetched."""
+
+    cache_writes: int = 0
+    """Results written to the cache."""
+
+    transcript_failures: dict[str, int] = field(default_factory=dict)
+    """Failed transcripts per reason, e.g. {'TranscriptsDisabled': 3}."""
+
+    ytdlp_failures: dict[str, int] = field(default_factory=dict)
+    """Failed yt-dlp lookups per exception type, e.g. {'VideoUnavailable': 1}."""
+
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    _start: float = field(default_factory=time.perf_counter, init=False, repr=False, compare=False)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Adds the wall time of the `with` block to phase `name`. Repeated phases accumulate.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """
+        Adds `amount` to an integer counter such as 'requests' or 'cache_hits'.
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def record_failure(self, reason: str, source: str = "transcript") -> None:
+        """
+        Counts one failure by reason.
+
+        Args:
+            reason: Failure reason or exception type name.
+            source: 'transcript' or 'ytdlp'.
+        """
+        failures = self.transcript_failures if source == "transcript" else self.ytdlp_failures
+        with self._lock:
+            failures[reason] = failures.get(reason, 0) + 1
+
+    def record_response(self, response: Any, *args, **kwargs) -> None:
+        """
+        `requests` response hook counting requests, error statuses and received bytes.
+        """
+        size = len(response.content or b"")
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += size
+            if response.status_code >= 400:
+                self.http_errors += 1
+
+    def finish(self) -> None:
+        """Sets `wall_time` to the time elapsed since the run started."""
+        self.wall_time = time.perf_counter() - self._start
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of looked up videos answered from the cache."""
+        looked_up = self.cache_hits + self.cache_misses
+        return self.cache_hits / looked_up if looked_up else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Returns the stats as a JSON-serializable dictionary."""
+        with self._lock:
+            data = {
+                f.name: dict(value) if isinstance(value := getattr(self, f.name), dict) else value
+                for f in fields(self)
+                if not f.name.startswith("_")
+            }
+        data["cache_hit_ratio"] = self.cache_hit_ratio
+        return data
+
+    def to_json(self, indent: int | None = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
@@ -1,7 +1,19 @@
-from .helpers import channel_data_to_rows
+from typing import TYPE_CHECKING, Any
 from .state import RuntimeConfig
 
+if TYPE_CHECKING:
+    from .helpers import channel_data_to_rows
+
 __all__ = [
     "channel_data_to_rows",
     "RuntimeConfig"
-]
\ No newline at end of file
+]
+
+def __getattr__(name: str) -> Any:
+    # Loaded on first access, see `ytfetcher/__init__.py`.
+    if name != "channel_data_to_rows":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from .helpers import channel_data_to_rows
+    globals()[name] = channel_data_to_rows
+    return channel_data_to_rows
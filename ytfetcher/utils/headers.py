@@ -1,4 +1,6 @@
-from fake_useragent import UserAgent
+from functools import lru_cache
+from typing import Any, Mapping
+import itertools
 import random
 
 ACCEPT_LANGUAGES = [
@@ -7,12 +9,8 @@ ACCEPT_LANGUAGES = [
     "fr-FR,fr;q=0.9"
 ]
 
-ACCEPT = [
-    "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-    "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8",
-    "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.9"
-]
+ACCEPT_CHROMIUM = "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7"
+ACCEPT_FIREFOX = "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"
 
 REFERERS = [
     "https://www.youtube.com/",
@@ -21,30 +19,116 @@ REFERERS = [
     "https://duckduckgo.com/"
 ]
 
-SEC_FETCH_DEST = ["document", "empty"]
-SEC_FETCH_MODE = ["navigate", "no-cors"]
-SEC_FETCH_SITE = ["none", "same-origin", "cross-site"]
+# Client hint brand of each Chromium-based browser; Firefox sends no client hints.
+CHROMIUM_BRANDS = {
+    "Chrome": "Google Chrome",
+    "Edge": "Microsoft Edge",
+    "Opera": "Opera",
+}
 
-def get_realistic_headers() -> dict:
+SUPPORTED_BROWSERS = (*CHROMIUM_BRANDS, "Firefox")
+
+@lru_cache(maxsize=1)
+def _load_browsers() -> tuple[Mapping[str, Any], ...]:
     """
-    Creates realistic headers for mimic browser behavior which reduces the changes of getting banned immediatly.\n
-    Uses `fake_useragent` package for creating random user agents.
-    """
-    ua = UserAgent(platforms='desktop', os='Windows')
-    user_agent = ua.random
-    return {
-        "User-Agent": user_agent,
-        "Accept": random.choice(ACCEPT),
-        "Accept-Language": random.choice(ACCEPT_LANGUAGES),
-        "Referer": random.choice(REFERERS),
+    Loads the desktop Windows browsers from the `fake_useragent` data file, once per process.
+    """
+    from fake_useragent import UserAgent  # Loads its browser database; only needed once a fetch starts.
+
+    data = UserAgent(platforms='desktop', os='Windows').data_browsers
+    browsers = tuple(b for b in data if b["type"] == "desktop" and b["os"] == "Windows" and b["browser"] in SUPPORTED_BROWSERS)
+    return browsers or tuple(b for b in data if b["type"] == "desktop")
+
+def build_header_profile(browser: Mapping[str, Any], rng: random.Random | None = None) -> dict[str, str]:
+    """
+    Builds a coherent header set for one `fake_useragent` browser entry.
+
+    Client hints match the browser brand and version (and are omitted for Firefox), and the
+    fetch metadata describes a top-level navigation coming from the chosen referer.
+
+    Args:
+        browser: Browser entry with 'useragent', 'browser' and 'browser_version' keys.
+        rng: Random source for the language and referer. Defaults to a new `random.Random()`.
+    """
+    rng = rng or random.Random()
+    referer = rng.choice(REFERERS)
+    name = browser["browser"]
+
+    headers = {
+        "User-Agent": browser["useragent"],
+        "Accept": ACCEPT_FIREFOX if name == "Firefox" else ACCEPT_CHROMIUM,
+        "Accept-Language": rng.choice(ACCEPT_LANGUAGES),
+        "Referer": referer,
         "Connection": "keep-alive",
         "DNT": "1",
         "Upgrade-Insecure-Requests": "1",
         "Accept-Encoding": "gzip, deflate",
 
-        "Sec-Fetch-Dest": random.choice(SEC_FETCH_DEST),
-        "Sec-Fetch-Mode": random.choice(SEC_FETCH_MODE),
-        "Sec-Fetch-Site": random.choice(SEC_FETCH_SITE),
-        "Sec-CH-UA-Platform": "\"Windows\"",
-        "Sec-CH-UA": f"\"{random.choice(['Chromium', 'Google Chrome', 'Not.A/Brand'])}\";v=\"{random.randint(100, 135)}\"",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "same-origin" if referer.startswith("https://www.youtube.com") else "cross-site",
+        "Sec-Fetch-User": "?1",
     }
+
+    brand = CHROMIUM_BRANDS.get(name)
+    if brand is not None:
+        major = str(browser["browser_version"]).split(".")[0]
+        headers["Sec-CH-UA"] = f"\"{brand}\";v=\"{major}\", \"Chromium\";v=\"{major}\", \"Not.A/Brand\";v=\"99\""
+        headers["Sec-CH-UA-Mobile"] = "?0"
+        headers["Sec-CH-UA-Platform"] = "\"Windows\""
+
+    return headers
+
+class HeaderProfilePool:
+    """
+    Precomputed pool of coherent browser header sets.
+
+    The user agent data is loaded once per process and `size` profiles are built up front,
+    weighted by browser market share, so handing out headers costs a dict copy. Use `next()`
+    to give each session its own identity in turn, or `random()` to rotate per request.
+    All methods are thread-safe and return copies.
+
+    Example:
+        pool = HeaderProfilePool(size=8)
+        configs = [HTTPConfig(headers=pool.next()) for _ in range(4)]
+    """
+    def __init__(self, size: int = 32, seed: int | None = None):
+        """
+        Initialize the pool.
+
+        Args:
+            size (int): Number of profiles to precompute. Defaults to 32.
+            seed (int | None): Seed for reproducible profiles. Defaults to None.
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1.")
+
+        self._rng = random.Random(seed)
+        browsers = _load_browsers()
+        chosen = self._rng.choices(browsers, weights=[b.get("percent") or 1e-6 for b in browsers], k=size)
+        self.profiles: tuple[dict[str, str], ...] = tuple(build_header_profile(b, self._rng) for b in chosen)
+        """The precomputed header sets. Do not modify them; use the copies returned by `next()` and `random()`."""
+        self._cycle = itertools.cycle(range(size))
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def next(self) -> dict[str, str]:
+        """Returns the next profile in round-robin order."""
+        return dict(self.profiles[next(self._cycle)])
+
+    def random(self) -> dict[str, str]:
+        """Returns a random profile."""
+        return dict(self._rng.choice(self.profiles))
+
+@lru_cache(maxsize=1)
+def default_header_pool() -> HeaderProfilePool:
+    """Returns the process-wide pool used by `get_realistic_headers()`."""
+    return HeaderProfilePool()
+
+def get_realistic_headers() -> dict:
+    """
+    Creates realistic headers for mimic browser behavior which reduces the changes of getting banned immediatly.\n
+    Uses `fake_useragent` data, loaded once per process, and returns a random profile from `default_header_pool()`.
+    """
+    return default_header_pool().random()
@@ -1,5 +1,6 @@
-from typing import Any, cast
+from typing import Any, Iterable, cast
 from ytfetcher.models.channel import ChannelData, VideoComments, VideoTranscript, DLSnippet
+from ytfetcher.models.compact import CompactTranscript
 from ytfetcher.models.types import FetchResult
 
 def channel_data_to_rows(
@@ -24,7 +25,9 @@ def channel_data_to_rows(
     rows: list[dict[str, Any]] = []
     for item in normalized:
         transcript_text = ""
-        if item.transcripts:
+        if isinstance(item.transcripts, CompactTranscript):
+            transcript_text = item.transcripts.joined_text(join_separator)
+        elif item.transcripts:
             transcript_text = join_separator.join(segment.text for segment in item.transcripts)
 
         row: dict[str, Any] = {
@@ -69,4 +72,16 @@ def normalize_for_export(data: FetchResult) -> list[ChannelData]:
         snippets_data = cast(list[DLSnippet], data)
         return [ChannelData(video_id=d.video_id, metadata=d, transcripts=[], comments=[]) for d in snippets_data]
 
-    raise TypeError(f"Unsupported data type for export: {type(first)}")
\ No newline at end of file
+    raise TypeError(f"Unsupported data type for export: {type(first)}")
+
+def dedupe_video_ids(video_ids: Iterable[str]) -> list[str]:
+    """
+    Removes duplicate video IDs while keeping the order in which they were first seen.
+
+    Args:
+        video_ids: Video IDs, possibly with duplicates.
+
+    Returns:
+        list[str]: Each video ID once, in first-seen order.
+    """
+    return list(dict.fromkeys(video_ids))
@@ -0,0 +1,74 @@
+from typing import Callable, Generic, Hashable, TypeVar
+import threading
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+class _Call(Generic[V]):
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: V | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesces concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is in flight
+    wait for it and receive the same result (or exception). Nothing is cached: once the
+    call finishes, the next caller for that key starts a new one.
+
+    Example:
+        flights: SingleFlight[str, VideoTranscript] = SingleFlight()
+        transcript = flights.do(video_id, lambda: fetcher.fetch_one(video_id))
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[K, _Call[V]] = {}
+        self.coalesced = 0
+        """Number of calls that were served by another caller's in-flight execution."""
+
+    def do(self, key: K, fn: Callable[[], V]) -> V:
+        """
+        Runs `fn` unless a call for `key` is already in flight, in which case its result is shared.
+
+        Args:
+            key: Identifies equivalent calls, e.g. a video id and the options that affect the result.
+            fn: Function producing the result.
+
+        Returns:
+            The result of `fn` from whichever caller executed it.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Returns the number of keys currently being executed."""
+        with self._lock:
+            return len(self._calls)